@@ -42,6 +42,7 @@ metadata of that field such as:
 - maximum value, length string or number of cells
 - custom validation functions (raising exceptions)
 - custom auto-field-creation functions
+- explicit dependencies of the custom functions (`depends_on`)
 - help text for the field (to support CLI mode help info)
 - short flag (single char names to support options in CLI mode)
 
@@ -162,6 +163,7 @@ print("seconds:", cfg.in_seconds, "  (computed)")
 from importlib.metadata import version, PackageNotFoundError
 from .configlib import Config
 from .core.types import Schema, with_field_name
+from .core.domainfile import DomainFile
 from .help import manual
 
 
@@ -180,7 +182,7 @@ def changelog() -> str:
     return (files(__package__) / "CHANGELOG.md").read_text(encoding="utf-8")
 
 
-__all__ = ["Config", "Schema", "with_field_name", "manual", "changelog"]
+__all__ = ["Config", "Schema", "with_field_name", "DomainFile", "manual", "changelog"]
 
 
 # === END ===
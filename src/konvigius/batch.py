@@ -0,0 +1,157 @@
+# src/konvigius/batch.py
+"""
+Validates many records of field values against one schema.
+
+`Config.validate_many()` compiles the schema once into a prototype config object and
+streams the records through the validation steps of a commit, without creating a
+config object per record. Each record is validated against the schema defaults: the
+fields not in the record keep their default value.
+
+The records are processed in chunks. Within a chunk the type, range and domain checks
+of the numeric (int or float) fields are done column-wise with NumPy, when NumPy is
+installed. Only the values these vectorised checks can not accept are checked again
+one by one, which also produces the exact error messages. Without NumPy all values
+are checked one by one.
+
+Classes:
+    ValidationResult: The outcome of the validation of one record.
+
+Functions:
+    validate_records: Validates the records against a prototype config object.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .exceptions import ConfigError, ConfigInvalidFieldError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .configlib import Config, Option
+
+_NUMPY_DTYPES = {int: "int64", float: "float64"}
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """The outcome of the validation of one record.
+
+    Attributes:
+        index (int): The position of the record in the input.
+        errors (dict[str, ConfigError]): The validation errors keyed by field name;
+            errors of custom validators and computed functions are keyed by the
+            name of their option.
+    """
+
+    index: int
+    errors: dict[str, ConfigError] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if the record passed all validations."""
+        return not self.errors
+
+
+def validate_records(
+    cfg: Config, records: Iterable[dict[str, Any]], chunk_size: int = 1024
+) -> Iterator[ValidationResult]:
+    """Validate the records against the schema of a (prototype) config object.
+
+    The config object itself is not changed.
+
+    Args:
+        cfg (Config): The config object holding the compiled schema and defaults.
+        records (Iterable[dict[str, Any]]): The field values per record.
+        chunk_size (int): The number of records checked column-wise at once.
+
+    Yields:
+        ValidationResult: The result per record, in input order.
+    """
+    from .configlib import _is_unchanged, _MISSING
+
+    metadata = cfg._metadata
+    defaults = cfg._values
+    columns = _numeric_columns(cfg) if np is not None else {}
+    records = iter(records)
+    index = 0
+
+    while chunk := list(islice(records, max(chunk_size, 1))):
+        checked = _prescreen(chunk, columns)
+        for record, passed in zip(chunk, checked):
+            errors: dict[str, ConfigError] = {}
+            changed = {}
+            for name, value in record.items():
+                if name not in metadata:
+                    errors[name] = ConfigInvalidFieldError(
+                        f"Invalid config field: '{name}'.", name
+                    )
+                elif not _is_unchanged(defaults.get(name, _MISSING), value):
+                    changed[name] = value
+            if changed:
+                cfg._validate_changes(changed, checked=passed, errors=errors)
+            yield ValidationResult(index, errors)
+            index += 1
+
+
+def _numeric_columns(cfg: Config) -> dict[str, Option]:
+    """Return the options whose core checks can be done column-wise.
+
+    These are the options with a single `field_type` of int or float.
+    """
+    return {
+        name: option
+        for name, option in cfg._metadata.items()
+        if option.do_validate
+        and option._compiled_check() is not None
+        and option.field_type in (int, float, (int,), (float,))
+    }
+
+
+def _prescreen(chunk: list[dict[str, Any]], columns: dict[str, Option]) -> list[set]:
+    """Check the numeric columns of a chunk of records with NumPy.
+
+    Returns per record the names of the fields whose values passed the type, range
+    and domain checks. Values of another type than the field type (e.g. bool for
+    int), or values outside the NumPy number range, are not checked here.
+    """
+    passed: list[set] = [set() for _ in chunk]
+    for name, option in columns.items():
+        ftype = option.field_type
+        ftype = ftype[0] if isinstance(ftype, tuple) else ftype
+        rows = [
+            i for i, record in enumerate(chunk) if type(record.get(name)) is ftype
+        ]
+        if not rows:
+            continue
+        try:
+            values = np.fromiter(
+                (chunk[i][name] for i in rows), _NUMPY_DTYPES[ftype], len(rows)
+            )
+        except (OverflowError, ValueError):
+            continue  # leave the column to the scalar checks
+
+        ok = np.ones(len(rows), dtype=bool)
+        if option.r_min is not None:
+            ok &= values >= option.r_min
+        if option.r_max is not None:
+            ok &= values <= option.r_max
+        if option.domain_file is not None:
+            continue  # leave the searches in the file to the scalar checks
+        domain = option.domain
+        if domain:
+            if not all(type(d) in (int, float) for d in domain):
+                continue
+            ok &= (values == 0) | np.isin(values, list(domain))
+
+        for i in np.flatnonzero(ok):
+            passed[rows[i]].add(name)
+    return passed
+
+
+# === END ===
@@ -93,12 +93,46 @@ def _stringify_cli_args(cli_args: list[Any] | None) -> list[str] | None:
     return None
 
 
+def parse_args(
+    cfg: Config, parser_args: list[dict] | None = None, cli_args=None
+) -> tuple[argparse.ArgumentParser, argparse.Namespace, dict[str, Any]]:
+    """
+    Parses CLI arguments for the given config instance, without changing it.
+
+    Args:
+        config (Config): The config object that defines the CLI arguments.
+        parser_args (list[dict], optional): The argument definitions; created from
+            the config if not given.
+        cli_args (list[str], optional): CLI arguments. If None, defaults to sys.argv[1:].
+
+    Returns:
+        tuple: The parser, the parsed arguments, and the values of the options given
+            on the command line keyed by field name.
+    """
+    cli_args = _stringify_cli_args(cli_args)
+
+    if not parser_args:
+        parser_args = create_args_from_cfg(cfg)
+
+    parser = build_parser(parser_args)
+    parsed_args = parser.parse_args(args=cli_args)
+    # inspect_actions(parser)
+    selected_values = {
+        name.replace("-", "_"): value
+        for name, value in vars(parsed_args).items()
+        if value is not None
+    }
+    return parser, parsed_args, selected_values
+
+
 def run_parser(
     cfg: Config, parser_args: list[dict] | None = None, cli_args=None
 ) -> tuple[argparse.ArgumentParser, argparse.Namespace]:
     """
     Parses CLI arguments and updates the given config instance with parsed values.
 
+    All values are set in one transaction, so they are validated by a single commit.
+
     Args:
         config (Config): The config object to update with CLI arguments.
         args (list[str], optional): CLI arguments. If None, defaults to sys.argv[1:].
@@ -109,24 +143,14 @@ def run_parser(
     Raises:
         Any validation exceptions triggered by invalid CLI values.
     """
-    cli_args = _stringify_cli_args(cli_args)
-
-    if not parser_args:
-        parser_args = create_args_from_cfg(cfg)
-
-    parser = build_parser(parser_args)
-    parsed_args = parser.parse_args(args=cli_args)
-    # inspect_actions(parser)
-    selected_values = vars(parsed_args)
+    parser, parsed_args, selected_values = parse_args(cfg, parser_args, cli_args)
 
     # copy choosen CLI value(s) to config
-    for name, value in selected_values.items():
-        if value is not None:
+    with cfg.transaction():
+        for name, value in selected_values.items():
             # print('writing to cfg: name=', name, 'value=', value)
             try:
-                setattr(
-                    cfg, name.replace("-", "_"), value
-                )  # triggers validation via descriptor
+                setattr(cfg, name, value)  # validated by the commit
             except AttributeError:
                 pass  # pragma: no coverage
 
@@ -53,11 +53,33 @@ In this example:
    outside this domain raises a `ConfigDomainError`.
 """
 from __future__ import annotations  # prefends 'config' lint errors
+import heapq
 import json
+import os
+from contextlib import contextmanager
+from collections import ChainMap
+from threading import Lock
 from types import SimpleNamespace
-from typing import Any, Callable, Type, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    IO,
+    Callable,
+    Container,
+    Iterable,
+    Iterator,
+    Mapping,
+    Type,
+    Tuple,
+    Union,
+)
 
-from .exceptions import ConfigError, ConfigMetadataError, ConfigInvalidFieldError
+from .exceptions import (
+    ConfigConflictError,
+    ConfigError,
+    ConfigMetadataError,
+    ConfigInvalidFieldError,
+)
 
 from .validators import (
     RequiredValidator,
@@ -66,9 +88,24 @@ from .validators import (
     DomainValidator,
     CustomValidator,
     ComputedValidator,
+    compile_plan,
 )
 
 from .core.types import ComputedFn, Schema
+from .core.base import Validator
+from .core.cache import DiskCache, SchemaCache, freeze, schema_fingerprint
+from .core.graph import DependencyGraph
+from .core.changes import ChangeCallback, ChangeSet, ErrorHandler, SubscriberIndex
+from .core.history import History
+from .core.state import ConfigState, TransactionState
+from .core.store import SlotStore
+from .core.view import ConfigView
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .batch import ValidationResult
+    from .core.domainfile import DomainFile
+    from .sources import Source
+    from .watch import ConfigWatcher
 
 # -----------------------------------------------------------------------------
 # 1. Define the Option metadata class
@@ -113,6 +150,9 @@ class Option:
             A tuple defining the valid set of values for the option.
             Example: `('admin', 'guest', 'tester')`.
 
+        domain_file (str | PathLike | DomainFile | None):
+            A sorted file of valid values, searched instead of loaded.
+
         r_min (int | None):
             The minimum value or length allowed for numeric, string, or other
             sizeable collections.
@@ -156,8 +196,40 @@ class Option:
         `Config` object.
 
         If `do_validate` is `False`, all these validation steps are skipped.
+
+    Memory:
+        Options use `__slots__`, and only the compiled check function of the core
+        validators is kept; options with identical constraints share it (see
+        `compile_plan()`). The help line is formatted when it is first used.
     """
 
+    # the public attributes, in the order shown by repr() and str()
+    _PUBLIC = (
+        "default_value",
+        "name",
+        "short_flag",
+        "field_type",
+        "required",
+        "r_min",
+        "r_max",
+        "domain",
+        "fn_validator",
+        "fn_computed",
+        "do_validate",
+        "help_add_default",
+        "help_text",
+    )
+
+    __slots__ = _PUBLIC[:-1] + (
+        "domain_file",
+        "_help_text",
+        "_help_source",
+        "_depends_on",
+        "_check",
+        "_custom_validator",
+        "_comp_validator",
+    )
+
     def __init__(self, entry: Schema, help_map: dict[str, str] | None = None):
         """Instantiate an Option object from a Schema definition.
 
@@ -186,18 +258,35 @@ class Option:
         self.r_min: int | None = entry.r_min
         self.r_max: int | None = entry.r_max
         self.domain: tuple[Any, ...] | None = entry.domain
+        self.domain_file: str | os.PathLike | DomainFile | None = entry.domain_file
         self.fn_validator: Callable | tuple[Callable, ...] | None = entry.fn_validator
         self.fn_computed: ComputedFn | tuple[ComputedFn, ...] | None = entry.fn_computed
         self.do_validate: bool = not entry.no_validate
+        self._depends_on: tuple[str, ...] = Option.parse_depends_on(entry.depends_on)
         self.help_add_default: bool = entry.help_add_default
-        self.help_text: str | None = self._setup_helpline(
-            self.name,
-            entry.help_text,
-            help_map,
-            self.help_add_default,
+        # the help line is formatted on first use, see the `help_text` property
+        self._help_text: str | None = None
+        self._help_source: tuple | None = (
+            help_map.get(self.name, entry.help_text) if help_map else entry.help_text,
             self.default_value,
         )
 
+    @property
+    def help_text(self) -> str:
+        """The help line of the option, formatted on first use."""
+        if self._help_source is not None:
+            help_text, default = self._help_source
+            self._help_text = self._setup_helpline(
+                self.name, help_text, None, self.help_add_default, default
+            )
+            self._help_source = None
+        return self._help_text
+
+    @help_text.setter
+    def help_text(self, value: str | None):
+        self._help_text = value
+        self._help_source = None
+
     # TODO: test on valid python identifier with builtin
     @staticmethod
     def parse_entryname(ename: str, short_flag: str | None):
@@ -291,7 +380,7 @@ class Option:
 
     # At Option level the validation can be switched on/off (a Schema option)
 
-    def init_validators(self):
+    def init_validators(self, defer_plan: bool = False):
         """Initialize the validator subclasses.
 
         Creates a set of validator objects based on the properties defined in the
@@ -313,37 +402,124 @@ class Option:
 
         These validators are only created if validation is enabled at the
         `Option` level (`do_validate=True`).
+
+        Finally the core validators are compiled into a single check function, the
+        validation plan of the option (see `compile_plan()`). Checks that can never
+        fail, e.g. a range check without `r_min` and `r_max`, are left out.
+
+        Args:
+            defer_plan (bool): Create and compile the core validators when the
+                first value is validated, not now. Used for schemas restored from
+                the on-disk cache, whose metadata was validated before.
         """
-        self._validators = []
+        self._check = None
         if self.do_validate:  # at Option level validation can be switched on/off
-            self._validators.append(TypeValidator(self))
-            self._validators.append(RequiredValidator(self))
-            self._validators.append(DomainValidator(self))
-            self._validators.append(RangeValidator(self))
+            self._check = _DEFERRED if defer_plan else self._compile_check()
             # custom and computes validators:
             self._custom_validator = CustomValidator(self)
             self._comp_validator = ComputedValidator(self)
 
-    def validate_default(self, value: Any, cfg: Config):
+    def _compile_check(self) -> Callable[[Any], None] | None:
+        """Create the core validators and compile their validation plan."""
+        validators = self._create_validators()
+        domain_file = self.domain_file
+        if domain_file is not None:  # key on the mapped version of the file
+            domain_file = next(
+                v.domain for v in validators if isinstance(v, DomainValidator)
+            )
+        constraints = (
+            self.field_type,
+            self.required,
+            self.domain,
+            domain_file,
+            self.r_min,
+            self.r_max,
+        )
+        self._check = compile_plan(validators, key=freeze(constraints))
+        return self._check
+
+    def _compiled_check(self) -> Callable[[Any], None] | None:
+        """Return the validation plan, compiling it first if it was deferred."""
+        check = self._check
+        return self._compile_check() if check is _DEFERRED else check
+
+    def _create_validators(self) -> list[Validator]:
+        """Create the core validators of the option; called by `init_validators()`.
+
+        The validators themselves are not kept; after `init_validators()` only
+        their compiled check function is. Creating them runs the metadata checks
+        of the validators, which may normalize option attributes.
+        """
+        if not self.do_validate:
+            return []
+        return [
+            TypeValidator(self),
+            RequiredValidator(self),
+            DomainValidator(self),
+            RangeValidator(self),
+        ]
+
+    @property
+    def has_functions(self) -> bool:
+        """Return True if the option runs custom validators or computed functions.
+
+        These functions receive the config namespace and may read other fields;
+        such options are the nodes of the dependency graph of a Config object.
+        """
+        return self.do_validate and bool(
+            self._custom_validator.fn_validators or self._comp_validator.fn_callbacks
+        )
+
+    @staticmethod
+    def parse_depends_on(depends_on: str | tuple[str, ...] | None) -> tuple[str, ...]:
+        """Return the explicit dependencies of an option as a tuple of field names.
+
+        Hyphens in the names are replaced with underscores, like option names.
+
+        Args:
+            depends_on (str | tuple[str, ...] | None):
+                A field name or a tuple of field names.
+
+        Returns:
+            tuple[str, ...]: The normalized field names.
+
+        Raises:
+            ConfigMetadataError:
+                If `depends_on` is not a string or a tuple of strings.
+        """
+        if depends_on is None:
+            return ()
+        names = (depends_on,) if isinstance(depends_on, str) else depends_on
+        if not isinstance(names, tuple) or not all(isinstance(n, str) for n in names):
+            raise ConfigMetadataError(
+                "'depends_on' must be a field name or a tuple of field names; "
+                f"got {depends_on!r}"
+            )
+        return tuple(n.strip("-").replace("-", "_") for n in names)
+
+    def validate_default(self, value: Any, cfg: ConfigView):
         """Validate the option value using the standard validators.
 
-        Executes all core validators defined in `_validators` for this option,
-        ensuring that the value meets the type, domain, range, and required-field
-        constraints.
+        Executes the compiled validation plan of the core validators defined in
+        `_create_validators()` for this option, ensuring that the value meets the type,
+        domain, range, and required-field constraints.
 
         Validation runs only if `do_validate` is enabled.
 
         Args:
             value (Any):
                 The value to validate.
-            cfg (Config):
-                The configuration object providing context for validation.
+            cfg (ConfigView):
+                The read-only view on the config values providing context for
+                validation.
         """
-        if self.do_validate:
-            for validator in self._validators:
-                validator(value, cfg=cfg.copy_config(dirty=True))
+        check = self._check
+        if check is _DEFERRED:
+            check = self._compile_check()
+        if check is not None:  # None if do_validate is off or nothing to check
+            check(value)
 
-    def validate_custom(self, value: Any, cfg: Config):
+    def validate_custom(self, value: Any, cfg: ConfigView):
         """Validate the option value using custom validation functions.
 
         Invokes user-defined validator functions associated with this option.
@@ -352,33 +528,34 @@ class Option:
         Args:
             value (Any):
                 The value to validate.
-            cfg (Config):
-                The configuration object providing context for validation.
+            cfg (ConfigView):
+                The read-only view on the config values providing context for
+                validation.
         """
         if self.do_validate:  # at Option level validation can be switched on/off
-            self._custom_validator(value, cfg=cfg.copy_config(dirty=True))
+            self._custom_validator(value, cfg=cfg)
 
-    def validate_computed(self, value: Any, cfg: Config):
+    def validate_computed(self, value: Any, cfg: ConfigView) -> dict[str, Any]:
         """Validate and compute auto-generated (derived) configuration fields.
 
         Executes all functions defined in `fn_computed`, allowing computed fields
         to be dynamically generated based on other configuration values. The
-        computed results are stored in `cfg._computed_values`.
+        caller stores the computed results in `cfg._computed_values`.
 
         Computation runs only if `do_validate` is enabled.
 
         Args:
             value (Any):
                 The current option value used as input for computation.
-            cfg (Config):
-                The configuration object providing context and storage for results.
+            cfg (ConfigView):
+                The read-only view on the config values providing context.
+
+        Returns:
+            dict[str, Any]: The computed values keyed by computed field name.
         """
         if self.do_validate:  # at Option level validation can be switched on/off
-            values_computed = self._comp_validator(
-                value, cfg=cfg.copy_config(dirty=True)
-            )
-            for fname, value in values_computed.items():
-                cfg._computed_values[fname] = value
+            return self._comp_validator(value, cfg=cfg)
+        return {}
 
     def __repr__(self):
         """Return a string representation that can recreate the object.
@@ -387,11 +564,7 @@ class Option:
             str: A string that represents the constructor call needed
             to recreate this Option instance.
         """
-        args = [
-            f"{name}={value!r}"
-            for name, value in vars(self).items()
-            if not name.startswith("_") and name not in ("fn_validators", "fn_computes")
-        ]
+        args = [f"{name}={getattr(self, name)!r}" for name in self._PUBLIC]
         args = ", ".join(args)
         return f"Option({args})"
 
@@ -406,11 +579,7 @@ class Option:
         """
         header = "<Option values>"
         # body = [f"  {name}: {getattr(self, name)!r}" for name, alue in vars(self)]
-        body = [
-            f"  - {name}: {value!r}"
-            for name, value in vars(self).items()
-            if not name.startswith("_")
-        ]
+        body = [f"  - {name}: {getattr(self, name)!r}" for name in self._PUBLIC]
         lines = [header] + body
         return "\n".join(lines)
 
@@ -441,6 +610,7 @@ class ConfigField:
                              (default, type, constraints, etc.)
         """
         self.option = option
+        self.name = option.name
 
     def __get__(self, cfg, owner):
         """Retrieves the value of the config field for the given instance (cfg).
@@ -457,9 +627,12 @@ class ConfigField:
         """
         if cfg is None:  # pragma: no coverage
             return self  # Accessed from class
-        return cfg._pending_values.get(self.option.name, cfg._values[self.option.name])
-
-        # return cfg._values.get(self.name, self.option.default_value)
+        name = self.name
+        if cfg._open_tx:  # only then can the current thread have pending values
+            pending = cfg._tx.pending
+            if name in pending:
+                return pending[name]
+        return cfg._state.values[name]
 
     def __set__(self, cfg, value):
         """Validates and sets the value of the config field on the given instance (cfg).
@@ -477,13 +650,41 @@ class ConfigField:
         # print("* Config_Field:", self.option.name, " old", cfg._values[self.option.name], " new:", value, " _trx_", cfg._trx_)
         if cfg._trx_:
             # transaction mode, put all in temporary pending datastore
-            cfg._pending_values[self.option.name] = value
+            cfg._tx.set(self.option.name, value)
         else:
             cfg.start_transaction()
-            cfg._pending_values[self.option.name] = value
+            cfg._tx.set(self.option.name, value)
             cfg.commit_transaction(suppress_error_prefix=True)
 
 
+class SlotConfigField(ConfigField):
+    """Descriptor of a config field whose values are kept in a `SlotStore`.
+
+    Used for classes created with `config_factory(schema, slots=True)`. The value
+    is read from the store by the fixed slot index of the field.
+    """
+
+    def __init__(self, option: Option, index: int):
+        """Initializes the descriptor with the associated Option and slot index.
+
+        Args:
+            option (Option): Metadata describing the field.
+            index (int): The slot index of the field in the value store.
+        """
+        super().__init__(option)
+        self.index = index
+
+    def __get__(self, cfg, owner):
+        """Retrieves the value of the config field by its slot index."""
+        if cfg is None:  # pragma: no coverage
+            return self  # Accessed from class
+        if cfg._open_tx:  # only then can the current thread have pending values
+            pending = cfg._tx.pending
+            if self.name in pending:
+                return pending[self.name]
+        return cfg._state.values._slots[self.index]
+
+
 # -----------------------------------------------------------------------------
 # 3. Config class that manages instance state and metadata
 # -----------------------------------------------------------------------------
@@ -496,76 +697,284 @@ class Config:
     created by `Config.config_factory()` or `Config.from_dict()`.
 
     Each instance manages:
-    - `_values`: The actual runtime values for each config field.
+    - `_state`: The committed state, a `ConfigState` with the version number,
+                the values of the config fields (`_values`), the computed values
+                (`_computed_values`) and the dependency graph (`_graph`).
+    - `_tx`: The open transaction of the current thread, with the pending values
+             (`_pending_values`).
+    - `_open_tx`: The number of threads with an open transaction; while it is 0,
+                  a field is read from `_state` without looking at `_tx`.
     - `_metadata`: A dictionary of Option objects keyed by field name,
                    used for validation, default handling, and introspection.
+    - `_subscribers`: The change callbacks per field, see `subscribe()`.
+    - `_history`: The undo/redo history, see `enable_history()`.
+
+    Versions:
+        Every commit that changes a value publishes a new, immutable `ConfigState`
+        with the next version number (see `get_version()`) by swapping a single
+        reference. Readers always see one complete version, also while another
+        thread commits. A commit is validated against the version it replaces;
+        with `commit_transaction(expected_version=...)` it fails with a
+        `ConfigConflictError` if another commit came first.
+
+    Schema cache:
+        `config_factory()` caches the compiled schema: the class, the Option
+        objects and the validated default values. A repeated call with an equal
+        schema only creates a new instance of the cached class. See
+        `konvigius.core.cache`; the cache is emptied with `clear_schema_cache()`.
+
+    Thread safety:
+        The Option objects and their validators are shared, read-only, by the
+        instances of a class; all state of a validation lives in the arguments of
+        the call. Commits on separate instances can therefore run concurrently in
+        different threads, also when the user functions are slow. Transactions
+        are owned by the thread that starts them, so several threads can also
+        commit to the same instance; see "Versions" above.
     """
 
+    __slots__ = (
+        "_state",
+        "_tx",
+        "_open_tx",
+        "_lock",
+        "_metadata",
+        "_subscribers",
+        "_history",
+        "__weakref__",
+    )
+
     def __init__(self):
         """Initializes internal state for a Config instance.
 
-        - `_values` holds actual values set by the user or defaults.
+        - `_state` holds the committed values set by the user or defaults.
+        - `_tx` holds the transaction of each thread.
         - `_metadata` holds the schema (Option) for each config field.
 
         Normally this constructor is called indirectly via `config_factory()`.
         """
-        self._values = {}  # current values per instance
-        self._pending_values = {}  # mutated values per instance
-        self._computed_values = {}  # derived values per instance
+        self._state = ConfigState(0, {}, {}, _NO_GRAPH, {})  # committed state
         self._metadata = {}  # Option objects per field
-        self._trx_: bool = False  # transaction mode
+        self._history = None  # undo/redo history, see enable_history()
+        self._init_local()
 
-    def _create_inverted_bool_properties(self):
-        """Auto generate inverted version of boolean fields.
+    def _init_local(self):
+        """Initialize the state that belongs to this instance only.
 
-        Lazy operation.
+        The transactions, the lock and the subscriptions are never copied or
+        pickled; see `__getstate__()`.
         """
+        self._tx = TransactionState()  # pending values per thread
+        self._open_tx = 0  # threads with an open transaction, see _trx_
+        self._lock = Lock()  # guards the swap of _state, see _publish()
+        self._subscribers = None  # change callbacks per field, see subscribe()
 
-        # inner-helper function returning a closure:
-        def fn_return_inverted(
-            source_field: str, field_name: str
-        ) -> Callable[[str, SimpleNamespace], bool]:
-            """TODO:"""
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to copy or pickle: the committed state and the history.
 
-            def fn_return_bool(value: str, cfg: SimpleNamespace) -> bool:
-                # print("return inverted-bool", value, "--" , source_field)
-                # value = cfg._values[source_field]
-                return not value
+        Used by `copy.deepcopy()` and `pickle`. Open transactions and the
+        subscriptions are not part of it, and the Option objects are shared with
+        the prototype of the class (see `clone()`).
+        """
+        state = {"_state": self._state, "_history": self._history}
+        if type(self)._prototype is None:
+            state["_metadata"] = self._metadata
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the state returned by `__getstate__()`."""
+        self._init_local()
+        prototype = type(self)._prototype
+        self._metadata = state.get("_metadata") or prototype._metadata
+        self._state = state["_state"]
+        self._history = state["_history"]
+
+    @property
+    def _values(self) -> Mapping[str, Any]:
+        """The committed field values."""
+        return self._state.values
+
+    @property
+    def _computed_values(self) -> dict[str, Any]:
+        """The committed values of the computed fields."""
+        return self._state.computed_values
+
+    @property
+    def _graph(self) -> DependencyGraph:
+        """The fields read by the user functions, see `DependencyGraph`."""
+        return self._state.graph
+
+    @property
+    def _pending_values(self) -> dict[str, Any]:
+        """The values set in the open transaction of the current thread."""
+        return self._tx.pending
+
+    @property
+    def _trx_(self) -> bool:
+        """Whether the current thread has an open transaction."""
+        return self._tx.active
+
+    @_trx_.setter
+    def _trx_(self, active: bool):
+        # Keeps `_open_tx` in step, so the fields are only read from the pending
+        # values while some thread has an open transaction. A thread that ends
+        # with an open transaction leaves it raised; reads stay correct.
+        tx = self._tx
+        if tx.active != active:
+            with self._lock:
+                self._open_tx += 1 if active else -1
+            tx.active = active
+
+    def _end_transaction(self):
+        """End the transaction of the current thread, discarding its values."""
+        self._trx_ = False
+        self._tx.reset()
 
-            fn_return_bool.field_name = field_name  # type: ignore[attr-defined]
-            return fn_return_bool
+    def get_version(self) -> int:
+        """Return the version number of the committed state.
 
-        # end-closure
+        The version starts at 0 and is increased by every commit that changes a
+        value. Pass it to `commit_transaction(expected_version=...)` to make sure
+        no other commit came in between.
+        """
+        return self._state.version
 
-        for option in self._metadata.values():
-            if not option.do_validate:
+    def _publish(self, current: ConfigState, new: ConfigState) -> bool:
+        """Replace the committed state if it is still `current` (compare-and-set).
+
+        The lock is only held for the compare and the swap, never while
+        validating.
+
+        Returns:
+            bool: True if `new` was published.
+        """
+        with self._lock:
+            if self._state is not current:
+                return False
+            self._state = new
+            return True
+
+    _schema_cache = SchemaCache()  # compiled schemas, see config_factory()
+
+    @classmethod
+    def clear_schema_cache(cls):
+        """Remove all compiled schemas from the cache of `config_factory()`."""
+        cls._schema_cache.clear()
+
+    _prototype: Config | None = None  # validated default state of the class
+    _lazy_computed: dict[str, tuple[str, ComputedFn]] = {}  # field -> (option, fn)
+
+    def _new_from_prototype(self) -> Config:
+        """Return a new instance of this class holding the committed state of self.
+
+        Nothing is copied: the Option objects, the value stores and the dependency
+        graph are shared. A commit never changes these in place but replaces them,
+        so both instances can still be changed independently. (The cached values
+        of lazy computed fields are the exception; they are valid for both.)
+        """
+        cfg = type(self)()
+        cfg._metadata = self._metadata
+        cfg._state = self._state
+        return cfg
+
+    def clone(self) -> Config:
+        """Return a copy of this config object without validating anything again.
+
+        The copy holds the committed values; pending values of an open transaction
+        are not copied. The copy and the original can be changed independently.
+        The values themselves are not copied, so mutable values (e.g. lists) are
+        shared.
+
+        Returns:
+            Config: A new instance of the same class.
+        """
+        return self._new_from_prototype()
+
+    @classmethod
+    def new_instance(cls, **overrides: Any) -> Config:
+        """Return a new instance of this config class with the given field values.
+
+        The instance starts from the validated default state of the class; only the
+        overrides, and the functions depending on them, are validated.
+
+        Args:
+            **overrides (Any): The field values that replace the defaults.
+
+        Returns:
+            Config: A new validated config instance.
+
+        Raises:
+            TypeError: If the class was not created by `config_factory()`.
+            ConfigInvalidFieldError: If a name is not part of the schema.
+            ConfigError: If an override fails validation.
+
+        Example:
+            cfg = Config.config_factory(schema)
+            other = type(cfg).new_instance(timeout=30)
+        """
+        if cls._prototype is None:
+            raise TypeError(
+                "new_instance() requires a class created by Config.config_factory()"
+            )
+        cfg = cls._prototype._new_from_prototype()
+        if overrides:
+            cfg.start_transaction()
+            for name, value in overrides.items():
+                if name not in cfg._metadata:
+                    raise ConfigInvalidFieldError(
+                        f"Invalid config field: '{name}'.", name
+                    )
+                setattr(cfg, name, value)  # triggers validation via descriptor
+            cfg.commit_transaction()
+        return cfg
+
+    @classmethod
+    def _create_inverted_bool_properties(cls, metadata: dict[str, Option]):
+        """Auto generate inverted version of boolean fields.
+
+        Adds an `InvertedBool` computed function to each bool typed option, e.g.
+        `no_debug` for `debug` and `wrap` for `no_wrap`, unless that field exists.
+        Runs once, when the schema is compiled.
+
+        Args:
+            metadata (dict[str, Option]): The options of the class.
+        """
+        for option in metadata.values():
+            if not option.do_validate or option.field_type is not bool:
                 continue
 
-            existing = list(option._comp_validator.fn_callbacks)
-            if option.field_type is bool:
-                if option.name.startswith("no_"):
-                    field_name = option.name.partition("_")[2]
-                else:
-                    field_name = "no_" + option.name
+            if option.name.startswith("no_"):
+                field_name = option.name.partition("_")[2]
+            else:
+                field_name = "no_" + option.name
 
-                if field_name and field_name not in self._metadata:
-                    existing.append(fn_return_inverted(option.name, field_name))
-            option._comp_validator.fn_callbacks = tuple(existing)
+            if field_name and field_name not in metadata:
+                comp_validator = option._comp_validator
+                comp_validator.fn_callbacks += (InvertedBool(field_name),)
 
-    def _create_computed_properties(self):
+    @classmethod
+    def _create_computed_properties(cls, metadata: dict[str, Option]):
         """Auto generate custom config fields based on Option property 'fn_computed'.
 
-        This will create the read-only properties for the config-instance based on the
-        metadata object Option.computed.
+        This will create the read-only properties on the config class based on the
+        metadata object Option.computed; it runs once, when the schema is compiled.
         These properties return their values from cfg._computed_values.
+        Lazy computed fields (see `with_field_name()`) are registered in the class
+        attribute `_lazy_computed`; they are computed when they are read for the
+        first time.
+
+        Args:
+            metadata (dict[str, Option]): The options of the class.
+
+        Raises:
+            ConfigInvalidFieldError: If a computed field name is already in use.
         """
-        cfg = self
-        for option in self._metadata.values():
+        lazy_computed = {}
+        for option in metadata.values():
             if not option.do_validate:
                 continue
 
             for fn in option._comp_validator.fn_callbacks:
-                if fn.field_name in self._metadata:
+                if fn.field_name in metadata:
                     # the computed fieldname may not be already in use
                     raise ConfigInvalidFieldError(
                         "cannot create computed field "
@@ -576,52 +985,631 @@ class Config:
 
                 # create a property (wihtout setter) for this computed field
                 prop = property(make_getter(fn.field_name))
-                setattr(cfg.__class__, fn.field_name, prop)
+                setattr(cls, fn.field_name, prop)
+                if getattr(fn, "lazy", False):
+                    lazy_computed[fn.field_name] = (option.name, fn)
+        cls._lazy_computed = lazy_computed
+
+    def _compute_lazy(
+        self,
+        name: str,
+        view: ConfigView,
+        computed_values: dict[str, Any],
+        reads: dict[str, set[str]],
+    ) -> Any:
+        """Compute a lazy computed field and cache its value in `computed_values`.
+
+        The fields read by the function are added to `reads`, keyed by the name of
+        the option that owns the function.
+
+        Args:
+            name (str): The name of the lazy computed field.
+            view (ConfigView): The view providing the values for the function.
+            computed_values (dict[str, Any]): The computed values to cache into.
+            reads (dict[str, set[str]]): Collects the fields read per option.
+
+        Returns:
+            Any: The computed value.
+
+        Raises:
+            KeyError: If `name` is not a lazy computed field.
+        """
+        option_name, fn = self._lazy_computed[name]
+        recorder = view.recording(reads.setdefault(option_name, set()))
+        comp_validator = self._metadata[option_name]._comp_validator
+        value = comp_validator.compute(fn, getattr(recorder, option_name), recorder)
+        computed_values[name] = value
+        return value
+
+    def _lazy_fallback(
+        self, computed_values: dict[str, Any], reads: dict[str, set[str]]
+    ) -> Callable[[str, ConfigView], Any] | None:
+        """Return the view fallback that computes the lazy computed fields.
+
+        Returns None if there are no lazy computed fields.
+        """
+        if not self._lazy_computed:
+            return None
+
+        def fallback(name: str, view: ConfigView) -> Any:
+            return self._compute_lazy(name, view, computed_values, reads)
+
+        return fallback
+
+    def _get_lazy(self, name: str) -> Any:
+        """Return the value of a lazy computed field, computing it if not cached.
+
+        The value is computed from the committed values and cached until a commit
+        invalidates it. The fields read are added to the dependency graph.
+
+        The value is only cached after the graph knows its inputs, and only in the
+        state it was computed from. If a commit came in between, the value is
+        returned without caching it.
+        """
+        state = self._state
+        new_values: dict[str, Any] = {}  # values computed now, cached afterwards
+        computed_values = ChainMap(new_values, state.computed_values)
+        reads: dict[str, set[str]] = {}
+        fallback = self._lazy_fallback(computed_values, reads)
+        view = ConfigView(state.values, {}, computed_values, fallback)
+        value = self._compute_lazy(name, view, computed_values, reads)
+        graph = state.graph.updated(
+            {
+                option_name: known | names_read
+                for option_name, names_read in reads.items()
+                if (known := state.graph.reads(option_name)) is not None
+            }  # keep the reads of the other functions too
+        )
+        if graph is not state.graph:
+            new_state = state._replace(graph=graph)
+            if not self._publish(state, new_state):
+                return value  # a commit came in between
+        state.computed_values.update(new_values)
+        return value
+
+    def _create_dependency_graph(self) -> DependencyGraph:
+        """Return the (still empty) dependency graph of the user functions.
+
+        The nodes are the options with custom validators or computed functions.
+        The explicit `depends_on` field names of the options are verified here.
+
+        Raises:
+            ConfigMetadataError: If a `depends_on` name is not a (computed) field.
+        """
+        nodes = [o.name for o in self._metadata.values() if o.has_functions]
+        producers = {
+            fn.field_name: name
+            for name in nodes
+            for fn in self._metadata[name]._comp_validator.fn_callbacks
+        }
+        explicit = {}
+        for option in self._metadata.values():
+            for field_name in option._depends_on:
+                if field_name not in self._metadata and field_name not in producers:
+                    raise ConfigMetadataError(
+                        f"'depends_on' refers to an unknown field '{field_name}'",
+                        option.name,
+                    )
+            if option._depends_on:
+                explicit[option.name] = option._depends_on
+
+        return DependencyGraph(nodes, producers, explicit)
 
     def start_transaction(self):
-        if self._trx_:
+        tx = self._tx
+        if tx.active:
             return
 
+        tx.reset()
         self._trx_ = True
-        self._pending_values.clear()
 
-    def commit_transaction(self, suppress_error_prefix=False):
-        if not self._trx_:
-            return
+    @contextmanager
+    def transaction(self, *, expected_version: int | None = None):
+        """Run a block as a transaction, or as a savepoint inside a transaction.
 
-        merged = {**self._values, **self._pending_values}
+        The outermost block starts a transaction and commits it when the block
+        ends; an exception rolls the whole transaction back. A nested block opens
+        a savepoint: when it ends, the fields written in it are checked by their
+        type, required, domain and range validators, and an exception, raised by
+        the block or by these checks, rolls back only the writes of the savepoint.
+        The custom and computed validators run at the commit.
 
-        try:
-            # Run the validators
-            for option in self._metadata.values():
-                option.validate_default(merged[option.name], self)
+        Creating, releasing and rolling back a savepoint costs O(fields written).
 
-            # Run the custom validators
-            for option in self._metadata.values():
-                option.validate_custom(merged[option.name], self)
+        Args:
+            expected_version (int | None): Passed to `commit_transaction()` by the
+                outermost block.
 
-            # Run the computes validators
-            for option in self._metadata.values():
-                option.validate_computed(merged[option.name], self)
+        Yields:
+            Config: This config object.
 
-            # at this point no exception was raised, copy merged to the actual datastore (this is the commit phase)
-            self._values = merged
+        Raises:
+            ConfigError: If a value fails validation.
+        """
+        tx = self._tx
+        if not tx.active:
+            self.start_transaction()
+            try:
+                yield self
+            except BaseException:
+                self.rollback_transaction()
+                raise
+            self.commit_transaction(expected_version=expected_version)
+            return
 
-        except Exception as e:
+        tx.savepoint()
+        try:
+            yield self
+            journal = tx.savepoints[-1]
+            view = self._view()
+            for name in journal:
+                self._metadata[name].validate_default(tx.pending[name], view)
+        except BaseException:
+            tx.rollback_savepoint()
             raise
-            # if suppress_error_prefix:
-            #     msg = f"{e}")
-            #     raise ConfigError(e)
-            # else:
-            #     msg = f"Commit raised an error (changes are undone): {e}")
+        tx.release()
+
+    def _changed_values(self, state: ConfigState) -> dict[str, Any]:
+        """Return the pending values that differ from the values of `state`.
+
+        A pending value is unchanged when it is an immutable scalar (or a tuple of
+        them) of the same type as the committed value and compares equal to it. The
+        type check makes sure that e.g. `1` replacing `True` still counts as a
+        change. A mutable value always counts as changed, since it may have been
+        changed in place, see `_is_unchanged()`.
+
+        Args:
+            state (ConfigState): The committed state to compare with.
+
+        Returns:
+            dict[str, Any]: The changed fields and their new values.
+        """
+        values = state.values
+        return {
+            name: value
+            for name, value in self._pending_values.items()
+            if not _is_unchanged(values.get(name, _MISSING), value)
+        }
+
+    def _validate_changes(
+        self,
+        changed: dict[str, Any],
+        *,
+        checked: Container[str] = (),
+        errors: dict[str, ConfigError] | None = None,
+        state: ConfigState | None = None,
+    ) -> tuple[Mapping[str, Any], dict[str, Any], dict[str, set[str]]]:
+        """Validate changed field values against the committed state of this config.
+
+        Runs the validation steps of a commit without publishing anything: the core
+        validators of the changed fields, followed by the custom validators and the
+        computed functions of the options depending on the changed fields.
+
+        Args:
+            changed (dict[str, Any]):
+                The changed fields and their new values, see `_changed_values()`.
+            checked (Container[str]):
+                Changed fields whose core validators are known to pass.
+            errors (dict[str, ConfigError] | None):
+                If given, validation errors are collected in this dictionary, keyed
+                by field name, instead of raised. The computed functions only run
+                when no errors were found.
+            state (ConfigState | None):
+                The committed state to validate against; the current state if None.
+
+        Returns:
+            tuple[Mapping[str, Any], dict[str, Any], dict[str, set[str]]]:
+                The merged field values, the computed values, and the names of the
+                fields read by the functions per option.
+
+        Raises:
+            ConfigError: If a value fails validation and `errors` is None.
+        """
+        state = state or self._state
+        values = state.values
+        if isinstance(values, SlotStore):
+            merged = values.replace(changed)
+        else:
+            merged = {**values, **changed}
+        metadata = self._metadata
+        graph = state.graph
+        computed_values = {**state.computed_values}
+        reads: dict[str, set[str]] = {}  # fields read per option
+        # one read-only view shared by all validators
+        fallback = self._lazy_fallback(computed_values, reads)
+        view = ConfigView(values, changed, computed_values, fallback)
+
+        # Run the validators, only the changed values need to be checked
+        for name in changed:
+            if name not in checked:
+                try:
+                    metadata[name].validate_default(merged[name], view)
+                except ConfigError as e:
+                    if errors is None:
+                        raise
+                    errors[name] = e
+        if errors:
+            return merged, computed_values, reads
+
+        # Run the custom validators of the options depending on changed fields
+        affected = graph.affected(changed)
+        for name in graph.ordered(affected):
+            recorder = view.recording(reads.setdefault(name, set()))
+            try:
+                metadata[name].validate_custom(merged[name], recorder)
+            except ConfigError as e:
+                if errors is None:
+                    raise
+                errors[name] = e
+        if errors:
+            return merged, computed_values, reads
+
+        # Run the computes validators in topological order; the options that
+        # read a computed field that changed are run as well.
+        todo = [(graph.rank(name), name) for name in affected]
+        heapq.heapify(todo)
+        while todo:
+            _, name = heapq.heappop(todo)
+            recorder = view.recording(reads.setdefault(name, set()))
+            try:
+                computed = metadata[name].validate_computed(merged[name], recorder)
+            except ConfigError as e:
+                if errors is None:
+                    raise
+                errors[name] = e
+                continue
+            outputs = [
+                fname
+                for fname, value in computed.items()
+                if not _is_unchanged(computed_values.get(fname, _MISSING), value)
+            ]
+            computed_values.update(computed)
+            # drop the cached lazy values; computed again when read
+            for fn in metadata[name]._comp_validator.fn_callbacks:
+                if getattr(fn, "lazy", False):
+                    if computed_values.pop(fn.field_name, _MISSING) is not _MISSING:
+                        outputs.append(fn.field_name)
+            for dependent in graph.affected(outputs) - affected:
+                affected.add(dependent)
+                # only its computed functions rerun; keep the reads of its
+                # custom validators
+                reads.setdefault(dependent, set()).update(graph.reads(dependent) or ())
+                heapq.heappush(todo, (graph.rank(dependent), dependent))
+
+        return merged, computed_values, reads
+
+    def commit_transaction(
+        self, suppress_error_prefix=False, *, expected_version: int | None = None
+    ) -> ChangeSet:
+        """Validate the pending values and publish them as a new version.
+
+        The pending values are validated against the current version. If another
+        thread publishes a version meanwhile, the values are validated again
+        against that version; with `expected_version` the commit fails instead.
+
+        After the new version is published, the callbacks subscribed to the changed
+        fields are called once each with the change set, see `subscribe()`. An
+        exception raised by a callback does not reach the caller; the commit stands.
+
+        Args:
+            suppress_error_prefix (bool): Not used.
+            expected_version (int | None): The version the transaction was based
+                on, see `get_version()`.
+
+        Returns:
+            ChangeSet: The old and new values of the changed fields and computed
+                fields; empty (falsy) if nothing changed.
+
+        Raises:
+            ConfigConflictError: If the current version is not `expected_version`.
+            ConfigError: If a value fails validation.
+        """
+        if not self._trx_:
+            return ChangeSet(self._state.version)
+
+        record = self._tx.record
+        try:
+            while True:
+                state = self._state
+                if expected_version is not None and state.version != expected_version:
+                    raise ConfigConflictError(
+                        f"commit expected version {expected_version}, "
+                        f"but the current version is {state.version}",
+                        expected_version=expected_version,
+                        actual_version=state.version,
+                    )
+                changed = self._changed_values(state)
+                if not changed:
+                    return ChangeSet(state.version)  # nothing to validate or commit
+
+                merged, computed_values, reads = self._validate_changes(
+                    changed, state=state
+                )
+
+                # at this point no exception was raised, publish the new version (this is the commit phase)
+                new_state = ConfigState(
+                    state.version + 1,
+                    merged,
+                    computed_values,
+                    state.graph.updated(reads),
+                    self._committed_sources(state, changed),
+                )
+                if self._publish(state, new_state):
+                    break
 
         finally:
-            self._trx_ = False
-            self._pending_values.clear()
+            self._end_transaction()
+
+        changes = self._change_set(state, new_state, changed)
+        if self._history is not None and record and changes:
+            self._history.record(changes)
+        if self._subscribers is not None and changes:
+            self._subscribers.notify(changes)
+        return changes
+
+    def _committed_sources(
+        self, state: ConfigState, changed: dict[str, Any]
+    ) -> Mapping[str, str]:
+        """Return the origins of the values after committing the changed values."""
+        sources = self._tx.sources
+        return {
+            **state.sources,
+            **{name: sources.get(name, "set") for name in changed},
+        }
+
+    def get_source(self, name: str) -> str:
+        """Return where the committed value of a field came from.
+
+        The origin is recorded per value: "default" for a value that was never
+        changed, "set" for a value set in code, and a description of the source
+        for values loaded with `load()`, e.g. "config.toml:3" or "env APP_PORT".
+
+        Args:
+            name (str): The field name.
+
+        Returns:
+            str: The origin of the value.
+
+        Raises:
+            ConfigInvalidFieldError: If the field is not known.
+        """
+        if name not in self._metadata:
+            raise ConfigInvalidFieldError(f"Invalid config field: '{name}'.", name)
+        return self._state.sources.get(name, "default")
+
+    def _change_set(
+        self, old: ConfigState, new: ConfigState, changed: dict[str, Any]
+    ) -> ChangeSet:
+        """Return the change set of a commit that replaced `old` by `new`.
+
+        Lazy computed fields are left out; they are computed when read.
+        """
+        old_values = old.values
+        old_computed = old.computed_values
+        computed = {}
+        for name, value in new.computed_values.items():
+            previous = old_computed.get(name, _MISSING)
+            if previous is _MISSING or not _is_unchanged(previous, value):
+                if name not in self._lazy_computed:
+                    computed[name] = (
+                        None if previous is _MISSING else previous,
+                        value,
+                    )
+        return ChangeSet(
+            new.version,
+            {name: (old_values[name], value) for name, value in changed.items()},
+            computed,
+        )
+
+    def subscribe(
+        self,
+        fields: str | Iterable[str],
+        callback: ChangeCallback,
+        *,
+        on_error: ErrorHandler | None = None,
+    ):
+        """Call `callback(changes)` after each commit that changes one of the fields.
+
+        The callback is called once per commit with the `ChangeSet`, also when
+        several of its fields changed. Computed fields can be subscribed to as
+        well, except lazy ones; subscribe to their inputs instead.
+
+        The callback is held by weak reference; the subscription ends when it is
+        garbage collected. Keep a reference to it, e.g. use a function or a bound
+        method of an object that lives as long as the subscription.
+
+        The callback runs after the commit is published. An exception it raises
+        is passed to `on_error`, or logged to the "konvigius" logger; it never
+        reaches the code that committed, and the other callbacks are still called.
+
+        Args:
+            fields (str | Iterable[str]): The field name or names.
+            callback (Callable[[ChangeSet], Any]): The function to call.
+            on_error (Callable[[Exception], Any] | None): Called with the exception
+                when the callback fails.
+
+        Raises:
+            ConfigInvalidFieldError: If a field name is not known.
+        """
+        names = (fields,) if isinstance(fields, str) else tuple(fields)
+        for name in names:
+            if name in self._lazy_computed:
+                raise ConfigInvalidFieldError(
+                    f"cannot subscribe to lazy computed field '{name}'", name
+                )
+            if name not in self._metadata and name not in self._computed_values:
+                raise ConfigInvalidFieldError(
+                    f"cannot subscribe to unknown field '{name}'", name
+                )
+        with self._lock:
+            if self._subscribers is None:
+                self._subscribers = SubscriberIndex()
+        self._subscribers.add(names, callback, on_error)
+
+    def unsubscribe(
+        self, callback: ChangeCallback, fields: str | Iterable[str] | None = None
+    ):
+        """Remove the subscriptions of a callback to the fields, or to all fields.
+
+        Args:
+            callback (Callable[[ChangeSet], Any]): The subscribed function.
+            fields (str | Iterable[str] | None): The field name or names; None
+                removes all subscriptions of the callback.
+        """
+        if self._subscribers is not None:
+            names = (fields,) if isinstance(fields, str) else fields
+            self._subscribers.remove(callback, names)
 
     def rollback_transaction(self):
-        self._trx_ = False
-        self._pending_values.clear()
+        self._end_transaction()
+
+    def watch(
+        self, sources: Iterable[Source | Mapping[str, Any]], **kwargs: Any
+    ) -> ConfigWatcher:
+        """Reload this config object whenever the files of its sources change.
+
+        Only the changed values are set, in one transaction; if they fail
+        validation, this config object keeps its values. See
+        `konvigius.watch.ConfigWatcher`.
+
+        Args:
+            sources (Iterable[Source | Mapping[str, Any]]): The sources, lowest
+                priority first; use the sources this config was loaded from.
+            **kwargs (Any): Passed to `ConfigWatcher`, e.g. `interval`,
+                `on_reload` and `on_error`.
+
+        Returns:
+            ConfigWatcher: The started watcher; call `stop()` to stop it.
+
+        Raises:
+            ConfigError: If the values of the sources fail validation.
+            Exception: Any other error of reading the sources, e.g. an `OSError`.
+        """
+        from .watch import ConfigWatcher
+
+        return ConfigWatcher(self, sources, **kwargs).start()
+
+    def enable_history(self, maxlen: int = 100):
+        """Keep a history of at most `maxlen` commits, for `undo()` and `redo()`.
+
+        Only the field diffs of the commits are kept, see `History`. Calling it
+        again discards the history recorded so far.
+
+        Args:
+            maxlen (int): The number of commits that can be undone.
+        """
+        self._history = History(maxlen)
+
+    def undo(self) -> ChangeSet:
+        """Undo the most recent commit in the history.
+
+        The old values of its fields are committed in one validated transaction.
+
+        Returns:
+            ChangeSet: The changes of the undo commit; empty if there is nothing
+                to undo.
+
+        Raises:
+            ConfigError: If the history is not enabled, a transaction is open, or
+                the old values fail validation; the history is then unchanged.
+        """
+        history = self._require_history()
+        if not history.undo:
+            return ChangeSet(self._state.version)
+        entry = history.undo.pop()
+        try:
+            changes = self._replay({name: old for name, (old, _) in entry.fields.items()})
+        except BaseException:
+            history.undo.append(entry)
+            raise
+        history.redo.append(entry)
+        return changes
+
+    def redo(self) -> ChangeSet:
+        """Redo the most recently undone commit.
+
+        The new values of its fields are committed in one validated transaction.
+
+        Returns:
+            ChangeSet: The changes of the redo commit; empty if there is nothing
+                to redo.
+
+        Raises:
+            ConfigError: If the history is not enabled, a transaction is open, or
+                the values fail validation; the history is then unchanged.
+        """
+        history = self._require_history()
+        if not history.redo:
+            return ChangeSet(self._state.version)
+        entry = history.redo.pop()
+        try:
+            changes = self._replay({name: new for name, (_, new) in entry.fields.items()})
+        except BaseException:
+            history.redo.append(entry)
+            raise
+        if changes:
+            history.undo.append(ChangeSet(changes.version, changes.fields))
+        return changes
+
+    def revert_to(self, version: int) -> ChangeSet:
+        """Restore the values of a version in the history, see `History.versions()`.
+
+        All commits after the version are undone in one validated transaction;
+        they can be redone one by one with `redo()`.
+
+        Args:
+            version (int): The version to restore.
+
+        Returns:
+            ChangeSet: The changes of the revert commit.
+
+        Raises:
+            ConfigError: If the version is not in the history, the history is not
+                enabled, a transaction is open, or the values fail validation.
+        """
+        history = self._require_history()
+        if version == self._state.version:
+            return ChangeSet(version)
+        if version not in history.versions():
+            raise ConfigError(f"version {version} is not in the history")
+        undone = []  # newest first
+        while history.undo and history.undo[-1].version > version:
+            undone.append(history.undo.pop())
+        values = {}
+        for entry in undone:
+            values.update((name, old) for name, (old, _) in entry.fields.items())
+        try:
+            changes = self._replay(values)
+        except BaseException:
+            history.undo.extend(reversed(undone))
+            raise
+        history.redo.extend(undone)
+        return changes
+
+    def _require_history(self) -> History:
+        if self._history is None:
+            raise ConfigError("the history is not enabled, see enable_history()")
+        return self._history
+
+    def _replay(self, values: dict[str, Any]) -> ChangeSet:
+        """Commit values from the history, without recording the commit."""
+        tx = self._tx
+        if tx.active:
+            raise ConfigError("cannot undo or redo while a transaction is open")
+        self._trx_ = True
+        tx.record = False
+        for name, value in values.items():
+            tx.set(name, value)
+        return self.commit_transaction()
+
+    def _view(self) -> ConfigView:
+        """Return a read-only view on the (pending) values of this config.
+
+        The view shares the value stores of this instance, nothing is copied. It is
+        passed as the `cfg` argument to the validators and computed functions.
+        """
+        state = self._state
+        return ConfigView(state.values, self._tx.pending, state.computed_values)
 
     @classmethod
     def config_factory(
@@ -630,6 +1618,7 @@ class Config:
         *,
         help_map: dict[str, str] | None = None,
         auto_bools: bool = True,
+        slots: bool = False,
     ) -> Config:
         """
         Dynamically creates a Config subclass with fields based on the provided
@@ -640,6 +1629,10 @@ class Config:
 
         This is the core entry point for schema-based config creation.
 
+        The compiled schema is cached (see `Config`); calling the factory again
+        with an equal schema returns a new instance of the same class, without
+        validating the metadata and the default values again.
+
         Args:
             schema (list[Schema]):
                 A list of Schema options.
@@ -651,6 +1644,12 @@ class Config:
             auto_bools (bool, optional):
                 Whether inverted boolean fields must be generated.
 
+            slots (bool, optional):
+                Whether the values are kept in a slot-indexed store instead of
+                a dict (see `konvigius.core.store`). The instances of such a
+                class have no `__dict__`; this saves memory and speeds up the
+                reading of fields, notably for schemas with many fields.
+
         Returns:
             Config: An instance of a dynamically generated Config subclass.
 
@@ -666,50 +1665,148 @@ class Config:
             print(cfg.username)  # → 'guest'
             print(cfg.timeout)   # → 30
         """
-        # Create the ConfigField objects, each referencing an Option object.
+        # Reuse the compiled schema if the same schema was compiled before
 
-        namespace = {}
-        for entry in schema:
-            option = Option(entry, help_map)
-            namespace[option.name] = ConfigField(option)
+        key = schema_fingerprint(
+            schema, cls=cls, help_map=help_map, auto_bools=auto_bools, slots=slots
+        )
+        prototype = cls._schema_cache.get(key)
+        if prototype is not None:
+            return prototype._new_from_prototype()
 
-        # Create a Config instance dynamically
+        Config_cls, metadata = cls._compile_schema(schema, help_map, auto_bools, slots)
+
+        # Create the first instance and fill the backend datastore
 
-        Config_cls = type("DynamicConfig", (cls,), namespace)
         cfg = Config_cls()
+        cfg._metadata = metadata
+        values = {option.name: option.default_value for option in metadata.values()}
 
-        # Instantiate the default validators and fill the backend datastore
+        if slots:
+            index = {name: vars(Config_cls)[name].index for name in metadata}
+            values = SlotStore.from_mapping(index, values)
+        cfg._state = ConfigState(0, values, {}, _NO_GRAPH, {})
 
-        for config_field in namespace.values():
-            option = config_field.option  # aliasing
-            option.init_validators()
-            cfg._metadata[option.name] = option
-            cfg._values[option.name] = option.default_value
+        reads: dict[str, set[str]] = {}  # fields read by the functions per option
+        # lazy computed fields are computed when a function reads them
+        fallback = cfg._lazy_fallback(cfg._computed_values, reads)
+        view = ConfigView(cfg._values, {}, cfg._computed_values, fallback)
 
         # Run the validators
 
         for option in cfg._metadata.values():
-            option.validate_default(cfg._values[option.name], cfg)
+            option.validate_default(cfg._values[option.name], view)
 
         # Run the custom validators
 
         for option in cfg._metadata.values():
-            option.validate_custom(cfg._values[option.name], cfg)
+            recorder = view.recording(reads.setdefault(option.name, set()))
+            option.validate_custom(cfg._values[option.name], recorder)
+
+        # Run the field-computation validators
+
+        for option in cfg._metadata.values():
+            recorder = view.recording(reads[option.name])
+            computed = option.validate_computed(cfg._values[option.name], recorder)
+            cfg._computed_values.update(computed)
+
+        # Build the dependency graph from the fields read by the functions
+
+        graph = cfg._create_dependency_graph()
+        for name, names_read in reads.items():
+            graph.update(name, names_read)
+        cfg._state = cfg._state._replace(graph=graph)
+
+        Config_cls._prototype = cfg._new_from_prototype()
+        cls._schema_cache.put(key, Config_cls._prototype)
+        return cfg
+
+    @classmethod
+    def _compile_schema(
+        cls,
+        schema: list[Schema],
+        help_map: dict[str, str] | None,
+        auto_bools: bool,
+        slots: bool,
+        defer_plans: bool = False,
+    ) -> tuple[type[Config], dict[str, Option]]:
+        """Create the config class of a schema and its Option objects.
+
+        Validates the metadata, not the default values; see `config_factory()`.
+        With `defer_plans` the core validators of the options are created, and
+        their metadata validated, on first use (see `Option.init_validators()`).
+        """
+        # Create the ConfigField objects, each referencing an Option object.
+
+        namespace = {}
+        for entry in schema:
+            option = Option(entry, help_map)
+            if slots:
+                namespace[option.name] = SlotConfigField(option, len(namespace))
+            else:
+                namespace[option.name] = ConfigField(option)
+
+        # Create a Config class dynamically
+
+        fields = dict(namespace)
+        if slots:
+            namespace["__slots__"] = ()  # instances without a __dict__
+        Config_cls = type("DynamicConfig", (cls,), namespace)
+
+        # Instantiate the default validators
+
+        metadata: dict[str, Option] = {}
+        for config_field in fields.values():
+            option = config_field.option  # aliasing
+            option.init_validators(defer_plan=defer_plans)
+            metadata[option.name] = option
 
         # Add properties for bool typed Options: inverted bools.
 
         if auto_bools:
-            cfg._create_inverted_bool_properties()
+            Config_cls._create_inverted_bool_properties(metadata)
 
         # Create properties for the conputed-functions from the Schema-field fn_computed
 
-        cfg._create_computed_properties()
-
-        # Run the field-computation validators
+        Config_cls._create_computed_properties(metadata)
+        return Config_cls, metadata
 
-        for option in cfg._metadata.values():
-            option.validate_computed(cfg._values[option.name], cfg)
+    @classmethod
+    def _restore(
+        cls,
+        schema: list[Schema],
+        default_state: ConfigState,
+        state: ConfigState,
+        *,
+        help_map: dict[str, str] | None = None,
+        auto_bools: bool = True,
+        slots: bool = False,
+    ) -> Config:
+        """Return an instance holding a cached state, without validating anything.
 
+        The states come from the on-disk cache of `load()`: `default_state` is the
+        validated default state of the schema and becomes the prototype of the
+        class, unless the schema was already compiled in this process. The class
+        is compiled with deferred validation plans, so no core validator is
+        created (and no domain file opened) until a value is set.
+        """
+        key = schema_fingerprint(
+            schema, cls=cls, help_map=help_map, auto_bools=auto_bools, slots=slots
+        )
+        prototype = cls._schema_cache.get(key)
+        if prototype is None:
+            Config_cls, metadata = cls._compile_schema(
+                schema, help_map, auto_bools, slots, defer_plans=True
+            )
+            for name, option in metadata.items():  # as normalized by the validators
+                option.default_value = default_state.values[name]
+            prototype = Config_cls()
+            prototype._metadata = metadata
+            prototype._state = default_state
+            Config_cls._prototype = prototype
+            cls._schema_cache.put(key, prototype)
+        cfg = prototype._new_from_prototype()
+        cfg._state = state
         return cfg
 
     @classmethod
@@ -750,6 +1847,277 @@ class Config:
 
         return cfg
 
+    @classmethod
+    def load(
+        cls,
+        schema: list[Schema],
+        sources: Iterable[Source | Mapping[str, Any]] = (),
+        *,
+        cache_dir: str | os.PathLike | None = None,
+        **factory_kwargs: Any,
+    ) -> Config:
+        """
+        Create a Config instance from a schema and layered sources of values.
+
+        The sources are merged in priority order, lowest first: a later source
+        overrides the values of an earlier one, and the schema defaults have the
+        lowest priority. The merged values are validated once, by one commit. The
+        origin of every value is recorded, see `get_source()`.
+
+        With a `cache_dir`, the validated state is cached on disk, keyed by a hash
+        of the schema and the contents of the sources (see `Source.fingerprint()`).
+        The functions of the schema are hashed with their code, closure and the
+        module globals they read; state they reach through other modules or
+        objects, e.g. `settings.LIMIT`, is not part of the key.
+        When the key is found, the values, computed values and origins are
+        restored without reading, converting or validating anything. Otherwise
+        the sources are loaded as usual and the cache file is written atomically.
+        The values are not cached if a source has no fingerprint, e.g. a
+        `CLISource`, or if they can not be pickled.
+
+        ``` python
+        cfg = Config.load(schema, sources=[
+            {"port": 8080},                 # e.g. parsed from a file
+            DictSource(overrides, "site"),
+            CLISource(),                    # sys.argv[1:]
+        ])
+        ```
+
+        Args:
+            schema (list): A list of Schema objects defining the schema defaults.
+            sources (Iterable[Source | Mapping[str, Any]]): The sources, see
+                `konvigius.sources`; a mapping is read as a `DictSource`.
+            cache_dir (str | PathLike | None): The directory of the on-disk cache;
+                only trusted users must be able to write to it.
+            **factory_kwargs (Any): Passed to `config_factory()`.
+
+        Returns:
+            Config: A fully validated config instance with the loaded values.
+
+        Raises:
+            ConfigInvalidFieldError: If a source has a value for an unknown field.
+            ConfigError: If a value fails validation; the message starts with the
+                origin of the value.
+        """
+        from .sources import DictSource, Source, load_cache_key, load_sources
+
+        key = None
+        if cache_dir is not None:
+            from . import __version__
+
+            sources = [
+                source if isinstance(source, Source) else DictSource(source)
+                for source in sources
+            ]
+            key = load_cache_key(
+                schema, sources, cls=cls, version=__version__, **factory_kwargs
+            )
+            cache = DiskCache(cache_dir)
+            cached = None if key is None else cache.get(key)
+            if cached is not None:
+                return cls._restore(schema, *cached, **factory_kwargs)
+
+        cfg = cls.config_factory(schema, **factory_kwargs)
+        load_sources(cfg, sources)
+        if key is not None:
+            cache.put(key, (type(cfg)._prototype._state, cfg._state))
+        return cfg
+
+    @classmethod
+    def from_env(
+        cls, schema: list[Schema], prefix: str = "", **factory_kwargs: Any
+    ) -> Config:
+        """
+        Create a Config instance from a schema and environment variables.
+
+        The variable of a field is the prefix followed by the field name in upper
+        case, e.g. `APP_TIMEOUT`. The strings are converted to the field types,
+        see `konvigius.sources.EnvSource`.
+
+        Args:
+            schema (list): A list of Schema objects defining the schema defaults.
+            prefix (str): The prefix of the variable names, e.g. "APP_".
+            **factory_kwargs (Any): Passed to `config_factory()`.
+
+        Returns:
+            Config: A fully validated config instance with the loaded values.
+
+        Raises:
+            ConfigTypeError: If a string can not be converted to the field type.
+            ConfigError: If a value fails validation.
+        """
+        from .sources import EnvSource
+
+        return cls.load(schema, [EnvSource(prefix)], **factory_kwargs)
+
+    @classmethod
+    def from_toml(
+        cls,
+        schema: list[Schema],
+        path: str | os.PathLike,
+        *,
+        table: str | None = None,
+        **factory_kwargs: Any,
+    ) -> Config:
+        """
+        Create a Config instance from a schema and a TOML file.
+
+        Args:
+            schema (list): A list of Schema objects defining the schema defaults.
+            path (str | PathLike): The TOML file.
+            table (str | None): The dotted name of the table holding the values;
+                the top level if None.
+            **factory_kwargs (Any): Passed to `config_factory()`.
+
+        Returns:
+            Config: A fully validated config instance with the loaded values.
+
+        Raises:
+            ConfigError: If the file can not be read or parsed, or a value fails
+                validation; the message starts with the file and line.
+        """
+        from .sources import TomlSource
+
+        return cls.load(schema, [TomlSource(path, table)], **factory_kwargs)
+
+    @classmethod
+    def from_ini(
+        cls,
+        schema: list[Schema],
+        path: str | os.PathLike,
+        section: str | None = None,
+        **factory_kwargs: Any,
+    ) -> Config:
+        """
+        Create a Config instance from a schema and a section of an INI file.
+
+        The strings are converted to the field types like those of `from_env()`.
+
+        Args:
+            schema (list): A list of Schema objects defining the schema defaults.
+            path (str | PathLike): The INI file.
+            section (str | None): The section holding the values; the DEFAULT
+                section if None.
+            **factory_kwargs (Any): Passed to `config_factory()`.
+
+        Returns:
+            Config: A fully validated config instance with the loaded values.
+
+        Raises:
+            ConfigError: If the file can not be read or parsed, or a value fails
+                validation; the message starts with the file and line.
+        """
+        from .sources import IniSource
+
+        return cls.load(schema, [IniSource(path, section)], **factory_kwargs)
+
+    @classmethod
+    def from_json(
+        cls,
+        schema: list[Schema],
+        fileobj: IO,
+        pointer: str = "",
+        **factory_kwargs: Any,
+    ) -> Config:
+        """
+        Create a Config instance from a schema and an object in a JSON document.
+
+        The document is read incrementally, and only until all fields are found;
+        the parts the schema does not need are skipped without decoding them, see
+        `konvigius.sources.JsonSource`.
+
+        Args:
+            schema (list): A list of Schema objects defining the schema defaults.
+            fileobj (IO): The document, opened in text or binary mode.
+            pointer (str): The JSON pointer to the object holding the values, e.g.
+                "/services/api"; the document itself if empty.
+            **factory_kwargs (Any): Passed to `config_factory()`.
+
+        Returns:
+            Config: A fully validated config instance with the loaded values.
+
+        Raises:
+            ConfigError: If the document is not valid JSON up to the object, or
+                a value fails validation.
+        """
+        from .sources import JsonSource
+
+        return cls.load(schema, [JsonSource(fileobj, pointer)], **factory_kwargs)
+
+    @classmethod
+    def from_dir(
+        cls,
+        schema: list[Schema],
+        path: str | os.PathLike,
+        section: str | None = None,
+        **factory_kwargs: Any,
+    ) -> Config:
+        """
+        Create a Config instance from a schema and the fragment files in a directory.
+
+        The TOML, INI and JSON fragments are merged in lexical order of their
+        names, see `konvigius.sources.DirectorySource`.
+
+        Args:
+            schema (list): A list of Schema objects defining the schema defaults.
+            path (str | PathLike): The directory, e.g. "/etc/app/conf.d".
+            section (str | None): The section of the INI fragments holding the
+                values; the DEFAULT section if None.
+            **factory_kwargs (Any): Passed to `config_factory()`.
+
+        Returns:
+            Config: A fully validated config instance with the loaded values.
+
+        Raises:
+            ConfigError: If a fragment can not be read or parsed, or a value fails
+                validation; the message starts with the fragment and line.
+        """
+        from .sources import DirectorySource
+
+        return cls.load(schema, [DirectorySource(path, section)], **factory_kwargs)
+
+    @classmethod
+    def validate_many(
+        cls,
+        schema: list[Schema],
+        records: Iterable[dict[str, Any]],
+        *,
+        auto_bools: bool = True,
+        chunk_size: int = 1024,
+    ) -> Iterator[ValidationResult]:
+        """
+        Validate many records of field values against one schema.
+
+        The schema is compiled once; the records are streamed through the same
+        validations as `from_dict()` would run, without creating a config instance
+        per record. Fields not in a record keep their schema default.
+
+        The numeric type, range and domain checks are done column-wise per chunk
+        of records when NumPy is installed (see `konvigius.batch`).
+
+        Args:
+            schema (list[Schema]): A list of Schema objects defining the fields.
+            records (Iterable[dict[str, Any]]): The field values per record.
+            auto_bools (bool, optional): Whether inverted boolean fields must be
+                generated, as in `config_factory()`.
+            chunk_size (int, optional): The number of records checked at once.
+
+        Returns:
+            Iterator[ValidationResult]: The result per record, in input order.
+
+        Raises:
+            ConfigMetadataError: If any Option metadata is invalid.
+
+        Example:
+            for result in Config.validate_many(schema, records):
+                if not result.ok:
+                    print(result.index, result.errors)
+        """
+        from .batch import validate_records
+
+        cfg = cls.config_factory(schema, auto_bools=auto_bools)
+        return validate_records(cfg, records, chunk_size)
+
     def get_computed_prop(self, name):
         """Return the value produced by the fn_computed attribute (callable) from
         the metadata object (Option) for the given field name.
@@ -764,6 +2132,8 @@ class Config:
         Returns:
             Some value (Any): The values that was produced.
         """
+        if name in self._lazy_computed:
+            return getattr(self, name)
         return self._computed_values.get(name, f"Field '{name}' is invalid")
 
     def get_meta(self, name):
@@ -789,7 +2159,8 @@ class Config:
         Returns:
             dict: A mapping of field names to their current values.
         """
-        return {name: getattr(self, name) for name in self._metadata.keys()}
+        values = ChainMap(self._tx.pending, self._state.values)  # one version
+        return {name: values[name] for name in self._metadata.keys()}
 
     def to_json(self, *, indent: int = 2) -> str:
         """Serialize the current config values to a JSON-formatted string.
@@ -809,7 +2180,9 @@ class Config:
         Utility to display field names, values and their help text from the
         config object.
 
-        The table is formatted as markdown.
+        The table is formatted as markdown. The Source column shows "S" for the
+        fields and "C" for the computed fields; once a value was changed, it shows
+        the origin of each field value instead, see `get_source()`.
 
         Args:
             chop_at (int): Maximum length of the fields (default 45)
@@ -826,10 +2199,13 @@ class Config:
         lines.append("| " + " | ".join([f"{h[0] * int(h[1])}" for h in headers]) + " |")
 
         sorted_rows = sorted(self)
+        sources = self._state.sources  # the origins, once a value was changed
 
         for row in sorted_rows:
             if (name := row[0]) in self._metadata:
                 desc = self._metadata[name].help_text or ""
+                if sources:
+                    row = (name, row[1], sources.get(name, "default"))
             else:
                 desc = "Autogenerated: " + name
             zrow = zip(row + (desc,), lengths)
@@ -839,6 +2215,19 @@ class Config:
 
         return "\n".join(lines)
 
+    def snapshot(self) -> ConfigSnapshot:
+        """Return a frozen, hashable snapshot of the committed values.
+
+        The snapshot shares the value stores of this config object, so it is
+        created in O(1). A later commit replaces the stores of this object instead
+        of changing them, which leaves the snapshot untouched. Pending values of an
+        open transaction are not part of the snapshot.
+
+        Returns:
+            ConfigSnapshot: The read-only snapshot.
+        """
+        return ConfigSnapshot(self._new_from_prototype())
+
     def copy_config(self, dirty=False) -> SimpleNamespace:
         """Create a simple copy of the config attribute values.
 
@@ -865,11 +2254,15 @@ class Config:
          - generated properties like computed fields
          - auto generated inverted booleans.
         """
-        return len(self._values) + len(self._computed_values)
+        computed = self._computed_values.keys() | self._lazy_computed.keys()
+        return len(self._values) + len(computed)
 
     def __iter__(self):
-        yield from ((key, value, "S") for key, value in self._values.items())
-        yield from ((key, value, "C") for key, value in self._computed_values.items())
+        for name in self._lazy_computed:
+            getattr(self, name)  # reading a lazy computed field caches its value
+        state = self._state  # one version
+        yield from ((key, value, "S") for key, value in state.values.items())
+        yield from ((key, value, "C") for key, value in state.computed_values.items())
 
     def __str__(self):
         header = "<Config values>"
@@ -883,12 +2276,144 @@ class Config:
         return f"<Config: {joined}>"
 
 
+class ConfigSnapshot:
+    """Frozen view on the committed values of a config object, see `Config.snapshot()`.
+
+    The fields and the computed fields are read as attributes, like on the config
+    object; they can not be set. Snapshots of config objects of the same class are
+    equal when their field values are equal, and they are hashable when all field
+    values are, e.g. to use them as cache keys.
+
+    A snapshot is never changed, so it can be shared by threads without locking.
+    (Lazy computed fields are computed on first access and cached, which is safe
+    as well.)
+    """
+
+    __slots__ = ("_cfg", "_hash")
+
+    def __init__(self, cfg: Config):
+        """Create a snapshot of a config object that is not changed anymore.
+
+        Args:
+            cfg (Config): A private config object holding the snapshot state.
+        """
+        object.__setattr__(self, "_cfg", cfg)
+        object.__setattr__(self, "_hash", None)
+
+    def __getattr__(self, name: str) -> Any:
+        cfg = self._cfg
+        if (
+            name in cfg._metadata
+            or name in cfg._computed_values
+            or name in cfg._lazy_computed
+        ):
+            return getattr(cfg, name)
+        raise AttributeError(f"config snapshot has no field '{name}'")
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(
+            f"cannot set field '{name}'; the config snapshot is read-only"
+        )
+
+    def __delattr__(self, name: str):
+        raise AttributeError(
+            f"cannot delete field '{name}'; the config snapshot is read-only"
+        )
+
+    def to_dict(self) -> dict:
+        """Return a dictionary with the field values of the snapshot."""
+        return self._cfg.to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConfigSnapshot):
+            return NotImplemented
+        return type(self._cfg) is type(other._cfg) and (
+            self._cfg._values is other._cfg._values
+            or dict(self._cfg._values) == dict(other._cfg._values)
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            values = tuple(self._cfg._values.values())
+            object.__setattr__(self, "_hash", hash((type(self._cfg), values)))
+        return self._hash
+
+    def __dir__(self):
+        cfg = self._cfg
+        names = cfg._metadata.keys() | cfg._computed_values.keys()
+        return sorted(names | cfg._lazy_computed.keys())
+
+    def __repr__(self):
+        items = [f"{k}={getattr(self._cfg, k)!r}" for k in self._cfg._metadata]
+        return f"<ConfigSnapshot: {', '.join(items)}>"
+
+
 # === Module functions ===
 
+_MISSING = object()  # sentinel: no committed value present
+_DEFERRED = object()  # sentinel: the validation plan is compiled on first use
+_NO_GRAPH = DependencyGraph((), {})  # the graph of a config without functions
+
+
+def _is_unchanged(old: Any, new: Any) -> bool:
+    """Return True if `new` does not change the committed value `old`.
+
+    Only immutable scalars (None, bool, int, float, str, bytes) and tuples of them
+    can be unchanged. Any other value counts as changed, also the same object: a
+    container changed in place and assigned again must be validated again.
+    """
+    return type(old) is type(new) and _is_scalar(old) and old == new
+
+
+def _equal_values(old: Any, new: Any) -> bool:
+    """Return True if two values of the same type compare equal.
+
+    Used for values that can not be aliased to committed ones, e.g. the values of
+    two reads of a source. Values whose equality is not a plain bool (e.g.
+    elementwise comparisons) are not equal.
+    """
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    try:
+        return bool(old == new)
+    except Exception:
+        return False
+
+
+_SCALAR_TYPES = frozenset((type(None), bool, int, float, str, bytes))
+
+
+def _is_scalar(value: Any) -> bool:
+    """Return True for an immutable scalar, or a tuple of immutable scalars."""
+    if type(value) is tuple:
+        return all(_is_scalar(v) for v in value)
+    return type(value) in _SCALAR_TYPES
+
+
+class InvertedBool:
+    """Computed function returning the inverted value of a bool field.
+
+    Created once per bool typed option when the schema is compiled; see
+    `Config._create_inverted_bool_properties()`.
+    """
+
+    __slots__ = ("field_name",)
+
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+
+    def __call__(self, value: Any, cfg: ConfigView) -> bool:
+        return not value
+
 
 def make_getter(attr):
     def getter(self):
-        return self._computed_values[attr]
+        try:
+            return self._state.computed_values[attr]
+        except KeyError:
+            return self._get_lazy(attr)  # not computed yet, or invalidated
 
     return getter
 
@@ -3,13 +3,13 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from types import SimpleNamespace
 from typing import Any, Callable, TYPE_CHECKING
 
 from ..exceptions import ConfigError, ConfigValidationError
 
 if TYPE_CHECKING:
     from ..configlib import Option
+    from .view import ConfigView
 
 # -----------------------------------------------------------------------------
 #  abstract base-class: Validator(ABC)
@@ -25,6 +25,10 @@ class Validator(ABC):
     validated. If these checks fail, a ConfigError is raised.
 
     Each subclass must implement the `_init_validate` and `_validate_value` methods.
+
+    A validator holds no state of a validation call: the value and the config view
+    are passed as arguments. Therefore the validators, which are shared by all
+    config instances of a compiled schema, can be called from several threads.
     """
 
     option: Option
@@ -32,9 +36,8 @@ class Validator(ABC):
     def __post_init__(self):
         self._validator(self._init_validate)
 
-    def __call__(self, value: Any, cfg: SimpleNamespace):
-        self.cfg = cfg
-        result = self._validator(self._validate_value, value=value)
+    def __call__(self, value: Any, cfg: ConfigView | None = None):
+        result = self._validator(self._validate_value, value=value, cfg=cfg)
 
         return result
 
@@ -42,30 +45,53 @@ class Validator(ABC):
         try:
             result = fn(**kwargs)
         except Exception as e:
-            if isinstance(e, ConfigError):
-                # Re-raise with amended message, preserving subclass
-                new_exc = type(e)(f"{self.__class__.__name__}: {e}")
-                raise new_exc from e
-            else:
-                # Wrap all other exceptions in ConfigValidationError
-                raise ConfigValidationError(
-                    f"{self.__class__.__name__} [{type(e).__name__}]: {e}"
-                ) from e
+            raise self._amend_error(e) from e
 
         return result
 
+    @classmethod
+    def _amend_error(cls, e: Exception) -> ConfigError:
+        """Return the exception to raise for an exception raised by a check.
+
+        A class method, so that compiled checks do not hold on to the validator.
+        """
+        if isinstance(e, ConfigError):
+            # Re-raise with amended message, preserving subclass
+            return type(e)(f"{cls.__name__}: {e}")
+        # Wrap all other exceptions in ConfigValidationError
+        return ConfigValidationError(f"{cls.__name__} [{type(e).__name__}]: {e}")
+
+    def compile(self) -> Callable[[Any], None] | None:
+        """Return a specialised check function for the values of the option.
+
+        The returned function takes only the value to check; it raises the same
+        exception types and messages as calling the validator does. Subclasses
+        return `None` when their check can never fail for the option, so that it
+        can be left out of the validation plan of the option.
+
+        The default implementation delegates to `_validate_value`.
+        """
+
+        def check(value: Any):
+            self._validator(self._validate_value, value=value)
+
+        return check
+
     @abstractmethod
     # def _init_validate(self, **kwargs):
     def _init_validate(self):  # pragma: no cover
         pass
 
     @abstractmethod
-    def _validate_value(self, value: Any) -> None | dict[str, Any]:  # pragma: no cover
+    def _validate_value(
+        self, value: Any, cfg: ConfigView | None = None
+    ) -> None | dict[str, Any]:  # pragma: no cover
         """
         Validate the given value.
 
         Args:
             value (Any): The value to validate.
+            cfg (ConfigView | None): The read-only view on the config values.
 
         Returns:
             None | dict[str, Any]: Depending on the subclass.
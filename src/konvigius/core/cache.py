@@ -0,0 +1,297 @@
+# src/konvigius/core/cache.py
+"""Provides the cache of compiled schemas used by `Config.config_factory()`.
+
+Compiling a schema creates the Option objects, validates their metadata, creates the
+config class with its properties and validates the default values. The result only
+depends on the schema and the factory arguments, so it is cached under a fingerprint
+of these. A repeated factory call with an equal schema just creates a new instance
+of the cached class, holding the validated default values.
+
+The fingerprint of a schema is built from the values of all its Schema fields:
+
+- tuples are fingerprinted element by element;
+- other hashable values, including functions, are used as they are;
+- unhashable values, e.g. a list default, are represented by their identity.
+
+Mutable values are keyed by identity because the instances created from a cached
+schema share its default values: two schemas with equal but distinct list defaults
+must not give configs holding the same list. The factory arguments are the
+exception: a `help_map` is keyed by its contents.
+
+Each value is paired with its type, so that e.g. a default of `1` and a default of
+`True` give different fingerprints.
+
+A `domain_file` is also keyed on the version of the file (its inode, size and
+modification time, see `file_version()`): a schema whose domain file was replaced
+compiles to a new class, validating against the new file.
+
+This fingerprint is only valid within one process: functions are compared by
+identity. The on-disk cache of loaded configurations (`DiskCache`, see
+`Config.load()`) uses `portable_fingerprint()` instead, which describes functions
+by their qualified name, code, closure and the globals they read, and other values
+by their repr.
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+import tempfile
+import types
+from collections import OrderedDict
+from dataclasses import fields
+from threading import Lock
+from typing import Any, Hashable, Iterable
+
+from .types import Schema
+
+
+def freeze(value: Any) -> Hashable:
+    """Return a hashable representation of a value, see the module docstring.
+
+    Also used to key other caches on constraint values, e.g. `compile_plan()`.
+    """
+    if type(value) is tuple:
+        return (tuple, tuple(freeze(v) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), _Identity(value))
+    return (type(value), value)
+
+
+class _Identity:
+    """Hashable reference to a value, equal only to a reference to the same value.
+
+    The value is kept alive by the reference, so its id is never reused while the
+    key is cached.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def schema_fingerprint(schema: Iterable[Schema], **settings: Any) -> Hashable:
+    """Return a hashable fingerprint of a schema and the factory arguments.
+
+    Args:
+        schema (Iterable[Schema]): The Schema objects.
+        **settings (Any): The other arguments the compiled schema depends on.
+
+    Returns:
+        Hashable: Equal fingerprints for schemas that compile to the same config.
+    """
+    entries = tuple(
+        tuple(freeze(getattr(entry, f.name)) for f in fields(entry))
+        + (file_version(entry.domain_file),)
+        for entry in schema
+    )
+    return entries, tuple(
+        (k, tuple(v.items()) if isinstance(v, dict) else freeze(v))
+        for k, v in sorted(settings.items())
+    )
+
+
+def file_version(path: Any) -> tuple[int, int, int] | None:
+    """Return the inode, size and modification time of a file, or None.
+
+    Args:
+        path (Any): A path, an object with a `path` attribute (e.g. a
+            `DomainFile`), or None.
+
+    Returns:
+        tuple[int, int, int] | None: None if there is no path or the file can
+            not be read; compiling the schema reports the error.
+    """
+    if path is None:
+        return None
+    try:
+        stat = os.stat(getattr(path, "path", path))
+    except (OSError, TypeError):
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def portable_fingerprint(schema: Iterable[Schema], **settings: Any) -> bytes:
+    """Return a fingerprint of a schema and the factory arguments for any process.
+
+    Args:
+        schema (Iterable[Schema]): The Schema objects.
+        **settings (Any): The other arguments the compiled schema depends on.
+
+    Returns:
+        bytes: A SHA-256 digest; a value whose repr differs per process (e.g. an
+            object with the default repr) gives a different digest each time.
+    """
+    digest = hashlib.sha256()
+    for entry in schema:
+        for f in fields(entry):
+            digest.update(portable_repr(getattr(entry, f.name)).encode())
+        digest.update(b"\0")
+    for key, value in sorted(settings.items()):
+        digest.update(f"{key}={portable_repr(value)}".encode())
+    return digest.digest()
+
+
+def portable_repr(value: Any) -> str:
+    """Return a repr of a value that does not depend on the process.
+
+    A function is described by its qualified name, code, defaults, closure and
+    attributes, and by the module globals its code (or the code of its nested
+    functions) reads; functions among these globals are described the same way.
+    """
+    return _portable_repr(value, set())
+
+
+def _portable_repr(value: Any, seen: set[int]) -> str:
+    """Return the portable repr; `seen` holds the ids of the functions described."""
+    if isinstance(value, types.FunctionType):
+        name = f"fn {value.__module__}.{value.__qualname__}"
+        if id(value) in seen:  # recursion
+            return name
+        seen.add(id(value))
+        closure = tuple(cell.cell_contents for cell in value.__closure__ or ())
+        namespace = value.__globals__
+        global_values = {
+            name: namespace[name]
+            for name in sorted(_global_names(value.__code__))
+            if name in namespace
+        }
+        return (
+            f"{name}({_portable_code(value.__code__, seen)},"
+            f" {_portable_repr(value.__defaults__, seen)},"
+            f" {_portable_repr(closure, seen)}, {_portable_repr(vars(value), seen)},"
+            f" {_portable_repr(global_values, seen)})"
+        )
+    if isinstance(value, types.ModuleType):
+        return f"module {value.__name__}"
+    if isinstance(value, (type, types.BuiltinFunctionType)):
+        return f"{type(value).__name__} {value.__module__}.{value.__qualname__}"
+    if isinstance(value, (tuple, list)):
+        items = ", ".join(_portable_repr(v, seen) for v in value)
+        return f"{type(value).__name__}({items})"
+    if isinstance(value, (set, frozenset)):
+        items = ", ".join(sorted(_portable_repr(v, seen) for v in value))
+        return f"{type(value).__name__}({items})"
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{_portable_repr(k, seen)}: {_portable_repr(v, seen)}"
+            for k, v in value.items()
+        )
+        return f"{type(value).__name__}({items})"
+    return f"{type(value).__qualname__} {value!r}"
+
+
+def _portable_code(code: types.CodeType, seen: set[int]) -> str:
+    consts = ", ".join(
+        _portable_code(c, seen)
+        if isinstance(c, types.CodeType)
+        else _portable_repr(c, seen)
+        for c in code.co_consts
+    )
+    return f"{code.co_code.hex()} [{consts}] {code.co_names}"
+
+
+def _global_names(code: types.CodeType) -> set[str]:
+    """Return the names a code object and its nested code objects may read."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+class SchemaCache:
+    """A thread-safe, size-bounded cache; the least recently used entry is evicted."""
+
+    def __init__(self, maxsize: int = 128):
+        """Create an empty cache holding at most `maxsize` entries."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for the key, or None if not cached."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Cache a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache:
+    """A cache of pickled values in a directory, one file per key.
+
+    Files are written atomically: the value is pickled to a temporary file in the
+    same directory, which then replaces the cache file. Concurrent processes
+    therefore never read a partly written file. The files are unpickled, so the
+    directory must only be writable by the users of the cache.
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, directory: str | os.PathLike):
+        """Create the cache; the directory is created on the first `put()`."""
+        self.directory = os.fspath(directory)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for the key, or None if not cached or unreadable."""
+        try:
+            with open(self._path(key), "rb") as fp:
+                return pickle.load(fp)
+        except Exception:  # missing, corrupt or outdated: a miss
+            return None
+
+    def put(self, key: str, value: Any) -> bool:
+        """Cache a value.
+
+        Returns:
+            bool: False if the value can not be pickled or the file not written.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # e.g. a lambda among the values
+            return False
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    fp.write(data)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            return False
+        return True
+
+
+# === END ===
@@ -0,0 +1,146 @@
+# src/konvigius/core/changes.py
+"""Provides the change set returned by a commit and the index of change subscribers.
+
+A commit that publishes a new version returns a `ChangeSet` holding the old and the
+new value of every field and every (eagerly) computed field it changed. Lazy
+computed fields are computed when they are read, so they are not part of it.
+
+Callbacks registered with `Config.subscribe()` are kept in a `SubscriberIndex`, keyed
+by field name. After a commit only the callbacks of the changed fields are looked
+up, and each of them is called once with the change set, also when it subscribed to
+several changed fields. The callbacks are held by weak reference: a subscription
+ends when its callback, or the object of a bound method, is garbage collected.
+
+The callbacks run after the new version is published, so an exception raised by
+one can not undo the commit. It is passed to the `on_error` handler of the
+subscription, or logged to the "konvigius" logger, and the other callbacks are
+still called.
+"""
+
+from __future__ import annotations
+import logging
+from dataclasses import dataclass, field
+from inspect import ismethod
+from threading import Lock
+from typing import Any, Callable, Iterable, Iterator
+from weakref import WeakMethod, ref
+
+ChangeCallback = Callable[["ChangeSet"], Any]
+ErrorHandler = Callable[[Exception], Any]
+
+_log = logging.getLogger("konvigius")
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """The fields changed by one commit, with their old and new values.
+
+    Attributes:
+        version (int): The version published by the commit.
+        fields (dict[str, tuple[Any, Any]]): (old, new) per changed field.
+        computed (dict[str, tuple[Any, Any]]): (old, new) per changed computed field.
+    """
+
+    version: int
+    fields: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    computed: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.fields or self.computed)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.fields or name in self.computed
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.fields
+        yield from self.computed
+
+    def __getitem__(self, name: str) -> tuple[Any, Any]:
+        """Return (old, new) of a changed field or computed field."""
+        if name in self.fields:
+            return self.fields[name]
+        return self.computed[name]
+
+
+class SubscriberIndex:
+    """Thread-safe index of the weakly held change callbacks per field name."""
+
+    __slots__ = ("_handlers", "_lock")
+
+    def __init__(self):
+        # field -> the callbacks in subscription order, with their error handler
+        self._handlers: dict[str, dict[ref, ErrorHandler | None]] = {}
+        self._lock = Lock()
+
+    def add(
+        self,
+        names: Iterable[str],
+        callback: ChangeCallback,
+        on_error: ErrorHandler | None = None,
+    ):
+        """Subscribe a callback to the fields; a callback is added once per field."""
+        handler = WeakMethod(callback) if ismethod(callback) else ref(callback)
+        with self._lock:
+            for name in names:
+                self._handlers.setdefault(name, {})[handler] = on_error
+
+    def remove(self, callback: ChangeCallback, names: Iterable[str] | None = None):
+        """Unsubscribe a callback from the fields, or from all fields if None."""
+        handler = WeakMethod(callback) if ismethod(callback) else ref(callback)
+        with self._lock:
+            for name in list(self._handlers) if names is None else names:
+                handlers = self._handlers.get(name)
+                if handlers is not None:
+                    handlers.pop(handler, None)
+                    if not handlers:
+                        del self._handlers[name]
+
+    def callbacks(
+        self, names: Iterable[str]
+    ) -> list[tuple[ChangeCallback, ErrorHandler | None]]:
+        """Return the live callbacks of the fields, each once, in subscription order.
+
+        Each callback is paired with its error handler. The references of
+        collected callbacks are removed on the way.
+        """
+        found: dict[ref, ErrorHandler | None] = {}
+        with self._lock:
+            for name in names:
+                handlers = self._handlers.get(name)
+                if not handlers:
+                    continue
+                for handler, on_error in list(handlers.items()):
+                    if handler() is None:
+                        del handlers[handler]
+                    else:
+                        found[handler] = on_error
+        callbacks = [(handler(), on_error) for handler, on_error in found.items()]
+        return [pair for pair in callbacks if pair[0] is not None]
+
+    def notify(self, changes: ChangeSet):
+        """Call the callbacks of the changed fields; never raises.
+
+        An exception of a callback is passed to its error handler, or logged if
+        it has none; an exception of an error handler is logged.
+        """
+        for callback, on_error in self.callbacks(changes):
+            try:
+                callback(changes)
+            except Exception as e:
+                if on_error is None:
+                    _log.exception(
+                        "change callback %r failed on version %d",
+                        callback,
+                        changes.version,
+                    )
+                    continue
+                try:
+                    on_error(e)
+                except Exception:
+                    _log.exception("error handler %r failed", on_error)
+
+    def __len__(self):
+        return sum(len(handlers) for handlers in self._handlers.values())
+
+
+# === END ===
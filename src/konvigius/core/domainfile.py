@@ -0,0 +1,125 @@
+# src/konvigius/core/domainfile.py
+"""Provides the memory-mapped domain files of `Schema(domain_file=...)`.
+
+A domain given as a tuple is turned into a set by every process that compiles the
+schema. For very large domains, e.g. millions of tenant IDs, a domain file is used
+instead: a file with one value per record, sorted in byte order (`LC_ALL=C sort`).
+The file is memory-mapped and searched with a binary search, so no values are
+loaded into memory, and all processes share the pages of the file through the
+page cache of the operating system.
+
+The records are either lines (newline-delimited, "\\r\\n" is accepted) or have a
+fixed width in bytes; fixed-width records are padded with spaces or NUL bytes and
+may end with a newline. Values are compared as text: a value is looked up by its
+`str()`, encoded as UTF-8, so `13335` matches the record "13335". Note that numbers
+must therefore be sorted as text as well.
+"""
+
+from __future__ import annotations
+import mmap
+import os
+from functools import lru_cache
+from typing import Any
+
+_PADDING = b" \0\r\n"
+
+
+class DomainFile:
+    """A sorted file of allowed values, supporting `value in domain_file`.
+
+    The membership test costs O(log n) record reads. Use `open()` to share one
+    memory map per file within a process.
+
+    Attributes:
+        path (str): The file.
+        width (int | None): The record width in bytes, or None for lines.
+    """
+
+    def __init__(self, path: str | os.PathLike, width: int | None = None):
+        """Map the file into memory.
+
+        Args:
+            path (str | PathLike): The sorted file.
+            width (int | None): The record width in bytes, including a newline if
+                the records end with one; None for newline-delimited records.
+
+        Raises:
+            OSError: If the file can not be read.
+            ValueError: If the file is empty, or its size is not a multiple of the
+                record width.
+        """
+        self.path = os.fspath(path)
+        self.width = width
+        if width is not None and (type(width) is not int or width < 1):
+            raise ValueError(f"record width must be a positive int; got {width!r}")
+        with open(self.path, "rb") as fp:
+            size = os.fstat(fp.fileno()).st_size
+            if size == 0:
+                raise ValueError(f"domain file {self.path} is empty")
+            if width is not None and size % width:
+                raise ValueError(
+                    f"size of domain file {self.path} ({size}) "
+                    f"is not a multiple of the record width {width}"
+                )
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._size = size
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, width: int | None = None) -> DomainFile:
+        """Return the shared DomainFile of a file, mapped once per file version.
+
+        A file that was replaced or changed (other inode, size or modification
+        time) is mapped again.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        return _open(path, width, (stat.st_ino, stat.st_size, stat.st_mtime_ns))
+
+    def __contains__(self, value: Any) -> bool:
+        key = value if isinstance(value, bytes) else str(value).encode("utf-8")
+        if self.width is None:
+            return self._search_lines(key)
+        return self._search_records(key)
+
+    def _search_lines(self, key: bytes) -> bool:
+        data = self._map
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b"\n", 0, mid) + 1
+            end = data.find(b"\n", mid)
+            if end < 0:
+                end = self._size
+            line = data[start:end].rstrip(b"\r")
+            if line == key:
+                return True
+            if line < key:
+                lo = end + 1
+            else:
+                hi = start
+        return False
+
+    def _search_records(self, key: bytes) -> bool:
+        data, width = self._map, self.width
+        lo, hi = 0, self._size // width
+        while lo < hi:
+            mid = (lo + hi) // 2
+            record = data[mid * width : (mid + 1) * width].rstrip(_PADDING)
+            if record == key:
+                return True
+            if record < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return False
+
+    def __repr__(self):
+        return f"DomainFile({self.path!r}, width={self.width!r})"
+
+
+@lru_cache(maxsize=64)
+def _open(path: str, width: int | None, version: tuple) -> DomainFile:
+    return DomainFile(path, width)
+
+
+# === END ===
@@ -0,0 +1,189 @@
+# src/konvigius/core/graph.py
+"""Provides the field dependency graph of the user functions of a Config object.
+
+Custom validators (`fn_validator`) and computed functions (`fn_computed`) receive the
+config namespace and may read any other field. The fields they actually read are
+recorded while they run (see `ConfigView.recording()`) and kept in a
+`DependencyGraph`. A commit uses the graph to rerun only the functions of the options
+whose inputs changed, in topological order: an option that reads a computed field
+runs after the option that produces it.
+
+The recorded reads are the reads of the most recent run of the functions. Because
+the functions are rerun whenever one of these inputs changes, and re-recorded when
+they run, conditional reads are handled as well.
+"""
+
+from __future__ import annotations
+import heapq
+from typing import Iterable
+
+from .view import ANY_FIELD
+
+
+class DependencyGraph:
+    """Records which fields the user functions of each option read.
+
+    The nodes of the graph are the names of the options that have custom validators
+    or computed functions. Each node depends on its own field, on the fields its
+    functions read, and on the explicit `depends_on` fields of the option. A node
+    without recorded reads, or one that read a whole value store, depends on all
+    fields.
+    """
+
+    __slots__ = (
+        "_nodes",
+        "_producers",
+        "_explicit",
+        "_reads",
+        "_readers",
+        "_unknown",
+        "_ranks",
+    )
+
+    def __init__(
+        self,
+        nodes: Iterable[str],
+        producers: dict[str, str],
+        explicit: dict[str, tuple[str, ...]] | None = None,
+    ):
+        """Create a graph in which every node still depends on all fields.
+
+        Args:
+            nodes (Iterable[str]): The option names, in schema order.
+            producers (dict[str, str]): Maps computed field names to the name of
+                the option that computes them.
+            explicit (dict[str, tuple[str, ...]] | None): The `depends_on` field
+                names per option name.
+        """
+        self._nodes: dict[str, int] = {name: i for i, name in enumerate(nodes)}
+        self._producers = producers
+        self._explicit = explicit or {}
+        self._reads: dict[str, frozenset[str]] = {}
+        self._readers: dict[str, set[str]] = {}
+        self._unknown: set[str] = set(self._nodes)  # nodes without recorded reads
+        self._ranks: dict[str, int] | None = None
+
+    def copy(self) -> DependencyGraph:
+        """Return a copy that can be updated independently."""
+        graph = DependencyGraph((), self._producers, self._explicit)
+        graph._nodes = self._nodes
+        graph._reads = dict(self._reads)
+        graph._readers = {name: set(r) for name, r in self._readers.items()}
+        graph._unknown = set(self._unknown)
+        graph._ranks = self._ranks
+        return graph
+
+    def reads(self, node: str) -> frozenset[str] | None:
+        """Return the fields the node depends on, or None if unknown."""
+        return self._reads.get(node)
+
+    def _normalize(self, node: str, reads: set[str]) -> frozenset[str]:
+        """Return the dependencies of a node for the given reads of its functions."""
+        return frozenset(reads).union(self._explicit.get(node, ())).difference((node,))
+
+    def update(self, node: str, reads: set[str]):
+        """Replace the recorded reads of a node.
+
+        Args:
+            node (str): The option name.
+            reads (set[str]): The names of the fields read by its functions.
+        """
+        if node not in self._nodes:
+            return
+        new = self._normalize(node, reads)
+        old = self._reads.get(node, frozenset())
+        if new == old and node in self._reads:
+            return
+        for name in old - new:
+            self._readers[name].discard(node)
+        for name in new - old:
+            self._readers.setdefault(name, set()).add(node)
+        self._reads[node] = new
+        self._unknown.discard(node)
+        self._ranks = None  # edges changed; recompute the order when needed
+
+    def updated(self, reads: dict[str, set[str]]) -> DependencyGraph:
+        """Return the graph with the recorded reads of the given nodes replaced.
+
+        The graph itself is not changed; it is returned as is when none of the
+        reads differ from the recorded ones, otherwise an updated copy is
+        returned. Config instances can therefore share a graph.
+
+        Args:
+            reads (dict[str, set[str]]): The names of the fields read per node.
+
+        Returns:
+            DependencyGraph: This graph, or an updated copy.
+        """
+        changes = {
+            node: names_read
+            for node, names_read in reads.items()
+            if node in self._nodes
+            and self._reads.get(node) != self._normalize(node, names_read)
+        }
+        if not changes:
+            return self
+        graph = self.copy()
+        for node, names_read in changes.items():
+            graph.update(node, names_read)
+        return graph
+
+    def affected(self, names: Iterable[str]) -> set[str]:
+        """Return the nodes that must rerun when the given fields have changed."""
+        result = set(self._unknown)
+        result.update(self._readers.get(ANY_FIELD, ()))
+        for name in names:
+            if name in self._nodes:
+                result.add(name)
+            result.update(self._readers.get(name, ()))
+        return result
+
+    def rank(self, node: str) -> int:
+        """Return the position of the node in the topological order."""
+        ranks = self._ranks if self._ranks is not None else self._compute_ranks()
+        return ranks[node]
+
+    def ordered(self, nodes: Iterable[str]) -> list[str]:
+        """Return the given nodes in topological order."""
+        ranks = self._ranks if self._ranks is not None else self._compute_ranks()
+        return sorted(nodes, key=ranks.__getitem__)
+
+    def _compute_ranks(self) -> dict[str, int]:
+        """Sort all nodes topologically; producers before the nodes reading them.
+
+        Ties, and the nodes of dependency cycles, keep the schema order.
+        """
+        nodes = self._nodes
+        successors: dict[str, set[str]] = {n: set() for n in nodes}
+        in_degree = dict.fromkeys(nodes, 0)
+        for node in nodes:
+            reads = self._reads.get(node)
+            if reads is None or ANY_FIELD in reads:
+                reads = self._producers.keys()
+            for name in reads:
+                producer = self._producers.get(name)
+                if producer is not None and producer != node:
+                    if node not in successors[producer]:
+                        successors[producer].add(node)
+                        in_degree[node] += 1
+
+        ready = [(i, n) for n, i in nodes.items() if in_degree[n] == 0]
+        heapq.heapify(ready)
+        order: list[str] = []
+        while ready:
+            _, node = heapq.heappop(ready)
+            order.append(node)
+            for succ in successors[node]:
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    heapq.heappush(ready, (nodes[succ], succ))
+
+        if len(order) < len(nodes):  # cycles: remaining nodes in schema order
+            done = set(order)
+            order.extend(n for n in nodes if n not in done)
+
+        self._ranks = {node: rank for rank, node in enumerate(order)}
+        return self._ranks
+
+
+# === END ===
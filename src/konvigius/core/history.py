@@ -0,0 +1,58 @@
+# src/konvigius/core/history.py
+"""Provides the bounded undo/redo history of a Config object.
+
+The history keeps the field diffs of the commits, not copies of the config: every
+entry is a `ChangeSet` holding the old and new value of the fields a commit changed,
+so the memory used grows with the number of changed values. Both stacks are ring
+buffers of a fixed length; when full, the oldest entry is dropped.
+
+Undoing an entry commits its old values, redoing it commits its new values. These
+commits are not recorded as new entries; a regular commit clears the redo stack.
+"""
+
+from __future__ import annotations
+from collections import deque
+
+from .changes import ChangeSet
+
+
+class History:
+    """The undo and redo stacks of the committed field diffs.
+
+    Attributes:
+        undo (deque[ChangeSet]): The entries that can be undone, newest last.
+        redo (deque[ChangeSet]): The undone entries that can be redone, last
+            undone last.
+    """
+
+    __slots__ = ("undo", "redo")
+
+    def __init__(self, maxlen: int):
+        """Create an empty history of at most `maxlen` entries per stack."""
+        if maxlen < 1:
+            raise ValueError(f"history length must be at least 1, got {maxlen}")
+        self.undo: deque[ChangeSet] = deque(maxlen=maxlen)
+        self.redo: deque[ChangeSet] = deque(maxlen=maxlen)
+
+    @property
+    def maxlen(self) -> int:
+        return self.undo.maxlen  # type: ignore[return-value]
+
+    def record(self, changes: ChangeSet):
+        """Add the field diff of a regular commit; the redo stack is cleared."""
+        self.undo.append(ChangeSet(changes.version, changes.fields))
+        self.redo.clear()
+
+    def versions(self) -> set[int]:
+        """Return the versions that can be reverted to with `Config.revert_to()`.
+
+        These are the versions published by the entries, and the version before
+        the oldest entry.
+        """
+        versions = {entry.version for entry in self.undo}
+        if self.undo:
+            versions.add(self.undo[0].version - 1)
+        return versions
+
+
+# === END ===
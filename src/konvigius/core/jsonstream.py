@@ -0,0 +1,169 @@
+# src/konvigius/core/jsonstream.py
+"""Provides an incremental reader of JSON documents, used by `JsonSource`.
+
+A `JsonStream` reads a file object in chunks and walks the document token by token.
+The caller decides per value whether to decode it (`read_value()`) or to skip it
+(`skip_value()`); a skipped value is scanned without building any Python objects,
+and the text already scanned is dropped from the buffer. Reading stops as soon as
+the caller stops asking, so the rest of the file is never read.
+"""
+
+from __future__ import annotations
+import codecs
+import json
+import re
+from typing import IO, Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURE = re.compile(r'["\[\]{}]')  # outside strings
+_STRING_END = re.compile(r'["\\]')  # inside strings
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+
+class JsonStream:
+    """Reads the tokens of a JSON document from a text or binary file object."""
+
+    def __init__(self, fileobj: IO, chunk_size: int = 65536):
+        self._file = fileobj
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.chars_read = 0  # the number of characters read from the file
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping the text before the position.
+
+        Returns:
+            bool: False at the end of the file.
+        """
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk, final=not chunk)
+        elif not chunk:
+            chunk = ""
+        if not chunk:
+            self._eof = True
+            return False
+        self.chars_read += len(chunk)
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buf, self._pos)
+
+    def peek(self) -> str:
+        """Return the next character that is not whitespace; "" at the end."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        """Consume the next character, which must be `char`."""
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def next_item(self, close: str, first: bool) -> bool:
+        """Consume the separator of the next array or object item.
+
+        Args:
+            close (str): "]" or "}".
+            first (bool): True before the first item.
+
+        Returns:
+            bool: False if the array or object ends.
+        """
+        char = self.peek()
+        if char == close:
+            self._pos += 1
+            return False
+        if not first:
+            self.expect(",")
+        return True
+
+    def read_key(self) -> str:
+        """Consume an object key and its colon."""
+        if self.peek() != '"':
+            raise self._error("Expecting property name enclosed in double quotes")
+        key = self.read_value()
+        self.expect(":")
+        return key
+
+    def read_value(self) -> Any:
+        """Decode and consume the next value."""
+        char = self.peek()
+        if char and char not in '[{"':
+            # a scalar cut by the chunk boundary may decode as another value,
+            # e.g. "1." as 1: read on until the delimiter that ends it
+            while not _SCALAR_END.search(self._buf, self._pos) and self._fill():
+                pass
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self):
+        """Consume the next value without decoding it."""
+        char = self.peek()
+        if not char:
+            raise self._error("Expecting value")
+        if char not in "[{\"":
+            self._skip(_SCALAR_END)
+            return
+        depth = 0
+        while True:
+            if self._pos >= len(self._buf):
+                raise self._error("Unexpected end of document")
+            char = self._buf[self._pos]
+            self._pos += 1
+            if char == '"':
+                self._skip_string()
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0:
+                return
+            self._skip(_STRUCTURE)
+
+    def _skip_string(self):
+        """Consume the rest of a string whose opening quote was consumed."""
+        while True:
+            self._skip(_STRING_END)
+            if self._pos >= len(self._buf):
+                raise self._error("Unterminated string")
+            char = self._buf[self._pos]
+            if char == '"':
+                self._pos += 1
+                return
+            if self._pos + 1 >= len(self._buf) and not self._fill():
+                raise self._error("Unterminated string")
+            self._pos += 2  # an escaped character
+
+    def _skip(self, pattern: re.Pattern):
+        """Move to the next match of the pattern, reading chunks as needed."""
+        while True:
+            match = pattern.search(self._buf, self._pos)
+            if match:
+                self._pos = match.start()
+                return
+            self._pos = len(self._buf)
+            if not self._fill():
+                return
+
+
+# === END ===
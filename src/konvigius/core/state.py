@@ -0,0 +1,121 @@
+# src/konvigius/core/state.py
+"""Provides the versioned state and the per-thread transaction state of a Config object.
+
+The committed state of a config object (its field values, computed values and
+dependency graph) is one immutable `ConfigState`. A commit never changes the current
+state; it publishes a new state with the next version number by replacing the
+reference to it (compare-and-set). A reader that takes the state once therefore
+always sees one complete version, also while another thread commits.
+
+The values of an open transaction are owned by the thread that made them: each
+thread has its own `TransactionState` per config object.
+
+A transaction can hold nested savepoints. Each savepoint keeps a journal with the
+previous pending value of every field first written while it is open, so creating,
+releasing and rolling back a savepoint costs O(fields written), never a copy of the
+pending values.
+"""
+
+from __future__ import annotations
+from threading import local
+from typing import Any, Mapping, NamedTuple
+
+from .graph import DependencyGraph
+
+
+class ConfigState(NamedTuple):
+    """One committed version of the state of a config object.
+
+    The dictionaries are never changed after the state is published; the only
+    exception is the caching of lazy computed values in `computed_values`.
+
+    Attributes:
+        version (int): Increased by one on every commit that changes a value.
+        values (Mapping[str, Any]): The field values.
+        computed_values (dict[str, Any]): The values of the computed fields.
+        graph (DependencyGraph): The fields read by the user functions.
+        sources (Mapping[str, str]): Where the values came from, per field that was
+            changed or loaded; a field not in it has its default value.
+    """
+
+    version: int
+    values: Mapping[str, Any]
+    computed_values: dict[str, Any]
+    graph: DependencyGraph
+    sources: Mapping[str, str]
+
+
+_UNSET = object()  # journal entry: the field had no pending value
+
+
+class TransactionState(local):
+    """The transaction of the current thread; each thread sees its own attributes.
+
+    Attributes:
+        active (bool): Whether the thread has an open transaction.
+        pending (dict[str, Any]): The values set in the open transaction.
+        savepoints (list[dict[str, Any]]): The journals of the open savepoints,
+            innermost last; the previous pending value per field written.
+        record (bool): Whether the commit is recorded in the undo history; False
+            for the commits of undo and redo.
+        sources (dict[str, str]): The origin of the pending values set by a source,
+            e.g. a file; the other values are committed with the origin "set".
+    """
+
+    def __init__(self):
+        self.active = False
+        self.pending: dict[str, Any] = {}
+        self.savepoints: list[dict[str, Any]] = []
+        self.record = True
+        self.sources: dict[str, str] = {}
+
+    def set(self, name: str, value: Any, source: str | None = None):
+        """Set a pending value, journaling the previous one in the open savepoint.
+
+        Args:
+            name (str): The field name.
+            value (Any): The new value.
+            source (str | None): Where the value came from, if not set in code.
+        """
+        if self.savepoints:
+            journal = self.savepoints[-1]
+            if name not in journal:
+                journal[name] = self.pending.get(name, _UNSET)
+        self.pending[name] = value
+        if source is not None:
+            self.sources[name] = source
+        elif self.sources:
+            self.sources.pop(name, None)
+
+    def savepoint(self):
+        """Open a savepoint."""
+        self.savepoints.append({})
+
+    def release(self):
+        """Close the innermost savepoint, keeping its values."""
+        journal = self.savepoints.pop()
+        if self.savepoints:
+            outer = self.savepoints[-1]
+            for name, previous in journal.items():
+                outer.setdefault(name, previous)
+
+    def rollback_savepoint(self):
+        """Close the innermost savepoint, restoring the values from before it."""
+        journal = self.savepoints.pop()
+        pending = self.pending
+        for name, previous in journal.items():
+            if previous is _UNSET:
+                pending.pop(name, None)
+            else:
+                pending[name] = previous
+
+    def reset(self):
+        """End the transaction, discarding the pending values and savepoints."""
+        self.active = False
+        self.pending.clear()
+        self.savepoints.clear()
+        self.record = True
+        self.sources.clear()
+
+
+# === END ===
@@ -0,0 +1,72 @@
+# src/konvigius/core/store.py
+"""Provides the slot-indexed value store of config objects created with `slots=True`.
+
+By default the committed values of a config object are kept in a dict. With
+`Config.config_factory(schema, slots=True)` the compiled class assigns every field a
+fixed slot index instead, and the values are kept in a list in that order. The
+mapping from field names to indices is shared by all instances of the class, so an
+instance only holds the list of values. The `SlotConfigField` descriptor of a field
+reads its value directly by index.
+
+A `SlotStore` is a read-only `Mapping`; everything that reads `cfg._values` works
+with either store. Like the dict store it is never changed in place after creation:
+a commit creates a new store with `replace()`.
+"""
+
+from __future__ import annotations
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+
+class SlotStore(Mapping):
+    """Read-only mapping of field names to values, backed by a list of slots."""
+
+    __slots__ = ("_index", "_slots")
+
+    def __init__(self, index: dict[str, int], slots: list[Any]):
+        """Create a store; the list of values is used, not copied.
+
+        Args:
+            index (dict[str, int]): Maps the field names to their slot index.
+            slots (list[Any]): The values, in slot order.
+        """
+        self._index = index
+        self._slots = slots
+
+    @classmethod
+    def from_mapping(cls, index: dict[str, int], values: Mapping[str, Any]) -> SlotStore:
+        """Return a store with the values of a mapping holding all fields of `index`."""
+        slots: list[Any] = [None] * len(index)
+        for name, i in index.items():
+            slots[i] = values[name]
+        return cls(index, slots)
+
+    def replace(self, changes: Mapping[str, Any]) -> SlotStore:
+        """Return a new store with the given values replaced; self is not changed."""
+        slots = self._slots.copy()
+        index = self._index
+        for name, value in changes.items():
+            slots[index[name]] = value
+        return SlotStore(index, slots)
+
+    def __getitem__(self, name: str) -> Any:
+        return self._slots[self._index[name]]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        i = self._index.get(name)
+        return default if i is None else self._slots[i]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+# === END ===
@@ -20,10 +20,13 @@ so they can be used directly as follows:
 
 """
 
+import os
 from dataclasses import dataclass, field
 from types import SimpleNamespace
 from typing import Any, Callable, Protocol, Type, runtime_checkable
 
+from .domainfile import DomainFile
+
 # -----------------------------------------------------------------------------
 # Define Protocol: ComputedFn
 # -----------------------------------------------------------------------------
@@ -77,7 +80,7 @@ class ComputedFn(Protocol):
 # -----------------------------------------------------------------------------
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Schema:
     """Defines the metadata for a single configuration option.
 
@@ -130,6 +133,12 @@ class Schema:
             A tuple of allowed values for the option.
             For example: `('admin', 'guest', 'tester')`.
 
+        domain_file (str | PathLike | DomainFile | None):
+            A file of allowed values, sorted in byte order, one per line; use a
+            `DomainFile` for fixed-width records. The file is memory-mapped and
+            searched, instead of being loaded, see `konvigius.core.domainfile`.
+            Cannot be combined with `domain`.
+
         fn_validator (Callable | tuple[Callable, ...] | None):
             A function or tuple of functions used to perform custom validation.
             Each validator may raise an exception if validation fails.
@@ -138,6 +147,13 @@ class Schema:
             A function or tuple of functions that compute additional
             configuration properties dynamically.
 
+        depends_on (str | tuple[str, ...] | None):
+            A field name or tuple of field names that the `fn_validator` and
+            `fn_computed` functions depend on, in addition to the fields they
+            read from their `cfg` argument. The fields read from `cfg` are
+            detected automatically; use this for fields that are used
+            indirectly, e.g. via a helper object.
+
         help_text (str | None):
             A short one-line help text shown in the CLI help output.
 
@@ -158,8 +174,10 @@ class Schema:
     r_min: int | None = None
     r_max: int | None = None
     domain: tuple[Any, ...] | None = None
+    domain_file: str | os.PathLike | DomainFile | None = None
     fn_validator: Callable | tuple[Callable, ...] | None = None
     fn_computed: ComputedFn | tuple[ComputedFn, ...] | None = None
+    depends_on: str | tuple[str, ...] | None = None
     help_text: str | None = None
     help_add_default: bool = True
     no_validate: bool = False
@@ -170,7 +188,9 @@ class Schema:
 # -----------------------------------------------------------------------------
 
 
-def with_field_name(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+def with_field_name(
+    name: str, *, lazy: bool = False
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator that attaches a `field_name` attribute to a function.
 
     This decorator is designed for use with the `fn_computed` attribute
@@ -178,9 +198,18 @@ def with_field_name(name: str) -> Callable[[Callable[..., Any]], Callable[..., A
     name of the configuration property that the decorated function will
     create within a `Config` object.
 
+    By default a computed field is computed on every commit that changes its
+    inputs. A *lazy* computed field is computed when it is read for the first
+    time, and the value is cached until a commit changes the source field or
+    one of the fields the function read. Use this for expensive values that
+    are not always needed.
+
     Args:
         name (str):
             The name to assign to the `field_name` attribute.
+        lazy (bool):
+            Whether the field is computed on first access (the `lazy`
+            attribute of the function).
 
     Returns:
         Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -197,6 +226,7 @@ def with_field_name(name: str) -> Callable[[Callable[..., Any]], Callable[..., A
 
     def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
         fn.field_name = name  # type: ignore[attr-defined]
+        fn.lazy = lazy  # type: ignore[attr-defined]
         return fn
 
     return decorator
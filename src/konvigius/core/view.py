@@ -0,0 +1,126 @@
+# src/konvigius/core/view.py
+"""Provides a read-only, attribute-style view on the values of a Config object.
+
+A `ConfigView` is what custom validators (`fn_validator`) and computed functions
+(`fn_computed`) receive as their `cfg` argument. Instead of copying all values into a
+new namespace for every validator call, the view chains the live dictionaries of the
+config object:
+
+    pending values  →  committed values  →  computed values
+
+The first dictionary that contains a name wins, so values mutated within a
+transaction shadow the committed ones. The view is created once per commit and
+shared by all validators of that commit.
+
+A view can also record which fields are read through it (see `recording()`); that
+is how the dependencies of the user functions are discovered.
+
+Lazy computed fields are not in the computed values until they are read; a view
+resolves them through its `fallback` function.
+"""
+
+from __future__ import annotations
+from collections import ChainMap
+from typing import Any, Callable
+
+ANY_FIELD = "*"  # recorded when a function reads a whole value store
+
+_STORES = ("_values", "_pending_values", "_computed_values")
+
+
+class ConfigView:
+    """Read-only namespace over the value stores of a Config object.
+
+    Field values are accessed as attributes, e.g. `cfg.userrole`, exactly as with
+    the config object itself. The underlying stores are available as `_values`,
+    `_pending_values` and `_computed_values`; they must be treated as read-only.
+
+    Attributes can not be set or deleted on a view.
+    """
+
+    __slots__ = ("_stores", "_chain", "_reads", "_fallback")
+
+    def __init__(
+        self,
+        values: dict[str, Any],
+        pending_values: dict[str, Any],
+        computed_values: dict[str, Any],
+        fallback: Callable[[str, ConfigView], Any] | None = None,
+    ):
+        """Create a view; no values are copied.
+
+        Args:
+            values (dict[str, Any]): The committed field values.
+            pending_values (dict[str, Any]): The field values mutated in the
+                current transaction.
+            computed_values (dict[str, Any]): The values of the computed fields.
+            fallback (Callable[[str, ConfigView], Any] | None): Called with the
+                name and the view for names not found in the stores, e.g. to
+                compute lazy computed fields. Raises KeyError for unknown names.
+        """
+        stores = dict(zip(_STORES, (values, pending_values, computed_values)))
+        setter = object.__setattr__
+        setter(self, "_stores", stores)
+        setter(self, "_chain", ChainMap(pending_values, values, computed_values))
+        setter(self, "_reads", None)
+        setter(self, "_fallback", fallback)
+
+    def recording(self, reads: set[str]) -> ConfigView:
+        """Return a view on the same stores that records the fields read through it.
+
+        The name of every field read is added to `reads`. Reading a whole store,
+        e.g. `cfg._values`, adds `ANY_FIELD` because then the fields actually used
+        are unknown.
+
+        Args:
+            reads (set[str]): The set that collects the names of the fields read.
+
+        Returns:
+            ConfigView: The recording view.
+        """
+        view = object.__new__(type(self))
+        setter = object.__setattr__
+        setter(view, "_stores", self._stores)
+        setter(view, "_chain", self._chain)
+        setter(view, "_reads", reads)
+        setter(view, "_fallback", self._fallback)
+        return view
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            value = self._chain[name]
+        except KeyError:
+            if name in self._stores:
+                value = self._stores[name]
+                name = ANY_FIELD
+            elif self._fallback is not None:
+                try:
+                    value = self._fallback(name, self)
+                except KeyError:
+                    raise AttributeError(f"config has no field '{name}'") from None
+            else:
+                raise AttributeError(f"config has no field '{name}'") from None
+        if self._reads is not None:
+            self._reads.add(name)
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"cannot set field '{name}'; the config view is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(
+            f"cannot delete field '{name}'; the config view is read-only"
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._chain
+
+    def __dir__(self):
+        return sorted(set(self._chain))
+
+    def __repr__(self):
+        items = ", ".join(f"{k}={v!r}" for k, v in sorted(self._chain.items()))
+        return f"ConfigView({items})"
+
+
+# === END ===
@@ -103,4 +103,22 @@ class ConfigInvalidFieldError(ConfigError):
         super().__init__(message, field)
 
 
+class ConfigConflictError(ConfigError):
+    """
+    Raised when a commit expects a version of the config that is no longer current.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        field: str | None = None,
+        *,
+        expected_version: int | None = None,
+        actual_version: int | None = None,
+    ):
+        super().__init__(message, field)
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+
+
 # === END ===
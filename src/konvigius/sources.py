@@ -0,0 +1,759 @@
+# src/konvigius/sources.py
+"""
+Loads the values of a config object from layered sources.
+
+`Config.load(schema, sources=[...])` merges the values of any number of sources in
+priority order: a later source overrides the values of an earlier one, and the
+schema defaults have the lowest priority. The typical order is
+
+    defaults < files < environment < command line
+
+The merged values are set in one transaction, so they are validated once, by one
+commit. The origin of every value is recorded and shown by `Config.get_source()` and
+in the Source column of `Config.inspect_vars()`. Errors raised for a loaded value are
+prefixed with its origin.
+
+Text sources, like environment variables, hold strings only. Their values are
+converted to the field type of the option by a converter that is compiled once per
+field type, see `string_converter()`.
+
+Classes:
+    Source: Base class of the sources.
+    DictSource: Values from a mapping.
+    CLISource: Values from the command line arguments.
+    EnvSource: Values from environment variables.
+    TomlSource: Values from a TOML file.
+    IniSource: Values from a section of an INI file.
+    JsonSource: Values from an object in a JSON document, read incrementally.
+    DirectorySource: Values from the fragment files in a directory, e.g. conf.d.
+
+The loaded values can be cached on disk, see `Config.load(cache_dir=...)`. The key
+of the cache is a hash of the schema and of the `fingerprint()` of every source,
+e.g. the contents of a file; a source without a fingerprint is not cached.
+
+Functions:
+    string_converter: Returns the converter of strings to a field type.
+    load_sources: Loads the values of the sources into a config object.
+    load_cache_key: Returns the key of the loaded values in the on-disk cache.
+"""
+
+from __future__ import annotations
+import configparser
+import hashlib
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Mapping
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    try:
+        import tomli as tomllib  # Python < 3.11
+    except ImportError:
+        tomllib = None
+
+from .core.cache import file_version, portable_fingerprint, portable_repr
+from .core.jsonstream import JsonStream
+from .exceptions import ConfigError, ConfigInvalidFieldError, ConfigTypeError
+
+if TYPE_CHECKING:  # pragma: no cover
+    import argparse
+    from .configlib import Config
+
+
+class Source(ABC):
+    """Base class of the sources of `Config.load()`.
+
+    A subclass implements `read()`, and `origin()` when its values have a more
+    precise origin than the name of the source, e.g. a line number.
+
+    Attributes:
+        name (str): Describes the source, e.g. a file name.
+    """
+
+    name = "source"
+
+    @abstractmethod
+    def read(self, cfg: Config) -> Mapping[str, Any]:
+        """Return the values of the source, keyed by field name.
+
+        Args:
+            cfg (Config): The config object the values are loaded into; sources
+                use its metadata, e.g. the field types.
+        """
+
+    def origin(self, name: str) -> str:
+        """Return where the value of a field came from."""
+        return self.name
+
+    def watched_paths(self) -> tuple[str, ...]:
+        """Return the files or directories to watch for changes of the values.
+
+        Used by `ConfigWatcher`; a source without paths is read only once.
+        """
+        return ()
+
+    def fingerprint(self) -> bytes | None:
+        """Return bytes that change whenever the values of the source change.
+
+        Used as part of the key of the on-disk cache of `Config.load()`; None,
+        the default, means that the values of the source can not be cached.
+        """
+        return None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class DictSource(Source):
+    """Values from a mapping, e.g. parsed from a JSON or YAML document."""
+
+    def __init__(self, values: Mapping[str, Any], name: str = "dict"):
+        self.values = values
+        self.name = name
+
+    def read(self, cfg: Config) -> Mapping[str, Any]:
+        return self.values
+
+    def fingerprint(self) -> bytes | None:
+        return portable_repr(self.values).encode()
+
+
+class CLISource(Source):
+    """Values from the command line arguments, see `cli_parser`.
+
+    Only the options given on the command line are values of this source. After
+    `read()`, `parser` and `parsed_args` hold the parser and its result. The
+    values are never cached on disk: parsing the arguments may print the help.
+    """
+
+    name = "cli"
+
+    def __init__(
+        self, cli_args: list[Any] | None = None, parser_args: list[dict] | None = None
+    ):
+        """Create the source.
+
+        Args:
+            cli_args (list | None): The arguments; `sys.argv[1:]` if None.
+            parser_args (list[dict] | None): The argument definitions, see
+                `cli_parser.create_args_from_cfg()`.
+        """
+        self.cli_args = cli_args
+        self.parser_args = parser_args
+        self.parser: argparse.ArgumentParser | None = None
+        self.parsed_args: argparse.Namespace | None = None
+
+    def read(self, cfg: Config) -> Mapping[str, Any]:
+        from .cli_parser import parse_args
+
+        self.parser, self.parsed_args, values = parse_args(
+            cfg, self.parser_args, self.cli_args
+        )
+        return values
+
+    def origin(self, name: str) -> str:
+        return f"cli --{name.replace('_', '-')}"
+
+
+class EnvSource(Source):
+    """Values from environment variables.
+
+    The variable of a field is the prefix followed by the field name in upper
+    case, e.g. `APP_TIMEOUT` for the field `timeout` and prefix `APP_`. The
+    environment is scanned once per `read()`; the values are converted to the
+    field types, see `string_converter()`.
+    """
+
+    def __init__(self, prefix: str = "", environ: Mapping[str, str] | None = None):
+        """Create the source.
+
+        Args:
+            prefix (str): The prefix of the variable names.
+            environ (Mapping[str, str] | None): The variables; `os.environ` if None.
+        """
+        self.prefix = prefix
+        self.environ = environ
+        self.name = f"env {prefix}*"
+
+    def read(self, cfg: Config) -> Mapping[str, Any]:
+        prefix = self.prefix
+        variables = {
+            prefix + name.upper(): option for name, option in cfg._metadata.items()
+        }
+        environ = os.environ if self.environ is None else self.environ
+        values = {}
+        for variable, text in environ.items():  # one scan of the environment
+            option = variables.get(variable)
+            if option is not None:
+                convert = string_converter(option.field_type)
+                values[option.name] = convert_text(
+                    convert, text, option.name, f"env {variable}"
+                )
+        return values
+
+    def origin(self, name: str) -> str:
+        return f"env {self.prefix}{name.upper()}"
+
+    def fingerprint(self) -> bytes | None:
+        environ = os.environ if self.environ is None else self.environ
+        prefix = self.prefix
+        variables = sorted(
+            item for item in environ.items() if item[0].startswith(prefix)
+        )
+        return portable_repr(variables).encode()
+
+
+class _FileSource(Source):
+    """Base class of the file sources; the origin of a value is its file and line."""
+
+    _section_re: re.Pattern  # matches a section header
+    _key_re: re.Pattern  # matches the key of a value
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        self.name = str(path)
+        self._section: str | None = None  # the section of the values
+        self._inherited: str | None = None  # the section providing defaults
+        self._lines: dict[str, int] | None = None
+        self._text = ""
+
+    def watched_paths(self) -> tuple[str, ...]:
+        return (os.fspath(self.path),)
+
+    def fingerprint(self) -> bytes | None:
+        try:
+            contents = Path(self.path).read_bytes()
+        except OSError:
+            return None  # read() reports the error
+        return f"{self._section!r} {self._inherited!r}\n".encode() + contents
+
+    def _read_text(self) -> str:
+        try:
+            self._text = Path(self.path).read_text(encoding="utf-8")
+        except OSError as e:
+            raise ConfigError(f"{self.name}: {e.strerror or e}") from e
+        self._lines = None
+        return self._text
+
+    def origin(self, name: str) -> str:
+        if self._lines is None:
+            self._lines = self._index_lines()
+        line = self._lines.get(name)
+        return self.name if line is None else f"{self.name}:{line}"
+
+    def _index_lines(self) -> dict[str, int]:
+        """Return the line numbers of the keys in the section, in one pass."""
+        lines: dict[str, int] = {}
+        inherited: dict[str, int] = {}
+        section = None
+        for number, line in enumerate(self._text.splitlines(), 1):
+            if match := self._section_re.match(line):
+                section = match.group(1).strip()
+            elif match := self._key_re.match(line):
+                if section == self._section:
+                    lines.setdefault(self._key(match.group(1)), number)
+                elif self._inherited is not None and section == self._inherited:
+                    inherited.setdefault(self._key(match.group(1)), number)
+        return {**inherited, **lines}
+
+    def _key(self, key: str) -> str:
+        return key
+
+
+class TomlSource(_FileSource):
+    """Values from a TOML file, or from one of its tables.
+
+    The sub-tables of the table are skipped, unless their name is a field name.
+    TOML has no sets and tuples; an array is converted to the set or tuple field
+    type of its option.
+    """
+
+    _section_re = re.compile(r"^\s*\[\[?([^\]]+)\]")
+    _key_re = re.compile(r"^\s*(\"[^\"]*\"|'[^']*'|[A-Za-z0-9_-]+)\s*=")
+
+    def __init__(self, path: str | os.PathLike, table: str | None = None):
+        """Create the source.
+
+        Args:
+            path (str | PathLike): The TOML file.
+            table (str | None): The dotted name of the table holding the values;
+                the top level if None.
+        """
+        super().__init__(path)
+        self.table = table
+        self._section = table
+
+    def read(self, cfg: Config) -> Mapping[str, Any]:
+        if tomllib is None:  # pragma: no cover
+            raise ConfigError("reading TOML files requires tomli on Python < 3.11")
+        text = self._read_text()
+        try:
+            values = tomllib.loads(text)
+        except tomllib.TOMLDecodeError as e:
+            raise ConfigError(f"{self.name}: {e}") from e
+        for key in self.table.split(".") if self.table else ():
+            values = values.get(key)
+            if not isinstance(values, dict):
+                raise ConfigError(f"{self.name}: no table [{self.table}]")
+
+        metadata = cfg._metadata
+        for name, value in list(values.items()):
+            option = metadata.get(name)
+            if option is None:
+                if isinstance(value, dict):
+                    del values[name]  # a sub-table, not a value
+            elif type(value) is list and option.field_type in (set, tuple):
+                values[name] = option.field_type(value)
+        return values
+
+    def _key(self, key: str) -> str:
+        return key[1:-1] if key[:1] in "\"'" else key
+
+
+class IniSource(_FileSource):
+    """Values from a section of an INI file, read with `configparser`.
+
+    The strings are converted to the field types, see `string_converter()`. Values
+    are not interpolated: "%" is an ordinary character. The keys are case
+    sensitive, like the field names.
+    """
+
+    _section_re = re.compile(r"^\[([^\]]+)\]")
+    _key_re = re.compile(r"^([^\s=:;#\[][^=:]*?)\s*[=:]")
+
+    def __init__(self, path: str | os.PathLike, section: str | None = None):
+        """Create the source.
+
+        Args:
+            path (str | PathLike): The INI file.
+            section (str | None): The section holding the values; the DEFAULT
+                section if None.
+        """
+        super().__init__(path)
+        self.section = section or configparser.DEFAULTSECT
+        self._section = self.section
+        if self.section != configparser.DEFAULTSECT:
+            self._inherited = configparser.DEFAULTSECT
+
+    def read(self, cfg: Config) -> Mapping[str, Any]:
+        parser = configparser.ConfigParser(interpolation=None)  # "%" is literal
+        parser.optionxform = str  # keep the case of the field names
+        try:
+            parser.read_string(self._read_text(), source=self.name)
+        except configparser.Error as e:
+            raise ConfigError(f"{self.name}: {e}") from e
+        if self._inherited and not parser.has_section(self.section):
+            raise ConfigError(f"{self.name}: no section [{self.section}]")
+
+        metadata = cfg._metadata
+        values = {}
+        for name, text in parser[self.section].items():
+            option = metadata.get(name)
+            if option is None:
+                values[name] = text  # rejected by load_sources()
+            else:
+                convert = string_converter(option.field_type)
+                values[name] = convert_text(convert, text, name, self.origin(name))
+        return values
+
+
+class JsonSource(Source):
+    """Values from an object in a JSON document, read incrementally.
+
+    The object is found with a JSON pointer (RFC 6901), e.g. "/services/api".
+    The document is read in chunks; the values the schema does not need are
+    skipped without decoding them, and reading stops once all fields are found.
+    The members of the object that are not fields are skipped as well. The values
+    are checked by the core validators of their options as they are decoded. The
+    values are not cached on disk, since the file object is read only once.
+
+    A `strict` source reads the whole object and keeps the members that are not
+    fields, so that loading rejects them, like the other file sources do; nested
+    objects are skipped, like the sub-tables of a TOML file.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO,
+        pointer: str = "",
+        chunk_size: int = 65536,
+        strict: bool = False,
+    ):
+        """Create the source.
+
+        Args:
+            fileobj (IO): The document, opened in text or binary mode.
+            pointer (str): The JSON pointer to the object holding the values; the
+                document itself if empty.
+            chunk_size (int): The size of the chunks read from the file.
+            strict (bool): Keep the members that are not fields, see above.
+        """
+        if pointer and not pointer.startswith("/"):
+            raise ValueError(f"JSON pointer must start with '/', got {pointer!r}")
+        self.fileobj = fileobj
+        self.pointer = pointer
+        self.chunk_size = chunk_size
+        self.strict = strict
+        self.name = str(getattr(fileobj, "name", "json"))
+        self.chars_read = 0  # the number of characters read by the last read()
+
+    def read(self, cfg: Config) -> Mapping[str, Any]:
+        stream = JsonStream(self.fileobj, self.chunk_size)
+        try:
+            self._find(stream)
+            return self._read_object(stream, cfg)
+        except json.JSONDecodeError as e:
+            raise ConfigError(f"{self.name}: {e.msg}") from e
+        finally:
+            self.chars_read = stream.chars_read
+
+    def origin(self, name: str) -> str:
+        return f"{self.name}#{self.pointer}/{name}"
+
+    def _find(self, stream: JsonStream):
+        """Move the stream to the value at the pointer."""
+        tokens = self.pointer.split("/")[1:]
+        for token in tokens:
+            token = token.replace("~1", "/").replace("~0", "~")
+            char = stream.peek()
+            if char == "{":
+                stream.expect("{")
+                first = True
+                while stream.next_item("}", first):
+                    first = False
+                    if stream.read_key() == token:
+                        break
+                    stream.skip_value()
+                else:
+                    raise ConfigError(f"{self.name}: no value at {self.pointer}")
+            elif char == "[" and token.isdigit():
+                stream.expect("[")
+                for i in range(int(token) + 1):
+                    if not stream.next_item("]", i == 0):
+                        raise ConfigError(f"{self.name}: no value at {self.pointer}")
+                    if i < int(token):
+                        stream.skip_value()
+            else:
+                raise ConfigError(f"{self.name}: no value at {self.pointer}")
+
+    def _read_object(self, stream: JsonStream, cfg: Config) -> dict[str, Any]:
+        """Decode the fields of the object at the stream position."""
+        if stream.peek() != "{":
+            raise ConfigError(f"{self.name}: no object at {self.pointer or '/'}")
+        stream.expect("{")
+        metadata = cfg._metadata
+        missing = len(metadata)
+        values: dict[str, Any] = {}
+        first = True
+        while (missing or self.strict) and stream.next_item("}", first):
+            first = False
+            name = stream.read_key()
+            option = metadata.get(name)
+            if option is None:
+                if self.strict and stream.peek() != "{":
+                    values[name] = stream.read_value()  # rejected by the loader
+                else:
+                    stream.skip_value()
+                continue
+            value = stream.read_value()
+            field_type = option.field_type
+            if type(value) is list and field_type in (set, tuple):
+                value = field_type(value)
+            check = option._compiled_check()  # None if do_validate is off
+            if check is not None:
+                try:
+                    check(value)
+                except ConfigError as e:
+                    raise type(e)(f"{self.origin(name)}: {e}", name) from e
+            if name not in values:
+                missing -= 1
+            values[name] = value
+        return values
+
+
+class DirectorySource(Source):
+    """Values from the fragment files in a directory, e.g. `/etc/app/conf.d`.
+
+    The fragments are TOML, INI or JSON files, recognised by their suffix; other
+    files are ignored. They are merged in lexical order of their names: a later
+    fragment overrides the values of an earlier one. The origin of a value is
+    the fragment, and line, that supplied it. A key that is not a field is an
+    error in every format; JSON fragments are read as a strict `JsonSource`.
+
+    The parsed values of each fragment are cached, keyed by the inode, size and
+    modification time (ns) of the file. Reading the source again, e.g. to reload
+    the configuration, only parses the fragments that changed.
+    """
+
+    suffixes = (".toml", ".ini", ".json")
+
+    def __init__(self, path: str | os.PathLike, section: str | None = None):
+        """Create the source.
+
+        Args:
+            path (str | PathLike): The directory.
+            section (str | None): The section of the INI fragments holding the
+                values; the DEFAULT section if None.
+        """
+        self.path = path
+        self.name = str(path)
+        self.section = section
+        self.parsed = 0  # the number of fragments parsed by the last read()
+        self._cache: dict[str, tuple[tuple, dict[str, Any], dict[str, str]]] = {}
+        self._origins: dict[str, str] = {}
+
+    def read(self, cfg: Config) -> Mapping[str, Any]:
+        try:
+            entries = sorted(
+                (
+                    entry
+                    for entry in os.scandir(self.path)
+                    if entry.name.endswith(self.suffixes) and entry.is_file()
+                ),
+                key=lambda entry: entry.name,
+            )
+        except OSError as e:
+            raise ConfigError(f"{self.name}: {e.strerror or e}") from e
+
+        cache = self._cache
+        values: dict[str, Any] = {}
+        origins: dict[str, str] = {}
+        self.parsed = 0
+        for entry in entries:
+            stat = entry.stat()
+            key = (stat.st_ino, stat.st_size, stat.st_mtime_ns, type(cfg))
+            cached = cache.get(entry.path)
+            if cached is None or cached[0] != key:
+                cached = (key, *self._parse(entry.path, cfg))
+                cache[entry.path] = cached
+                self.parsed += 1
+            values.update(cached[1])
+            origins.update(cached[2])
+        if len(cache) > len(entries):  # fragments were removed
+            paths = {entry.path for entry in entries}
+            for path in [path for path in cache if path not in paths]:
+                del cache[path]
+        self._origins = origins
+        return values
+
+    def _parse(
+        self, path: str, cfg: Config
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Return the values of a fragment and their origins."""
+        source: Source
+        if path.endswith(".json"):
+            with open(path, "rb") as fp:
+                source = JsonSource(fp, strict=True)
+                source.name = path
+                values = dict(source.read(cfg))
+        else:
+            if path.endswith(".toml"):
+                source = TomlSource(path)
+            else:
+                source = IniSource(path, self.section)
+            values = dict(source.read(cfg))
+        return values, {name: source.origin(name) for name in values}
+
+    def origin(self, name: str) -> str:
+        return self._origins.get(name, self.name)
+
+    def watched_paths(self) -> tuple[str, ...]:
+        return (os.fspath(self.path),)
+
+    def fingerprint(self) -> bytes | None:
+        digest = hashlib.sha256(repr(self.section).encode())
+        try:
+            for entry in sorted(os.scandir(self.path), key=lambda entry: entry.name):
+                if entry.name.endswith(self.suffixes) and entry.is_file():
+                    digest.update(f"\0{entry.name}\0".encode())
+                    digest.update(Path(entry.path).read_bytes())
+        except OSError:
+            return None  # read() reports the error
+        return digest.digest()
+
+
+_TRUE = frozenset(("1", "true", "yes", "on"))
+_FALSE = frozenset(("0", "false", "no", "off", ""))
+
+
+def _to_bool(text: str) -> bool:
+    word = text.strip().lower()
+    if word in _TRUE:
+        return True
+    if word in _FALSE:
+        return False
+    raise ValueError(f"not a bool: {text!r}")
+
+
+def _to_items(text: str) -> list[str]:
+    return [item.strip() for item in text.split(",")] if text.strip() else []
+
+
+_CONVERTERS: dict[type, Callable[[str], Any]] = {
+    bool: _to_bool,
+    int: lambda text: int(text.strip()),
+    float: lambda text: float(text.strip()),
+    str: str,
+    list: _to_items,
+    set: lambda text: set(_to_items(text)),
+    tuple: lambda text: tuple(_to_items(text)),
+}
+
+
+@lru_cache(maxsize=None)
+def string_converter(
+    field_type: type | tuple[type, ...] | None,
+) -> Callable[[str], Any]:
+    """Return the function that converts a string to a value of the field type.
+
+    - bool: "1", "true", "yes", "on" and "0", "false", "no", "off" or empty, in
+      any case;
+    - int, float: the number;
+    - list, set, tuple: the comma-separated items, as strings;
+    - str, no field type, or another type: the string itself.
+
+    For a tuple of field types the types are tried in order, `str` last.
+
+    Args:
+        field_type (type | tuple[type, ...] | None): The field type of an option.
+
+    Returns:
+        Callable[[str], Any]: The converter; it raises ValueError if the string
+            does not represent a value of the type.
+    """
+    if not isinstance(field_type, tuple):
+        return _CONVERTERS.get(field_type, str)  # type: ignore[arg-type]
+
+    converters = [
+        _CONVERTERS[ft] for ft in field_type if ft in _CONVERTERS and ft is not str
+    ]
+    if str in field_type or len(converters) < len(field_type):
+        converters.append(str)
+
+    def convert(text: str) -> Any:
+        for converter in converters[:-1]:
+            try:
+                return converter(text)
+            except ValueError:
+                pass
+        return converters[-1](text)
+
+    return convert
+
+
+def convert_text(
+    convert: Callable[[str], Any], text: str, field: str, origin: str
+) -> Any:
+    """Convert a string with a converter; errors are reported with their origin.
+
+    Raises:
+        ConfigTypeError: If the string does not represent a value of the type.
+    """
+    try:
+        return convert(text)
+    except ValueError:
+        raise ConfigTypeError(
+            f"{origin}: value can not be converted to the field type; got {text!r}",
+            field,
+        ) from None
+
+
+def load_sources(cfg: Config, sources: Iterable[Source | Mapping[str, Any]]):
+    """Load the values of the sources into a config object, in one transaction.
+
+    Args:
+        cfg (Config): The config object.
+        sources (Iterable[Source | Mapping[str, Any]]): The sources, lowest priority
+            first; a mapping is read as a `DictSource`.
+
+    Raises:
+        ConfigInvalidFieldError: If a source has a value for an unknown field.
+        ConfigError: If a value fails validation; the message starts with the
+            origin of the value.
+    """
+    metadata = cfg._metadata
+    values: dict[str, Any] = {}
+    origins: dict[str, str] = {}
+    for source in sources:
+        if not isinstance(source, Source):
+            source = DictSource(source)
+        for name, value in source.read(cfg).items():
+            if name not in metadata:
+                raise ConfigInvalidFieldError(
+                    f"{source.origin(name)}: Invalid config field: '{name}'.", name
+                )
+            values[name] = value
+            origins[name] = source.origin(name)
+
+    cfg.start_transaction()
+    tx = cfg._tx
+    for name, value in values.items():
+        tx.set(name, value, origins[name])
+    try:
+        cfg.commit_transaction()
+    except ConfigError as e:
+        raise _located_error(cfg, values, origins, e) from e
+    state = cfg._state
+    if origins.keys() - state.sources.keys():  # loaded values equal to the defaults
+        cfg._publish(state, state._replace(sources={**state.sources, **origins}))
+
+
+def load_cache_key(
+    schema: Iterable[Any], sources: Iterable[Source], **settings: Any
+) -> str | None:
+    """Return the key of the values loaded from the sources in the on-disk cache.
+
+    Args:
+        schema (Iterable[Schema]): The Schema objects.
+        sources (Iterable[Source]): The sources, lowest priority first.
+        **settings (Any): The other arguments the loaded config depends on, e.g.
+            the factory arguments.
+
+    Returns:
+        str | None: A hex digest, or None if a source has no fingerprint.
+    """
+    schema = list(schema)
+    digest = hashlib.sha256(portable_fingerprint(schema, **settings))
+    for entry in schema:  # the values were validated against these files
+        version = file_version(entry.domain_file)
+        if version is not None:
+            digest.update("{} {} {}".format(*version).encode())
+    for source in sources:
+        fingerprint = source.fingerprint()
+        if fingerprint is None:
+            return None
+        digest.update(f"\0{type(source).__qualname__} {len(fingerprint)}\0".encode())
+        digest.update(fingerprint)
+    return digest.hexdigest()
+
+
+def _located_error(
+    cfg: Config, values: dict[str, Any], origins: dict[str, str], error: ConfigError
+) -> ConfigError:
+    """Return the error of a failed load, prefixed with the origin of the value.
+
+    The commit does not tell which field failed, so on this error path only the
+    changed values are validated again to find it.
+    """
+    from .configlib import _is_unchanged
+
+    committed = cfg._values
+    changed = {
+        name: value
+        for name, value in values.items()
+        if not _is_unchanged(committed[name], value)
+    }
+    errors: dict[str, ConfigError] = {}
+    cfg._validate_changes(changed, errors=errors)
+    for name, e in errors.items():
+        if name in origins and type(e) is type(error) and str(e) == str(error):
+            return type(e)(f"{origins[name]}: {e}", name)
+    return error
+
+
+# === END ===
@@ -35,13 +35,17 @@ Classes:
     ComputedValidator: Validates user-provided function(s) and creates new properties
     that are added to the config-instance.
 
+Functions:
+    compile_plan: Combines the specialised check functions returned by the
+        `compile()` method of the validators into the validation plan of an option.
+
 Note:
     All validators are dataclasses for convenient instantiation and introspection.
 """
 from __future__ import annotations
 from collections.abc import Sized
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable
 
 from .exceptions import (
     ConfigRangeError,
@@ -51,8 +55,13 @@ from .exceptions import (
 )
 
 from .core.base import Validator
+from .core.cache import SchemaCache
+from .core.domainfile import DomainFile
 from .core.types import ComputedFn
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .core.view import ConfigView
+
 
 @dataclass
 class TypeValidator(Validator):
@@ -82,7 +91,7 @@ class TypeValidator(Validator):
             if self._type[0] is bool and self.option.default_value not in (True, False):
                 self.option.default_value = False
 
-    def _validate_value(self, value: Any):
+    def _validate_value(self, value: Any, cfg: ConfigView | None = None):
         """
         Validates whether the given `value` is of the allowed type(s).
 
@@ -98,6 +107,29 @@ class TypeValidator(Validator):
                     f"value is of the wrong type; got type {type(value).__name__}"
                 )
 
+    def compile(self) -> Callable[[Any], None] | None:
+        """
+        Returns the type check, or None if no `field_type` is defined.
+        """
+        types = self._type
+        if types is None:
+            return None
+        prefix = f"{type(self).__name__}: "
+        amend_error = self._amend_error
+
+        def check_type(value: Any):
+            try:
+                failed = value and not isinstance(value, types)
+            except Exception as e:
+                raise amend_error(e) from e
+            if failed:
+                raise ConfigTypeError(
+                    f"{prefix}value is of the wrong type; "
+                    f"got type {type(value).__name__}"
+                )
+
+        return check_type
+
 
 @dataclass
 class RequiredValidator(Validator):
@@ -130,7 +162,7 @@ class RequiredValidator(Validator):
             )
         self.option.required = self.required  # eventually set the new value
 
-    def _validate_value(self, value: Any):
+    def _validate_value(self, value: Any, cfg: ConfigView | None = None):
         """
         Validates that the value is not None or an empty string when required.
 
@@ -143,6 +175,25 @@ class RequiredValidator(Validator):
         if self.required and (value is None or value == ""):
             raise ConfigRequiredError("value can not be None or empty")
 
+    def compile(self) -> Callable[[Any], None] | None:
+        """
+        Returns the presence check, or None if the option is not required.
+        """
+        if not self.required:
+            return None
+        message = f"{type(self).__name__}: value can not be None or empty"
+        amend_error = self._amend_error
+
+        def check_required(value: Any):
+            try:
+                failed = value is None or value == ""
+            except Exception as e:
+                raise amend_error(e) from e
+            if failed:
+                raise ConfigRequiredError(message)
+
+        return check_required
+
 
 @dataclass
 class RangeValidator(Validator):
@@ -182,7 +233,9 @@ class RangeValidator(Validator):
                 f"than max ({self.option.r_max})",
             )
 
-    def _validate_value(self, value: int | float | Sized | None):
+    def _validate_value(
+        self, value: int | float | Sized | None, cfg: ConfigView | None = None
+    ):
         """
         Validates that the value is within the defined numeric range.
 
@@ -216,6 +269,37 @@ class RangeValidator(Validator):
                 f"value ({value}) must be <= max-value ({self.option.r_max})",
             )
 
+    def compile(self) -> Callable[[Any], None] | None:
+        """
+        Returns the range check, or None if neither `r_min` nor `r_max` is defined.
+        """
+        r_min, r_max = self.option.r_min, self.option.r_max
+        if r_min is None and r_max is None:
+            return None
+        prefix = f"{type(self).__name__}: "
+        amend_error = self._amend_error
+
+        def check_range(value: Any):
+            try:
+                if value == "" or value is None:
+                    return
+                if isinstance(value, Sized):
+                    value = len(value)
+                too_low = r_min is not None and value < r_min
+                too_high = not too_low and r_max is not None and value > r_max
+            except Exception as e:
+                raise amend_error(e) from e
+            if too_low:
+                raise ConfigRangeError(
+                    f"{prefix}value ({value}) must be >= min-value ({r_min})"
+                )
+            if too_high:
+                raise ConfigRangeError(
+                    f"{prefix}value ({value}) must be <= max-value ({r_max})"
+                )
+
+        return check_range
+
 
 @dataclass
 class DomainValidator(Validator):
@@ -224,18 +308,28 @@ class DomainValidator(Validator):
 
     This validator ensures the value is present in the `domain` set.
     The domain must be a non-empty set, provided at initialization.
+
+    With a `domain_file` the domain is a `DomainFile` instead of a set: a sorted
+    file that is memory-mapped and searched, shared by all options using the file.
     """
 
-    domain: set[Any] = field(default_factory=set)
+    domain: set[Any] | DomainFile = field(default_factory=set)
 
     def _init_validate(self):
         """
         Validates that `domain` is a set (empty or not) after initialization.
 
         Raises:
-            ConfigDomainError: If `domain` is not a set.
+            ConfigDomainError: If `domain` is not a set, if `domain_file` can not
+                be read, or if both are given.
         """
         _domain = ()
+        if self.option.domain_file is not None:
+            if self.option.domain is not None:
+                raise ConfigDomainError("domain and domain_file cannot both be set")
+            self.domain = self._open_domain_file(self.option.domain_file)
+            return
+
         if self.option.domain is None:
             _domain = ()
 
@@ -255,7 +349,21 @@ class DomainValidator(Validator):
                 "probably due to unhashable types"
             ) from e
 
-    def _validate_value(self, value: Any):
+    @staticmethod
+    def _open_domain_file(domain_file: Any) -> DomainFile:
+        if isinstance(domain_file, DomainFile):
+            return domain_file
+        try:
+            return DomainFile.open(domain_file)
+        except TypeError as e:
+            raise ConfigDomainError(
+                f"domain_file must be a path or a DomainFile; "
+                f"got type {type(domain_file).__name__}"
+            ) from e
+        except (OSError, ValueError) as e:
+            raise ConfigDomainError(f"cannot use domain file: {e}") from e
+
+    def _validate_value(self, value: Any, cfg: ConfigView | None = None):
         """
         Validates that the given value is part of the domain set.
 
@@ -270,6 +378,28 @@ class DomainValidator(Validator):
                 f"value ({value}) is not in the domain of acceptable values",
             )
 
+    def compile(self) -> Callable[[Any], None] | None:
+        """
+        Returns the membership check, or None if the domain is empty.
+        """
+        domain = self.domain
+        if not domain:
+            return None
+        prefix = f"{type(self).__name__}: "
+        amend_error = self._amend_error
+
+        def check_domain(value: Any):
+            try:
+                failed = value and value not in domain
+            except Exception as e:
+                raise amend_error(e) from e
+            if failed:
+                raise ConfigDomainError(
+                    f"{prefix}value ({value}) is not in the domain of acceptable values"
+                )
+
+        return check_domain
+
 
 @dataclass
 class CustomValidator(Validator):
@@ -304,12 +434,13 @@ class CustomValidator(Validator):
                     f"got type {type(fn).__name__}"
                 )
 
-    def _validate_value(self, value: Any):
+    def _validate_value(self, value: Any, cfg: ConfigView | None = None):
         """
         Executes the user-defined validation function with the provided value.
 
         Args:
             value (Any): The value to validate.
+            cfg (ConfigView | None): The config view passed to the function.
 
         Raises:
             ConfigError: If the user-defined function raises this known validation exception.
@@ -317,7 +448,7 @@ class CustomValidator(Validator):
         """
         # for fn in self.option.fn_validator or ():  # or ... to please pyright
         for fn in self.fn_validators:
-            fn(value, self.cfg)
+            fn(value, cfg)
 
 
 @dataclass
@@ -356,16 +487,73 @@ class ComputedValidator(Validator):
                     f"computed callback does not conform to ComputedFn protocol: {fn}"
                 )
 
-    def _validate_value(self, value: Any) -> dict[str, Any]:
+    def _validate_value(
+        self, value: Any, cfg: ConfigView | None = None
+    ) -> dict[str, Any]:
         """
         Executes the user-defined function(s) with the provided value.
 
-        Returns a dictionary of {field_name: computed_value}.
+        Returns a dictionary of {field_name: computed_value}. Lazy callbacks are
+        skipped; they are computed on first access by `compute()`.
         """
         fields: dict[str, Any] = {}
         for fn in self.fn_callbacks:
-            fields[fn.field_name] = fn(value, self.cfg)
+            if not getattr(fn, "lazy", False):
+                fields[fn.field_name] = fn(value, cfg)
         return fields
 
+    def compute(self, fn: ComputedFn, value: Any, cfg: ConfigView) -> Any:
+        """
+        Executes a single callback function, e.g. a lazy one, and returns its value.
+
+        Raises the same exceptions as calling the validator does.
+        """
+        return self._validator(lambda: fn(value, cfg))
+
+
+_plans = SchemaCache(maxsize=4096)  # shared check functions, see compile_plan()
+
+
+def compile_plan(
+    validators: Iterable[Validator], key: Hashable | None = None
+) -> Callable[[Any], None] | None:
+    """
+    Combines the compiled checks of the given validators into one check function.
+
+    Checks that can never fail (see `Validator.compile`) are left out. The checks
+    run in the order of the validators; the first failing check raises.
+
+    The compiled checks only depend on the constraints of the option, not on the
+    option itself. When a `key` is given, the check function is cached under it
+    and shared by all options compiled with an equal key (a flyweight).
+
+    Args:
+        validators (Iterable[Validator]): The initialized validators of an option.
+        key (Hashable | None): The constraints of the option the checks depend on.
+
+    Returns:
+        Callable[[Any], None] | None: The check function, or None when there is
+            nothing to check at all.
+    """
+    if key is not None:
+        plan = _plans.get(key)
+        if plan is None:
+            plan = compile_plan(validators)
+            if plan is not None:
+                _plans.put(key, plan)
+        return plan
+
+    checks = tuple(c for c in (v.compile() for v in validators) if c is not None)
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any):
+        for check in checks:
+            check(value)
+
+    return check_all
+
 
 # === END ===
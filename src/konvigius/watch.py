@@ -0,0 +1,339 @@
+# src/konvigius/watch.py
+"""
+Reloads a config object when its source files change.
+
+A `ConfigWatcher` watches the files and directories of the sources of a config
+object (see `Source.watched_paths()`) in a background thread. When a file changes,
+only the sources of the changed paths are read again; the values of the other
+sources are kept from their last successful read. The merged values are compared
+with the merged values of the previous reload, and only the values the sources
+changed are set, in one transaction. If the new values fail validation the
+transaction is rolled back, so the config object keeps serving the last good
+version; the error is passed to `on_error`.
+
+A value that disappears from the sources is reset to the default of its field.
+Values set in code are kept, unless the sources change them.
+
+The paths are checked by comparing their inode, size and modification time (ns),
+for a directory of every file in it. The thread checks them every `interval`
+seconds. On Linux the thread is also woken up by inotify events on the directories
+of the paths, so changes are picked up immediately; elsewhere it only polls.
+
+Classes:
+    ConfigWatcher: Watches the sources of a config object and applies their changes.
+"""
+
+from __future__ import annotations
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping
+
+from .core.changes import ChangeSet
+from .exceptions import ConfigError
+from .sources import DictSource, Source, _located_error
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .configlib import Config
+
+# inotify event mask: a file in the directory is written, created, moved or removed
+_IN_MASK = 0x008 | 0x040 | 0x080 | 0x100 | 0x200 | 0x400 | 0x800
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+
+class _Inotify:
+    """Minimal inotify binding with ctypes; only used to wake up the watcher."""
+
+    def __init__(self, paths: Iterable[str]):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        try:
+            for path in paths:
+                folder = path if os.path.isdir(path) else os.path.dirname(path)
+                wd = libc.inotify_add_watch(
+                    self._fd, os.fsencode(folder or "."), _IN_MASK
+                )
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f"cannot watch {folder}")
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for events, at most `timeout` seconds; they are read and dropped.
+
+        Returns:
+            bool: True if there were events.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self._fd)
+
+
+class ConfigWatcher:
+    """Watches the sources of a config object and applies their changes.
+
+    ``` python
+    watcher = ConfigWatcher(cfg, [TomlSource("app.toml"), EnvSource("APP_")])
+    watcher.start()
+    ...
+    watcher.stop()
+    ```
+
+    Attributes:
+        cfg (Config): The config object.
+        sources (list[Source]): The sources, lowest priority first.
+        interval (float): The seconds between the checks of the paths.
+        backend (str): "inotify" or "poll".
+        last_error (Exception | None): The error of the last failed reload.
+    """
+
+    def __init__(
+        self,
+        cfg: Config,
+        sources: Iterable[Source | Mapping[str, Any]],
+        *,
+        interval: float = 1.0,
+        backend: str = "auto",
+        on_reload: Callable[[ChangeSet], Any] | None = None,
+        on_error: Callable[[Exception], Any] | None = None,
+    ):
+        """Create the watcher; `start()` starts watching.
+
+        Args:
+            cfg (Config): The config object to update.
+            sources (Iterable[Source | Mapping[str, Any]]): The sources, lowest
+                priority first; use the sources the config object was loaded from.
+            interval (float): The seconds between the checks of the paths.
+            backend (str): "inotify", "poll", or "auto" for inotify when available.
+            on_reload (Callable[[ChangeSet], Any] | None): Called after a reload
+                changed values.
+            on_error (Callable[[Exception], Any] | None): Called when a reload
+                failed; the config object keeps its values.
+        """
+        if backend not in ("auto", "inotify", "poll"):
+            raise ValueError(f"unknown watcher backend {backend!r}")
+        if backend == "auto":
+            backend = "inotify" if sys.platform.startswith("linux") else "poll"
+        self.cfg = cfg
+        self.sources = [
+            source if isinstance(source, Source) else DictSource(source)
+            for source in sources
+        ]
+        self.interval = interval
+        self.backend = backend
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.last_error: Exception | None = None
+        self._signatures: list[tuple] = [() for _ in self.sources]
+        self._values: list[Mapping[str, Any]] = [{} for _ in self.sources]
+        self._origins: list[dict[str, str]] = [{} for _ in self.sources]
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> ConfigWatcher:
+        """Read all sources, apply their values, and start the watcher thread.
+
+        Raises:
+            ConfigError: If the values of the sources fail validation.
+            Exception: Any other error of reading the sources, e.g. an `OSError`.
+        """
+        if self._thread is not None:
+            return self
+        self.check(initial=True)
+        if self.last_error is not None:
+            raise self.last_error
+        inotify = None
+        if self.backend == "inotify":
+            paths = [p for source in self.sources for p in source.watched_paths()]
+            try:
+                inotify = _Inotify(paths)
+            except (OSError, AttributeError):
+                self.backend = "poll"  # no inotify on this system
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(inotify,), name="konvigius-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> ConfigWatcher:
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self, inotify: _Inotify | None):
+        try:
+            while not self._stop.is_set():
+                if inotify is not None:
+                    inotify.wait(self.interval)
+                elif self._stop.wait(self.interval):
+                    break
+                if not self._stop.is_set():
+                    self.check()
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def check(self, initial: bool = False) -> ChangeSet | None:
+        """Read the sources whose paths changed and apply the changed values.
+
+        Called by the watcher thread; can also be called directly. Any error of
+        the reload, also one that is not a `ConfigError` (e.g. an `OSError` of a
+        source), is stored in `last_error` and passed to `on_error`; the watcher
+        thread keeps watching. After a read error that is not a `ConfigError` the
+        next check reads the sources of the failed reload again, also when their
+        files did not change; sources with invalid values are only read again
+        when their files change.
+
+        Args:
+            initial (bool): Read all sources, also those without paths.
+
+        Returns:
+            ChangeSet | None: The changes of the reload, or None if no source
+                changed or the reload failed.
+        """
+        signatures: dict[int, tuple] = {}  # of the changed sources
+        for i, source in enumerate(self.sources):
+            paths = source.watched_paths()
+            if not paths and not initial:
+                continue
+            signature = tuple(_signature(path) for path in paths)
+            if initial or signature != self._signatures[i]:
+                signatures[i] = signature
+        if not signatures:
+            return None
+
+        # Transactions are per thread, so this only guards a direct call of
+        # check() from a thread with an open transaction, which the reload
+        # would otherwise commit; the watcher thread never has one.
+        if self.cfg._trx_:
+            error = ConfigError("cannot reload the config while a transaction is open")
+            return self._failed(error)
+
+        values = list(self._values)
+        origins = list(self._origins)
+        try:
+            for i in signatures:
+                source = self.sources[i]
+                values[i] = source.read(self.cfg)
+                origins[i] = {name: source.origin(name) for name in values[i]}
+            changes = self._apply(values, origins)
+        except ConfigError as e:
+            # invalid values: read the sources again when their files change
+            for i, signature in signatures.items():
+                self._signatures[i] = signature
+            return self._failed(e)
+        except Exception as e:
+            # the signatures are kept, so the next check reads the sources again
+            return self._failed(e)
+        for i, signature in signatures.items():
+            self._signatures[i] = signature
+        self._values = values
+        self._origins = origins
+        self.last_error = None
+        if changes and self.on_reload is not None:
+            self.on_reload(changes)
+        return changes
+
+    def _failed(self, error: Exception) -> None:
+        """Record the error of a failed reload and pass it to `on_error`."""
+        self.last_error = error
+        if self.on_error is not None:
+            self.on_error(error)
+        return None
+
+    def _apply(
+        self,
+        values_per_source: list[Mapping[str, Any]],
+        origins_per_source: list[dict[str, str]],
+    ) -> ChangeSet:
+        """Set the merged values the sources changed since the previous reload.
+
+        Only the values that differ from both the previous source values and the
+        live values are set, in one commit; values set in code are kept.
+        """
+        from .configlib import _MISSING, _equal_values, _is_unchanged
+
+        cfg = self.cfg
+        metadata = cfg._metadata
+        values: dict[str, Any] = {}
+        origins: dict[str, str] = {}
+        for source_values, source_origins in zip(values_per_source, origins_per_source):
+            values.update(source_values)
+            origins.update(source_origins)
+        previous: dict[str, Any] = {}  # the merged values of the previous reload
+        for source_values in self._values:
+            previous.update(source_values)
+        unknown = values.keys() - metadata.keys()
+        if unknown:
+            name = min(unknown)
+            raise ConfigError(f"{origins[name]}: Invalid config field: '{name}'.", name)
+
+        live = cfg._values
+        pending: dict[str, Any] = {}
+        for name, value in values.items():
+            if _equal_values(previous.get(name, _MISSING), value):
+                continue  # not changed by the sources
+            if not _is_unchanged(live[name], value):
+                pending[name] = value
+        for name in previous.keys() - values.keys():  # removed: back to the default
+            default = metadata[name].default_value
+            if not _is_unchanged(live[name], default):
+                pending[name] = default
+                origins[name] = "default"
+        cfg.start_transaction()
+        tx = cfg._tx
+        for name, value in pending.items():
+            tx.set(name, value, origins[name])
+        try:
+            changes = cfg.commit_transaction()  # rolls back on an error
+        except ConfigError as e:
+            raise _located_error(cfg, pending, origins, e) from e
+        return changes
+
+
+def _signature(path: str) -> tuple:
+    """Return the inode, size and mtime of a file, or of the files in a directory."""
+    try:
+        if os.path.isdir(path):
+            return tuple(
+                sorted(
+                    (entry.name, *_stat_key(entry.stat()))
+                    for entry in os.scandir(path)
+                    if entry.is_file()
+                )
+            )
+        return _stat_key(os.stat(path))
+    except OSError:
+        return ()  # missing
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+# === END ===
@@ -0,0 +1,103 @@
+# tests/test_batch.py
+import pytest
+
+from konvigius import Config, Schema, with_field_name
+from konvigius import batch
+from konvigius.exceptions import (
+    ConfigDomainError,
+    ConfigInvalidFieldError,
+    ConfigRangeError,
+    ConfigTypeError,
+    ConfigValidationError,
+)
+
+
+def check_role(value, cfg):
+    if value == "admin" and cfg.port != 443:
+        raise ConfigValidationError("admin requires port 443")
+
+
+schema = [
+    Schema("port", default=80, field_type=int, domain=(80, 443, 8080)),
+    Schema("timeout", default=5.0, field_type=float, r_min=0.5, r_max=60.0),
+    Schema("retries", default=3, field_type=int, r_min=0, r_max=10),
+    Schema("userrole", default="guest", domain=("guest", "admin"), fn_validator=check_role),
+    Schema(
+        "minutes",
+        default=1,
+        field_type=int,
+        fn_computed=with_field_name("seconds")(lambda v, cfg: v * 60),
+    ),
+]
+
+records = [
+    {},
+    {"port": 443, "userrole": "admin"},
+    {"port": 81},
+    {"timeout": 0.1, "retries": 11},
+    {"retries": "3"},
+    {"userrole": "admin"},
+    {"colour": "red"},
+    {"port": 0, "retries": 2**70},
+    {"timeout": "slow"},
+]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def use_numpy(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch, "np", None)
+    return request.param
+
+
+def error_types(results):
+    return [{k: type(e) for k, e in r.errors.items()} for r in results]
+
+
+def test_validate_many_results(use_numpy):
+    results = list(Config.validate_many(schema, records, chunk_size=4))
+    assert [r.index for r in results] == list(range(len(records)))
+    assert [r.ok for r in results] == [True, True] + [False] * 7
+    assert error_types(results) == [
+        {},
+        {},
+        {"port": ConfigDomainError},
+        {"timeout": ConfigRangeError, "retries": ConfigRangeError},
+        {"retries": ConfigTypeError},
+        {"userrole": ConfigValidationError},
+        {"colour": ConfigInvalidFieldError},
+        {"retries": ConfigRangeError},
+        {"timeout": ConfigTypeError},
+    ]
+
+
+def test_validate_many_same_messages_as_from_dict(use_numpy):
+    for result, record in zip(Config.validate_many(schema, records), records):
+        for name, error in result.errors.items():
+            if isinstance(error, ConfigInvalidFieldError):
+                continue
+            with pytest.raises(type(error)) as exc:
+                Config.from_dict(schema, {name: record[name]})
+            assert str(exc.value) == str(error)
+
+
+def test_validate_many_is_lazy():
+    def source():
+        yield {"port": 443}
+        raise RuntimeError("must not be read")
+
+    results = Config.validate_many(schema, source(), chunk_size=1)
+    assert next(results).ok
+
+
+def test_validate_many_does_not_change_the_dependency_graph():
+    cfg = Config.config_factory(schema)
+    before = {name: cfg._graph.reads(name) for name in cfg._metadata}
+    list(batch.validate_records(cfg, records))
+    assert {name: cfg._graph.reads(name) for name in cfg._metadata} == before
+    assert cfg.port == 80 and cfg.seconds == 60
+
+
+# === END ===
@@ -1,11 +1,16 @@
 from typing import Any, Callable
+import copy
+import pickle
 import pytest
 import json
+import threading
 
 import konvigius
-from konvigius.configlib import Config, Option
+from konvigius.configlib import Config, InvertedBool, Option
+from konvigius.core.store import SlotStore
 from konvigius.core.types import Schema, with_field_name
 from konvigius.exceptions import (
+    ConfigConflictError,
     ConfigError,
     ConfigMetadataError,
     ConfigValidationError,
@@ -630,6 +635,109 @@ def test_computed_bools_modify_raises():
         cfg.no_bool_B = False
 
 
+# -----------------------------------------------------------------------------
+#  Test lazy computed fields
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def lazy_calls():
+    return []
+
+
+@pytest.fixture
+def schema_lazy(lazy_calls):
+    @with_field_name("pattern", lazy=True)
+    def fn_pattern(value, cfg):
+        lazy_calls.append(value)
+        return f"^{value}{cfg.suffix}$"
+
+    return [
+        Schema("prefix", default="ab", field_type=str, fn_computed=fn_pattern),
+        Schema("suffix", default="", field_type=str),
+        Schema("other", default=1, field_type=int),
+    ]
+
+
+def test_lazy_computed_is_computed_on_first_access(schema_lazy, lazy_calls):
+    cfg = Config.config_factory(schema_lazy)
+    assert lazy_calls == []
+    assert "pattern" not in cfg._computed_values
+    assert cfg.pattern == "^ab$"
+    assert cfg.pattern == "^ab$"
+    assert lazy_calls == ["ab"]
+
+
+def test_lazy_computed_is_invalidated_by_source_field(schema_lazy, lazy_calls):
+    cfg = Config.config_factory(schema_lazy)
+    assert cfg.pattern == "^ab$"
+    cfg.other = 2
+    assert cfg.pattern == "^ab$"
+    assert lazy_calls == ["ab"]
+
+    cfg.prefix = "xy"
+    assert lazy_calls == ["ab"]  # not computed before it is read
+    assert cfg.pattern == "^xy$"
+    assert lazy_calls == ["ab", "xy"]
+
+
+def test_lazy_computed_is_invalidated_by_field_read(schema_lazy, lazy_calls):
+    cfg = Config.config_factory(schema_lazy)
+    assert cfg.pattern == "^ab$"
+    cfg.suffix = "z"
+    assert cfg.pattern == "^abz$"
+    assert lazy_calls == ["ab", "ab"]
+
+
+def test_lazy_computed_read_by_other_function(schema_lazy, lazy_calls):
+    @with_field_name("pattern_length")
+    def fn_length(value, cfg):
+        return len(cfg.pattern)
+
+    schema = schema_lazy + [Schema("x", default=0, fn_computed=fn_length)]
+    cfg = Config.config_factory(schema)
+    assert cfg.pattern_length == 4
+    assert lazy_calls == ["ab"]
+
+    cfg.prefix = "abcd"
+    assert cfg.pattern_length == 6
+    assert cfg.pattern == "^abcd$"
+    assert lazy_calls == ["ab", "abcd"]
+
+
+def test_lazy_computed_read_by_validator_at_factory_time(schema_lazy, lazy_calls):
+    def fn_check_pattern(value, cfg):
+        if not cfg.pattern.startswith("^"):
+            raise ConfigValidationError("bad pattern")
+
+    schema = schema_lazy + [Schema("y", default=0, fn_validator=fn_check_pattern)]
+    cfg = Config.config_factory(schema)
+    assert lazy_calls == ["ab"]
+    assert cfg.pattern == "^ab$"  # cached when the validator read it
+    assert lazy_calls == ["ab"]
+    cfg.prefix = "cd"
+    assert cfg.pattern == "^cd$"
+
+
+def test_lazy_computed_iter_len_and_get_computed_prop(schema_lazy):
+    cfg = Config.config_factory(schema_lazy)
+    assert len(cfg) == 4
+    assert cfg.get_computed_prop("pattern") == "^ab$"
+    cfg.prefix = "c"
+    assert ("pattern", "^c$", "C") in list(cfg)
+    assert len(cfg) == 4
+
+
+def test_lazy_computed_error_is_wrapped():
+    @with_field_name("inverse", lazy=True)
+    def fn_inverse(value, cfg):
+        return 1 / value
+
+    cfg = Config.config_factory([Schema("x", default=0, fn_computed=fn_inverse)])
+    with pytest.raises(ConfigValidationError, match="ComputedValidator"):
+        cfg.inverse
+
+
 # -----------------------------------------------------------------------------
 #  Test derived fields
 # -----------------------------------------------------------------------------
@@ -791,6 +899,767 @@ def test_transaction_commit_fails():
     with pytest.raises(ConfigError):
         cfg.commit_transaction()
 
+
+def test_transaction_commit_only_validates_changed_fields(monkeypatch):
+    validated = []
+    original = Option.validate_default
+
+    def spy(self, value, cfg):
+        validated.append(self.name)
+        return original(self, value, cfg)
+
+    schema = [
+        Schema("port", default=3274, r_min=0, r_max=65535, field_type=int),
+        Schema("userrole", default="guest", field_type=str),
+        Schema("timeout", default=10, r_min=1, r_max=60, field_type=int),
+    ]
+    cfg = Config.config_factory(schema)
+    monkeypatch.setattr(Option, "validate_default", spy)
+
+    cfg.port = 8080
+    assert validated == ["port"]
+    assert cfg.port == 8080
+
+
+def test_transaction_commit_unchanged_value_is_noop():
+    calls = []
+
+    def fn_count(value, cfg):
+        calls.append(value)
+
+    schema = [
+        Schema("port", default=3274, field_type=int, fn_validator=fn_count),
+        Schema("debug", default=True, field_type=bool),
+    ]
+    cfg = Config.config_factory(schema)
+    assert calls == [3274]
+
+    cfg.port = 3274
+    assert calls == [3274]
+
+    cfg.debug = True
+    assert calls == [3274]
+
+    cfg.port = 80
+    assert calls == [3274, 80]
+
+
+def test_transaction_commit_equal_value_of_other_type_is_a_change():
+    schema = [Schema("debug", default=True, field_type=bool)]
+    cfg = Config.config_factory(schema)
+    with pytest.raises(ConfigTypeError):
+        cfg.debug = 1
+    assert cfg.debug is True
+
+
+def test_transaction_commit_value_with_elementwise_equality():
+    class Vector(list):
+        def __eq__(self, other):
+            return Vector(a == b for a, b in zip(self, other))
+
+        def __bool__(self):
+            raise ValueError("truth value of a Vector is ambiguous")
+
+    schema = [Schema("weights", default=Vector([1, 2]))]
+    cfg = Config.config_factory(schema)
+    cfg.weights = Vector([1, 2])
+    cfg.weights = Vector([3, 4])
+    assert list(cfg.weights) == [3, 4]
+
+
+def test_transaction_commit_revalidates_a_container_changed_in_place():
+    schema = [Schema("hosts", default=["a"], field_type=list, r_max=1)]
+    cfg = Config.config_factory(schema)
+    hosts = cfg.hosts
+    hosts.append("b")
+    with pytest.raises(ConfigRangeError):
+        cfg.hosts = hosts
+
+
+def test_transaction_commit_revalidates_dependent_custom_validators():
+    def fn_check_port_admin(value, cfg):
+        if value <= 1023 and cfg.userrole != "admin":
+            raise ConfigValidationError("Port not permitted")
+
+    schema = [
+        Schema("port", default=80, field_type=int, fn_validator=fn_check_port_admin),
+        Schema("userrole", default="admin", field_type=str),
+    ]
+    cfg = Config.config_factory(schema)
+    with pytest.raises(ConfigValidationError):
+        cfg.userrole = "guest"
+    assert cfg.userrole == "admin"
+
+
+# --------------------------------------------------------------------
+# Schema cache
+# --------------------------------------------------------------------
+
+
+def test_factory_reuses_compiled_schema(monkeypatch):
+    def fn_check(value, cfg):
+        pass
+
+    def make_schema():
+        return [
+            Schema("port", default=80, field_type=int, fn_validator=fn_check),
+            Schema("hosts", default=("a",), field_type=tuple),
+        ]
+
+    cfg_1 = Config.config_factory(make_schema(), help_map={"port": "The port"})
+    calls = []
+    monkeypatch.setattr(Option, "init_validators", lambda self: calls.append(self))
+    cfg_2 = Config.config_factory(make_schema(), help_map={"port": "The port"})
+
+    assert calls == []
+    assert type(cfg_2) is type(cfg_1)
+    assert cfg_2._metadata is cfg_1._metadata
+    cfg_2.port = 443
+    assert (cfg_1.port, cfg_2.port) == (80, 443)
+
+
+def test_factory_cache_never_shares_mutable_defaults():
+    def make_schema():
+        return [Schema("hosts", default=[], field_type=list)]
+
+    cfg_1 = Config.config_factory(make_schema())
+    cfg_2 = Config.config_factory(make_schema())
+    cfg_1.hosts.append("x")
+    assert cfg_2.hosts == []
+
+    schema = make_schema()  # the same list: shared, as without the cache
+    assert Config.config_factory(schema).hosts is schema[0].default
+    assert type(Config.config_factory(schema)) is type(Config.config_factory(schema))
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        [Schema("flag", default=True)],
+        [Schema("flag", default=1, field_type=int)],
+        [Schema("flag", default=1, domain=(True, 2))],
+        [Schema("flag", default=1, fn_validator=lambda v, cfg: None)],
+    ],
+)
+def test_factory_cache_distinguishes_schemas(other):
+    cfg = Config.config_factory([Schema("flag", default=1)])
+    assert type(Config.config_factory(other)) is not type(cfg)
+    assert type(Config.config_factory(other, auto_bools=False)) is not type(cfg)
+
+
+def test_factory_cache_can_be_cleared():
+    schema = [Schema("x", default=1)]
+    cfg = Config.config_factory(schema)
+    Config.clear_schema_cache()
+    assert type(Config.config_factory(schema)) is not type(cfg)
+
+
+# --------------------------------------------------------------------
+# clone() and new_instance()
+# --------------------------------------------------------------------
+
+
+@pytest.fixture
+def schema_clone():
+    return [
+        Schema("timeout", default=10, field_type=int, r_min=1, r_max=60),
+        Schema("retries", default=3, field_type=int),
+        Schema(
+            "minutes",
+            default=1,
+            field_type=int,
+            fn_computed=with_field_name("seconds")(lambda v, cfg: v * 60),
+        ),
+    ]
+
+
+def test_clone_is_independent(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.minutes = 2
+    other = cfg.clone()
+    assert type(other) is type(cfg)
+    assert (other.minutes, other.seconds) == (2, 120)
+
+    other.minutes = 3
+    cfg.timeout = 20
+    assert (cfg.minutes, cfg.seconds, cfg.timeout) == (2, 120, 20)
+    assert (other.minutes, other.seconds, other.timeout) == (3, 180, 10)
+
+
+def test_clone_skips_validation(schema_clone, monkeypatch):
+    cfg = Config.config_factory(schema_clone)
+    monkeypatch.setattr(Option, "validate_default", None)
+    monkeypatch.setattr(Option, "validate_custom", None)
+    monkeypatch.setattr(Option, "validate_computed", None)
+    assert cfg.clone().to_dict() == cfg.to_dict()
+
+
+def test_new_instance_validates_only_the_overrides(schema_clone, monkeypatch):
+    cfg = Config.config_factory(schema_clone)
+    cfg.timeout = 30
+    checked = []
+    original = Option.validate_default
+
+    def spy(self, value, view):
+        checked.append(self.name)
+        original(self, value, view)
+
+    monkeypatch.setattr(Option, "validate_default", spy)
+    other = type(cfg).new_instance(retries=5, minutes=2)
+
+    assert checked == ["retries", "minutes"]
+    assert (other.timeout, other.retries, other.seconds) == (10, 5, 120)
+    assert cfg.timeout == 30
+
+
+def test_new_instance_raises(schema_clone):
+    cls = type(Config.config_factory(schema_clone))
+    with pytest.raises(ConfigRangeError):
+        cls.new_instance(timeout=0)
+    with pytest.raises(ConfigInvalidFieldError):
+        cls.new_instance(colour="red")
+    with pytest.raises(TypeError):
+        Config.new_instance()
+
+
+def test_properties_are_compiled_into_the_class_once(schema, monkeypatch):
+    cfg = Config.config_factory(schema)
+    cls = type(cfg)
+    class_attrs = dict(vars(cls))
+    assert isinstance(class_attrs["no_debug"], property)
+
+    def fail(*args):  # pragma: no cover
+        raise AssertionError("class compiled again")
+
+    monkeypatch.setattr(Config, "_create_computed_properties", fail)
+    monkeypatch.setattr(Config, "_create_inverted_bool_properties", fail)
+    others = [Config.config_factory(schema), cls.new_instance(debug=True), cfg.clone()]
+
+    assert dict(vars(cls)) == class_attrs
+    assert [other.no_debug for other in others] == [True, False, True]
+    fn = cfg.get_meta("debug")._comp_validator.fn_callbacks[-1]
+    assert isinstance(fn, InvertedBool) and fn.field_name == "no_debug"
+
+
+# --------------------------------------------------------------------
+# Snapshots
+# --------------------------------------------------------------------
+
+
+def test_snapshot_is_frozen_and_unaffected_by_commits(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.minutes = 2
+    snap = cfg.snapshot()
+    assert snap._cfg._values is cfg._values  # shared, not copied
+
+    cfg.minutes = 3
+    assert (snap.minutes, snap.seconds) == (2, 120)
+    assert snap.to_dict() == {"timeout": 10, "retries": 3, "minutes": 2}
+    with pytest.raises(AttributeError, match="read-only"):
+        snap.minutes = 4
+    with pytest.raises(AttributeError, match="read-only"):
+        del snap.minutes
+    with pytest.raises(AttributeError, match="no field 'colour'"):
+        snap.colour
+    assert "seconds" in dir(snap)
+
+
+def test_snapshot_equality_and_hash(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    snap = cfg.snapshot()
+    assert snap == cfg.clone().snapshot()
+    assert hash(snap) == hash(type(cfg).new_instance().snapshot())
+    cfg.retries = 4
+    assert snap != cfg.snapshot()
+    by_snapshot = {snap: "a", cfg.snapshot(): "b"}
+    assert by_snapshot[type(cfg).new_instance(retries=4).snapshot()] == "b"
+
+    other = Config.config_factory(schema_clone[:2])
+    assert snap != other.snapshot()
+
+
+def test_snapshot_reads_lazy_fields(schema_lazy, lazy_calls):
+    cfg = Config.config_factory(schema_lazy)
+    snap = cfg.snapshot()
+    cfg.suffix = "x"
+    assert (snap.pattern, cfg.pattern) == ("^ab$", "^abx$")
+    assert lazy_calls == ["ab", "ab"]
+
+
+# --------------------------------------------------------------------
+# Versions
+# --------------------------------------------------------------------
+
+
+def test_version_increments_on_changing_commits(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    assert cfg.get_version() == 0
+    cfg.minutes = 2
+    assert cfg.get_version() == 1
+    cfg.minutes = 2  # unchanged value, no new version
+    assert cfg.get_version() == 1
+    with pytest.raises(ConfigRangeError):
+        cfg.timeout = 0
+    assert cfg.get_version() == 1
+    assert cfg.clone().get_version() == 1
+
+
+def test_commit_expected_version(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    version = cfg.get_version()
+    cfg.start_transaction()
+    cfg.minutes = 2
+    cfg.commit_transaction(expected_version=version)
+    assert (cfg.minutes, cfg.get_version()) == (2, version + 1)
+
+    cfg.start_transaction()
+    cfg.minutes = 3
+    with pytest.raises(ConfigConflictError) as exc:
+        cfg.commit_transaction(expected_version=version)
+    assert (exc.value.expected_version, exc.value.actual_version) == (0, 1)
+    assert exc.value.field is None
+    located = type(exc.value)(f"x: {exc.value}", "minutes")  # like _located_error()
+    assert (located.field, located.expected_version) == ("minutes", None)
+    assert (cfg.minutes, cfg.seconds, cfg._trx_) == (2, 120, False)
+
+
+def test_transactions_are_owned_by_their_thread(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.start_transaction()
+    cfg.minutes = 2
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append((cfg._trx_, cfg.minutes)))
+    thread.start()
+    thread.join()
+    cfg.commit_transaction()
+    assert seen == [(False, 1)]
+    assert cfg.minutes == 2
+
+
+class _NoThreadLocal:
+    """Stands in for the transaction state; fails when a read looks at it."""
+
+    @property
+    def pending(self):
+        raise AssertionError("read looked at the transaction state")
+
+    active = False
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_reads_skip_the_transaction_state_when_none_is_open(schema_clone, slots):
+    cfg = Config.config_factory(schema_clone, slots=slots)
+    cfg.minutes = 2
+    cfg.start_transaction()
+    cfg.rollback_transaction()
+    with cfg.transaction():
+        cfg.retries = 4
+    assert cfg._open_tx == 0
+    tx, cfg._tx = cfg._tx, _NoThreadLocal()
+    assert (cfg.timeout, cfg.retries, cfg.minutes, cfg.seconds) == (10, 4, 2, 120)
+    cfg._tx = tx
+
+
+def test_open_transactions_are_counted(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.start_transaction()
+    cfg.start_transaction()  # already open, not counted again
+    cfg.minutes = 2
+    opened = threading.Event()
+    committed = threading.Event()
+    seen = []
+
+    def other():
+        with cfg.transaction():
+            cfg.retries = 5
+            opened.set()
+            committed.wait()
+            seen.append((cfg._open_tx, cfg.minutes, cfg.retries))
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    opened.wait()
+    assert (cfg._open_tx, cfg.minutes, cfg.retries) == (2, 2, 3)
+    cfg.commit_transaction()
+    committed.set()
+    thread.join()
+    assert seen == [(1, 2, 5)]
+    assert (cfg._open_tx, cfg.minutes, cfg.retries) == (0, 2, 5)
+
+    with pytest.raises(ConfigRangeError):
+        cfg.timeout = 0
+    with pytest.raises(ConfigConflictError):
+        with cfg.transaction(expected_version=0):
+            cfg.timeout = 20
+    assert cfg._open_tx == 0
+
+
+def test_deepcopy_and_pickle_skip_the_transaction_state(schema_clone, monkeypatch):
+    cfg = Config.config_factory(schema_clone)
+    cfg.enable_history()
+    cfg.minutes = 2
+    cfg.start_transaction()
+    cfg.retries = 5
+
+    other = copy.deepcopy(cfg)
+    assert (other.minutes, other.seconds, other.retries) == (2, 120, 3)
+    assert (other._trx_, other._open_tx) == (False, 0)
+    assert other._metadata is cfg._metadata
+    other.timeout = 20
+    other.undo()
+    assert (other.timeout, cfg.timeout, cfg.minutes) == (10, 10, 2)
+    cfg.rollback_transaction()
+
+    # pickle finds a class by its name; register the dynamic class for the test
+    Config_cls = type(cfg)
+    monkeypatch.setitem(globals(), "PickledConfig", Config_cls)
+    names = Config_cls.__module__, Config_cls.__qualname__
+    Config_cls.__module__, Config_cls.__qualname__ = __name__, "PickledConfig"
+    try:
+        restored = pickle.loads(pickle.dumps(cfg))
+    finally:
+        Config_cls.__module__, Config_cls.__qualname__ = names
+    assert restored.to_dict() == cfg.to_dict()
+    assert (restored.get_version(), restored._open_tx) == (1, 0)
+    restored.minutes = 4
+    assert (restored.seconds, cfg.seconds) == (240, 120)
+
+
+def test_readers_see_complete_versions(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.retries = 1
+    done = threading.Event()
+    torn = []
+
+    def read():
+        while not done.is_set():
+            snap = cfg.snapshot()
+            if snap.seconds != snap.minutes * 60 or snap.retries != snap.minutes:
+                torn.append(snap.to_dict())
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for t in readers:
+        t.start()
+    try:
+        for n in range(2, 200):
+            cfg.start_transaction()
+            cfg.minutes = n
+            cfg.retries = n
+            cfg.commit_transaction()
+    finally:
+        done.set()
+        for t in readers:
+            t.join()
+    assert torn == []
+    assert cfg.get_version() == 199
+
+
+def test_concurrent_commits_are_all_applied(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+
+    def write(name):
+        for n in range(1, 51):
+            setattr(cfg, name, n)
+
+    writers = [
+        threading.Thread(target=write, args=(n,)) for n in ("minutes", "timeout")
+    ]
+    for t in writers:
+        t.start()
+    for t in writers:
+        t.join()
+    assert (cfg.minutes, cfg.seconds, cfg.timeout) == (50, 3000, 50)
+
+
+# --------------------------------------------------------------------
+# Change sets and subscribers
+# --------------------------------------------------------------------
+
+
+def test_commit_returns_change_set(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.start_transaction()
+    cfg.minutes = 2
+    cfg.timeout = 10  # unchanged
+    changes = cfg.commit_transaction()
+    assert changes.version == 1
+    assert changes.fields == {"minutes": (1, 2)}
+    assert changes.computed == {"seconds": (60, 120)}
+    assert list(changes) == ["minutes", "seconds"]
+    assert "seconds" in changes and "timeout" not in changes
+    assert changes["seconds"] == (60, 120)
+
+    cfg.start_transaction()
+    cfg.minutes = 2
+    assert not cfg.commit_transaction()
+    assert not cfg.commit_transaction()  # no open transaction
+
+
+def test_subscribers_run_once_per_commit_for_changed_fields(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    calls = []
+
+    def on_minutes(changes):
+        calls.append(("minutes", changes.version))
+
+    def on_timeout(changes):
+        calls.append(("timeout", changes.version))
+
+    cfg.subscribe(["minutes", "seconds"], on_minutes)
+    cfg.subscribe("timeout", on_timeout)
+    cfg.start_transaction()
+    cfg.minutes = 2
+    cfg.retries = 4
+    cfg.commit_transaction()
+    assert calls == [("minutes", 1)]
+
+    cfg.timeout = 20
+    cfg.unsubscribe(on_minutes, "minutes")
+    cfg.minutes = 3  # still subscribed to seconds
+    cfg.unsubscribe(on_minutes)
+    cfg.minutes = 4
+    assert calls == [("minutes", 1), ("timeout", 2), ("minutes", 3)]
+
+    with pytest.raises(ConfigInvalidFieldError) as exc:
+        cfg.subscribe("colour", on_minutes)
+    assert exc.value.field == "colour"
+
+
+def test_subscribers_are_held_weakly(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    calls = []
+
+    class Listener:
+        def on_change(self, changes):
+            calls.append(changes.fields)
+
+    listener = Listener()
+    cfg.subscribe("retries", listener.on_change)
+    cfg.retries = 4
+    del listener
+    cfg.retries = 5
+    assert calls == [{"retries": (3, 4)}]
+    assert len(cfg._subscribers) == 0
+
+
+def test_subscriber_errors_do_not_reach_the_committer(schema_clone, caplog):
+    cfg = Config.config_factory(schema_clone)
+    cfg.enable_history()
+    calls, errors = [], []
+
+    def failing(changes):
+        raise ValueError(f"failed on {changes.version}")
+
+    def handled(changes):
+        raise KeyError("handled")
+
+    def on_change(changes):
+        calls.append(changes.version)
+
+    cfg.subscribe("minutes", failing)
+    cfg.subscribe("minutes", handled, on_error=errors.append)
+    cfg.subscribe("minutes", on_change)
+    with caplog.at_level("ERROR", logger="konvigius"):
+        cfg.start_transaction()
+        cfg.minutes = 2
+        changes = cfg.commit_transaction()
+    assert changes.fields == {"minutes": (1, 2)}
+    assert (cfg.minutes, cfg.get_version(), cfg._trx_) == (2, 1, False)
+    assert calls == [1]
+    assert [type(e) for e in errors] == [KeyError]
+    assert "failed on 1" in caplog.text
+    assert cfg.undo().fields == {"minutes": (2, 1)}
+
+
+# --------------------------------------------------------------------
+# Transaction blocks and savepoints
+# --------------------------------------------------------------------
+
+
+def test_transaction_block_commits_or_rolls_back(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    with cfg.transaction():
+        cfg.minutes = 2
+        cfg.retries = 4
+        assert cfg.seconds == 60  # computed at the commit
+    assert (cfg.minutes, cfg.seconds, cfg.retries, cfg.get_version()) == (2, 120, 4, 1)
+
+    with pytest.raises(RuntimeError):
+        with cfg.transaction():
+            cfg.minutes = 3
+            raise RuntimeError("abort")
+    assert (cfg.minutes, cfg._trx_, cfg._pending_values) == (2, False, {})
+
+    with pytest.raises(ConfigRangeError):
+        with cfg.transaction():
+            cfg.timeout = 0
+    assert cfg.timeout == 10
+
+
+def test_savepoint_failure_rolls_back_only_its_writes(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    with cfg.transaction():
+        cfg.minutes = 2
+        with pytest.raises(ConfigRangeError):
+            with cfg.transaction():
+                cfg.minutes = 5
+                cfg.timeout = 0  # checked when the savepoint ends
+        assert cfg._pending_values == {"minutes": 2}
+        with cfg.transaction():
+            cfg.retries = 7
+            with pytest.raises(RuntimeError):
+                with cfg.transaction():
+                    cfg.retries = 8
+                    cfg.timeout = 30
+                    raise RuntimeError("abort")
+            assert cfg._pending_values == {"minutes": 2, "retries": 7}
+    assert (cfg.minutes, cfg.retries, cfg.timeout) == (2, 7, 10)
+
+
+def test_savepoint_journal_holds_only_touched_fields(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    with cfg.transaction():
+        cfg.minutes = 2
+        with cfg.transaction():
+            cfg.minutes = 3
+            cfg.minutes = 4
+            assert cfg._tx.savepoints == [{"minutes": 2}]
+            with cfg.transaction():
+                cfg.retries = 5
+            assert list(cfg._tx.savepoints[0]) == ["minutes", "retries"]
+        assert cfg._tx.savepoints == []
+    assert (cfg.minutes, cfg.retries) == (4, 5)
+
+
+# --------------------------------------------------------------------
+# Undo/redo history
+# --------------------------------------------------------------------
+
+
+def test_undo_redo(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.enable_history(maxlen=10)
+    cfg.minutes = 2
+    with cfg.transaction():
+        cfg.minutes = 3
+        cfg.retries = 5
+
+    changes = cfg.undo()
+    assert changes.fields == {"minutes": (3, 2), "retries": (5, 3)}
+    assert (cfg.minutes, cfg.seconds, cfg.retries) == (2, 120, 3)
+    cfg.undo()
+    assert (cfg.minutes, cfg.seconds) == (1, 60)
+    assert not cfg.undo()
+
+    cfg.redo()
+    cfg.redo()
+    assert (cfg.minutes, cfg.retries) == (3, 5)
+    assert not cfg.redo()
+    cfg.undo()
+    cfg.timeout = 20  # a new commit clears the redo stack
+    assert not cfg.redo()
+    assert len(cfg._history.undo) == 2
+
+
+def test_history_is_bounded_and_keeps_diffs(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.enable_history(maxlen=3)
+    for n in range(2, 10):
+        cfg.minutes = n
+    history = cfg._history
+    assert [entry.version for entry in history.undo] == [6, 7, 8]
+    assert history.undo[-1].fields == {"minutes": (8, 9)}
+    assert history.undo[-1].computed == {}
+    for _ in range(4):
+        cfg.undo()
+    assert cfg.minutes == 6
+
+
+def test_revert_to(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    cfg.enable_history()
+    cfg.minutes = 2  # version 1
+    cfg.retries = 4  # version 2
+    cfg.minutes = 5  # version 3
+    changes = cfg.revert_to(1)
+    assert changes.fields == {"minutes": (5, 2), "retries": (4, 3)}
+    assert (cfg.minutes, cfg.retries, cfg.get_version()) == (2, 3, 4)
+    cfg.redo()
+    assert (cfg.minutes, cfg.retries) == (2, 4)
+    cfg.revert_to(0)
+    assert (cfg.minutes, cfg.retries) == (1, 3)
+    with pytest.raises(ConfigError):
+        cfg.revert_to(3)
+
+
+def test_undo_errors(schema_clone):
+    cfg = Config.config_factory(schema_clone)
+    with pytest.raises(ConfigError):
+        cfg.undo()
+    cfg.enable_history()
+    cfg.minutes = 2
+    with cfg.transaction():
+        with pytest.raises(ConfigError):
+            cfg.undo()
+    assert len(cfg._history.undo) == 1
+
+
+# --------------------------------------------------------------------
+# Slot-indexed storage
+# --------------------------------------------------------------------
+
+
+def test_slots_config_behaves_like_dict_config(schema):
+    cfg_dict = Config.config_factory(schema)
+    cfg = Config.config_factory(schema, slots=True)
+    assert not hasattr(cfg, "__dict__")
+    assert type(cfg) is not type(cfg_dict)
+    assert isinstance(cfg._values, SlotStore)
+    assert cfg.to_dict() == cfg_dict.to_dict()
+    assert sorted(cfg) == sorted(cfg_dict)
+    assert len(cfg) == len(cfg_dict)
+    assert cfg.inspect_vars() == cfg_dict.inspect_vars()
+
+    cfg.start_transaction()
+    cfg.timeout = 20
+    assert cfg.timeout == 20
+    cfg.debug = True
+    cfg.commit_transaction()
+    assert (cfg.timeout, cfg.debug, cfg.no_debug) == (20, True, False)
+    assert isinstance(cfg._values, SlotStore)
+
+    with pytest.raises(ConfigRangeError):
+        cfg.timeout = 100
+    assert cfg.timeout == 20
+    with pytest.raises(AttributeError):
+        cfg.colour = "red"
+
+
+def test_slots_store_is_replaced_on_commit(schema_clone):
+    cfg = Config.config_factory(schema_clone, slots=True)
+    other = cfg.clone()
+    before = cfg._values
+    cfg.minutes = 2
+    assert cfg._values is not before
+    assert (before["minutes"], other.minutes, other.seconds) == (1, 1, 60)
+    assert (cfg.minutes, cfg.seconds) == (2, 120)
+    assert type(cfg).new_instance(minutes=3).seconds == 180
+
+
+def test_slots_reads_index_the_store_directly(schema_clone, monkeypatch):
+    # a read is one index into the slot list: no mapping lookup by name and,
+    # outside transactions, no look at the pending values
+    cfg = Config.config_factory(schema_clone, slots=True)
+    cfg.minutes = 2
+
+    def no_lookup(store, name):
+        raise AssertionError(f"read of '{name}' went through SlotStore.__getitem__")
+
+    monkeypatch.setattr(SlotStore, "__getitem__", no_lookup)
+    monkeypatch.setattr(cfg, "_tx", _NoThreadLocal())
+    assert (cfg.timeout, cfg.retries, cfg.minutes) == (10, 3, 2)
+
+
 def test__len__magic_function_1(schema):
     cfg = Config.config_factory(schema)
     assert len(cfg) == 15
@@ -0,0 +1,124 @@
+# tests/test_domainfile.py
+import pytest
+
+from konvigius import Config, DomainFile, Schema
+from konvigius import batch
+from konvigius.exceptions import ConfigDomainError
+
+
+@pytest.fixture
+def tenants(tmp_path):
+    values = sorted(f"tenant-{i:x}" for i in range(0, 5000, 3))
+    path = tmp_path / "tenants.txt"
+    path.write_text("\n".join(values) + "\n")
+    return path, values
+
+
+def test_lines_membership(tenants):
+    path, values = tenants
+    domain = DomainFile(path)
+    assert all(value in domain for value in values)
+    absent = [f"tenant-{i:x}" for i in range(1, 5000, 3)]
+    assert not any(value in domain for value in absent)
+    assert "" not in domain
+    assert "a" not in domain and "zzz" not in domain  # before and after all lines
+    assert "tenant-0\ntenant-3" not in domain
+
+
+def test_crlf_lines_and_last_line_without_newline(tmp_path):
+    path = tmp_path / "asn.txt"
+    path.write_bytes(b"13335\r\n15169\r\n32934\r\n8075")  # sorted as text
+    domain = DomainFile(path)
+    assert all(value in domain for value in (13335, 15169, 32934, 8075, b"8075"))
+    assert 1333 not in domain and 9 not in domain
+
+
+@pytest.mark.parametrize("newline", [b"", b"\n"])
+def test_fixed_width_records(tmp_path, newline):
+    values = [b"ab", b"abc", b"b", b"bcdef", b"x"]
+    path = tmp_path / "codes.dat"
+    path.write_bytes(b"".join(v.ljust(5, b" ") + newline for v in values))
+    domain = DomainFile(path, width=5 + len(newline))
+    assert all(value in domain for value in values)
+    assert not any(value in domain for value in ("a", "abcd", "c", "y", ""))
+
+
+def test_open_shares_the_map_of_a_file(tenants):
+    path, _ = tenants
+    domain = DomainFile.open(path)
+    assert DomainFile.open(str(path)) is domain
+    path.write_text("tenant-new\n")  # another size: mapped again
+    assert DomainFile.open(path) is not domain
+    assert "tenant-new" in DomainFile.open(path)
+
+
+def test_schema_domain_file(tenants):
+    path, _ = tenants
+    schema = [
+        Schema("tenant", default="tenant-3", field_type=str, domain_file=path),
+        Schema("backup", field_type=str, domain_file=DomainFile(path)),
+    ]
+    cfg = Config.config_factory(schema)
+    cfg.tenant = "tenant-6"
+    cfg.backup = "tenant-9"
+    cfg.backup = ""  # empty values are not checked, as with `domain`
+    with pytest.raises(
+        ConfigDomainError,
+        match=r"^DomainValidator: value \(tenant-4\) is not in the domain of "
+        r"acceptable values$",
+    ):
+        cfg.tenant = "tenant-4"
+    assert cfg.tenant == "tenant-6"
+
+    schema[0] = Schema("tenant", default="tenant-1", domain_file=path)
+    with pytest.raises(ConfigDomainError, match=r"value \(tenant-1\) is not in"):
+        Config.config_factory(schema)
+
+
+def test_replaced_domain_file_is_used_by_new_configs(tmp_path):
+    path = tmp_path / "values.txt"
+    path.write_text("a\nb\n")
+    schema = [Schema("value", default="a", domain_file=path)]
+    cfg = Config.config_factory(schema)
+    with pytest.raises(ConfigDomainError):
+        cfg.value = "c"
+
+    path.write_text("a\nb\nc\n")
+    cfg = Config.config_factory(schema)
+    cfg.value = "c"
+    assert cfg.value == "c"
+
+
+def test_schema_domain_file_errors(tmp_path):
+    path = tmp_path / "values.txt"
+    path.write_text("a\nb\n")
+
+    def factory(**kwargs):
+        return Config.config_factory([Schema("value", default="a", **kwargs)])
+
+    with pytest.raises(ConfigDomainError, match="domain and domain_file"):
+        factory(domain=("a",), domain_file=path)
+    with pytest.raises(ConfigDomainError, match="cannot use domain file: .*missing"):
+        factory(domain_file=tmp_path / "missing")
+    with pytest.raises(ConfigDomainError, match="must be a path or a DomainFile"):
+        factory(domain_file=["a", "b"])
+    with pytest.raises(ValueError, match="multiple of the record width 3"):
+        DomainFile(path, width=3)
+    (tmp_path / "empty.txt").write_text("")
+    with pytest.raises(ConfigDomainError, match="is empty"):
+        factory(domain_file=tmp_path / "empty.txt")
+
+
+def test_validate_many_searches_domain_file(tmp_path, monkeypatch):
+    path = tmp_path / "ports.txt"
+    path.write_text("443\n80\n8080\n")
+    schema = [Schema("port", default=80, field_type=int, domain_file=path)]
+    records = [{"port": 443}, {"port": 81}, {"port": 0}]
+    for np in (batch.np, None):
+        monkeypatch.setattr(batch, "np", np)
+        results = list(Config.validate_many(schema, records))
+        assert [sorted(r.errors) for r in results] == [[], ["port"], []]
+        assert isinstance(results[1].errors["port"], ConfigDomainError)
+
+
+# === END ===
@@ -0,0 +1,245 @@
+# tests/test_graph.py
+import pytest
+
+from konvigius import Config, Schema, with_field_name
+from konvigius.core.graph import DependencyGraph
+from konvigius.core.view import ANY_FIELD
+from konvigius.exceptions import ConfigMetadataError, ConfigValidationError
+
+# ----------------------------
+# DependencyGraph
+# ----------------------------
+
+
+def test_graph_unknown_nodes_are_always_affected():
+    graph = DependencyGraph(["a", "b"], {})
+    assert graph.affected([]) == {"a", "b"}
+    graph.update("a", set())
+    assert graph.affected([]) == {"b"}
+    assert graph.affected(["a"]) == {"a", "b"}
+
+
+def test_graph_readers_and_wildcard():
+    graph = DependencyGraph(["a", "b", "c"], {})
+    graph.update("a", {"x"})
+    graph.update("b", {ANY_FIELD})
+    graph.update("c", {"y", "c"})
+    assert graph.reads("c") == frozenset({"y"})
+    assert graph.affected(["x"]) == {"a", "b"}
+    assert graph.affected(["y"]) == {"b", "c"}
+    graph.update("a", {"y"})
+    assert graph.affected(["x"]) == {"b"}
+
+
+def test_graph_explicit_dependencies_are_kept():
+    graph = DependencyGraph(["a"], {}, {"a": ("x",)})
+    graph.update("a", set())
+    assert graph.affected(["x"]) == {"a"}
+
+
+def test_graph_updated_copies_on_write():
+    graph = DependencyGraph(["a", "b"], {})
+    graph.update("a", {"x"})
+    graph.update("b", {"y"})
+    assert graph.updated({"a": {"x", "a"}}) is graph
+    new = graph.updated({"a": {"y"}})
+    assert new is not graph
+    assert graph.affected(["x"]) == {"a"}
+    assert new.affected(["x"]) == set()
+
+
+def test_graph_topological_order():
+    graph = DependencyGraph(["c", "b", "a"], {"a2": "a", "b2": "b"})
+    graph.update("a", set())
+    graph.update("b", {"a2"})
+    graph.update("c", {"b2"})
+    assert graph.ordered(["c", "b", "a"]) == ["a", "b", "c"]
+    assert graph.rank("a") < graph.rank("b") < graph.rank("c")
+
+
+def test_graph_cycle_keeps_schema_order():
+    graph = DependencyGraph(["a", "b"], {"a2": "a", "b2": "b"})
+    graph.update("a", {"b2"})
+    graph.update("b", {"a2"})
+    assert graph.ordered(["b", "a"]) == ["a", "b"]
+
+
+def test_graph_copy_is_independent():
+    graph = DependencyGraph(["a"], {})
+    graph.update("a", {"x"})
+    clone = graph.copy()
+    clone.update("a", {"y"})
+    assert graph.affected(["x"]) == {"a"}
+    assert clone.affected(["x"]) == set()
+
+
+# ----------------------------
+# Dependencies of the user functions
+# ----------------------------
+
+
+def test_only_functions_reading_changed_fields_rerun():
+    calls = []
+
+    def fn_check_port_admin(value, cfg):
+        calls.append(value)
+        if value <= 1023 and cfg.userrole != "admin":
+            raise ConfigValidationError("Port not permitted")
+
+    schema = [
+        Schema("port", default=3274, field_type=int, fn_validator=fn_check_port_admin),
+        Schema("userrole", default="guest", field_type=str),
+        Schema("timeout", default=10, field_type=int),
+    ]
+    cfg = Config.config_factory(schema)
+    assert calls == [3274]
+
+    cfg.timeout = 20  # not read by the validator
+    cfg.userrole = "tester"  # not read either: port > 1023
+    assert calls == [3274]
+
+    cfg.start_transaction()
+    cfg.port = 80
+    cfg.userrole = "admin"
+    cfg.commit_transaction()
+    assert calls == [3274, 80]
+
+    cfg.timeout = 30
+    assert calls == [3274, 80]
+
+    with pytest.raises(ConfigValidationError):
+        cfg.userrole = "guest"  # now read by the validator
+    assert calls == [3274, 80, 80]
+    assert cfg.userrole == "admin"
+
+
+def test_computed_fields_rerun_in_topological_order():
+    calls = []
+
+    @with_field_name("x2")
+    def fn_x2(value, cfg):
+        calls.append("x2")
+        return value * 2
+
+    @with_field_name("y2")
+    def fn_y2(value, cfg):
+        calls.append("y2")
+        return cfg.x2 + value
+
+    schema = [
+        Schema("x", default=1, field_type=int, fn_computed=fn_x2),
+        Schema("y", default=10, field_type=int, fn_computed=fn_y2),
+        Schema("z", default=0, field_type=int),
+    ]
+    cfg = Config.config_factory(schema)
+    assert cfg.y2 == 12
+    calls.clear()
+
+    cfg.z = 5
+    assert calls == []
+
+    cfg.x = 3  # y2 reads the computed x2, so it reruns after x2
+    assert calls == ["x2", "y2"]
+    assert cfg.y2 == 16
+
+
+def test_unchanged_computed_value_stops_propagation():
+    calls = []
+
+    @with_field_name("is_big")
+    def fn_is_big(value, cfg):
+        return value > 100
+
+    @with_field_name("label")
+    def fn_label(value, cfg):
+        calls.append(value)
+        return "big" if cfg.is_big else "small"
+
+    schema = [
+        Schema("size", default=1, field_type=int, fn_computed=fn_is_big),
+        Schema("name", default="n", field_type=str, fn_computed=fn_label),
+    ]
+    cfg = Config.config_factory(schema)
+    calls.clear()
+    cfg.size = 2
+    assert calls == []
+    cfg.size = 200
+    assert calls == ["n"]
+    assert cfg.label == "big"
+
+
+def test_reading_a_whole_store_depends_on_all_fields():
+    calls = []
+
+    def fn_check(value, cfg):
+        calls.append(cfg._values["a"])
+
+    schema = [
+        Schema("a", default=1, field_type=int),
+        Schema("b", default=2, field_type=int, fn_validator=fn_check),
+    ]
+    cfg = Config.config_factory(schema)
+    cfg.a = 5
+    assert calls == [1, 1]
+
+
+def test_explicit_depends_on():
+    calls = []
+
+    def fn_check(value, cfg):
+        calls.append(value)
+
+    schema = [
+        Schema("a", default=1, field_type=int, fn_validator=fn_check,
+               depends_on="max-a"),
+        Schema("max_a", default=2, field_type=int),
+        Schema("c", default=3, field_type=int),
+    ]
+    cfg = Config.config_factory(schema)
+    assert cfg.get_meta("a")._depends_on == ("max_a",)
+    cfg.c = 4
+    assert calls == [1]
+    cfg.max_a = 10
+    assert calls == [1, 1]
+
+
+def test_propagated_node_keeps_reads_of_its_validator():
+    @with_field_name("x")
+    def fn_x(value, cfg):
+        return value
+
+    @with_field_name("y")
+    def fn_y(value, cfg):
+        return cfg.x + 1
+
+    def fn_check_b(value, cfg):
+        if value >= cfg.c:
+            raise ConfigValidationError("b must be less than c")
+
+    schema = [
+        Schema("a", default=1, field_type=int, fn_computed=fn_x),
+        Schema("b", default=0, field_type=int, fn_computed=fn_y,
+               fn_validator=fn_check_b),
+        Schema("c", default=10, field_type=int),
+    ]
+    cfg = Config.config_factory(schema)
+    cfg.a = 5  # reruns only the computed function of b
+    assert cfg.y == 6
+    with pytest.raises(ConfigValidationError):
+        cfg.c = -1
+    assert cfg.c == 10
+
+
+def test_depends_on_unknown_field_raises():
+    schema = [Schema("a", default=1, depends_on=("nope",))]
+    with pytest.raises(ConfigMetadataError, match="unknown field 'nope'"):
+        Config.config_factory(schema)
+
+
+@pytest.mark.parametrize("arg", [1, ["a"], ("a", 2)])
+def test_depends_on_wrong_type_raises(arg):
+    with pytest.raises(ConfigMetadataError):
+        Config.config_factory([Schema("a", default=1, depends_on=arg)])
+
+
+# === END ===
@@ -2,10 +2,12 @@
 import re
 import pytest
 from typing import Any
+import threading
 import types
 
 from konvigius.configlib import Config, Option
 from konvigius.core.types import Schema
+from konvigius.core.view import ConfigView
 from konvigius.exceptions import (
     ConfigMetadataError,
     ConfigTypeError,
@@ -412,10 +414,146 @@ def test_validate_fn_compute_def_raises_2():
         Config.config_factory(entry)
 
 
+# ----------------------------
+# Compiled validation plan
+# ----------------------------
+
+
+def test_plan_is_empty_without_constraints():
+    cfg = Config.config_factory([Schema("username")])
+    opt = cfg.get_meta("username")
+    assert opt._check is None
+    assert all(v.compile() is None for v in opt._create_validators())
+
+
+def test_plan_is_empty_when_validation_is_off():
+    cfg = Config.config_factory([Schema("username", r_min=1, no_validate=True)])
+    assert cfg.get_meta("username")._check is None
+
+
+def test_plan_leaves_out_checks_that_never_fire():
+    entry = Schema("port", default=80, field_type=int, domain=())
+    cfg = Config.config_factory([entry])
+    opt = cfg.get_meta("port")
+    compiled = [v.compile() for v in opt._create_validators()]
+    assert [fn is not None for fn in compiled] == [True, False, False, False]
+    assert opt._check.__name__ == "check_type"
+
+
+@pytest.mark.parametrize(
+    "entry, value, exc, message",
+    [
+        (Schema("x", field_type=int), "a", ConfigTypeError,
+         "TypeValidator: value is of the wrong type; got type str"),
+        (Schema("x", default=1, required=True), "", ConfigRequiredError,
+         "RequiredValidator: value can not be None or empty"),
+        (Schema("x", domain=(1, 2)), 3, ConfigDomainError,
+         "DomainValidator: value (3) is not in the domain of acceptable values"),
+        (Schema("x", r_min=2), 1, ConfigRangeError,
+         "RangeValidator: value (1) must be >= min-value (2)"),
+        (Schema("x", r_max=2), "abc", ConfigRangeError,
+         "RangeValidator: value (3) must be <= max-value (2)"),
+        (Schema("x", r_max=2), object(), ConfigValidationError,
+         "RangeValidator [TypeError]: "),
+        (Schema("x", domain=(1, 2)), [1], ConfigValidationError,
+         "DomainValidator [TypeError]: "),
+    ],
+)
+def test_plan_raises_same_errors_as_validators(entry, value, exc, message):
+    cfg = Config.config_factory([entry])
+    opt = cfg.get_meta("x")
 
+    with pytest.raises(exc) as compiled_error:
+        opt._check(value)
+    with pytest.raises(exc) as validator_error:
+        for validator in opt._create_validators():
+            validator(value, cfg=None)
 
+    assert type(compiled_error.value) is type(validator_error.value)
+    assert str(compiled_error.value) == str(validator_error.value)
+    assert str(compiled_error.value).startswith(message)
+
+
+# ----------------------------
+# Memory-lean options
+# ----------------------------
+
+
+def test_option_and_schema_have_slots():
+    entry = Schema("x", default=1)
+    opt = Option(entry)
+    assert not hasattr(entry, "__dict__")
+    assert not hasattr(opt, "__dict__")
+    with pytest.raises(AttributeError):
+        opt.colour = "red"
+
+
+def test_help_line_is_formatted_on_first_use():
+    opt = Option(Schema("x", default=1), {"x": "Mapped help"})
+    assert opt._help_text is None
+    assert opt.help_text == "Mapped help (default '1')"
+    opt.help_text = "Other help"
+    assert opt.help_text == "Other help"
+
+
+def test_options_with_equal_constraints_share_the_check():
+    cfg = Config.config_factory(
+        [
+            Schema("a", default=1, field_type=int, r_min=0, r_max=5),
+            Schema("b", default=2, field_type=int, r_min=0, r_max=5),
+            Schema("c", default=2, field_type=int, r_min=0.0, r_max=5),
+        ]
+    )
+    a, b, c = (cfg.get_meta(name) for name in "abc")
+    assert a._check is b._check
+    assert a._check is not c._check
+    with pytest.raises(ConfigRangeError, match=r"min-value \(0\.0\)"):
+        cfg.c = -1
+
+
+# ----------------------------
+# Validators are stateless per call
+# ----------------------------
 
 
+def test_validators_keep_no_call_state():
+    cfg = Config.config_factory([Schema("x", fn_validator=lambda v, cfg: None)])
+    opt = cfg.get_meta("x")
+    opt.validate_custom(1, cfg._view())
+    assert "cfg" not in vars(opt._custom_validator)
+    assert "cfg" not in vars(opt._comp_validator)
+
+
+def test_concurrent_calls_see_their_own_config():
+    barrier = threading.Barrier(2, timeout=5)
+    armed = []
+
+    def wait(value, cfg):
+        if armed:
+            barrier.wait()  # both threads are inside the same validator now
+
+    def check(value, cfg):
+        if cfg.x != value:
+            raise ConfigValidationError(f"saw {cfg.x}, expected {value}")
+
+    cfg = Config.config_factory([Schema("x", default=0, fn_validator=(wait, check))])
+    opt = cfg.get_meta("x")
+    armed.append(True)
+    errors = []
+
+    def run(value):
+        view = ConfigView({"x": value}, {}, {})
+        try:
+            opt.validate_custom(value, view)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in (1, 2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
 
 
 # === END ===
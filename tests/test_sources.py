@@ -0,0 +1,589 @@
+# tests/test_sources.py
+import io
+import json
+import pickle
+import sys
+
+import pytest
+
+from konvigius import Config, Schema, with_field_name
+import konvigius.cli_parser as cli
+from konvigius.sources import (
+    CLISource,
+    DictSource,
+    EnvSource,
+    DirectorySource,
+    IniSource,
+    JsonSource,
+    Source,
+    TomlSource,
+    load_cache_key,
+    string_converter,
+)
+from konvigius.validators import TypeValidator
+from konvigius.exceptions import (
+    ConfigError,
+    ConfigInvalidFieldError,
+    ConfigRangeError,
+    ConfigTypeError,
+    ConfigValidationError,
+)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def schema(calls):
+    def check_port(value, cfg):
+        calls.append(value)
+        if value < 1024 and cfg.userrole != "admin":
+            raise ConfigValidationError("port below 1024 requires admin")
+
+    return [
+        Schema("port|p", default=8080, field_type=int, fn_validator=check_port),
+        Schema("timeout|t", default=10, field_type=int, r_min=1, r_max=60),
+        Schema("userrole|r", default="guest", field_type=str),
+        Schema(
+            "minutes",
+            default=1,
+            field_type=int,
+            fn_computed=with_field_name("seconds")(lambda v, cfg: v * 60),
+        ),
+    ]
+
+
+def test_load_layers_and_validates_once(schema, calls):
+    Config.config_factory(schema)  # compiles and caches the schema
+    calls.clear()
+    cfg = Config.load(
+        schema,
+        sources=[
+            {"port": 80, "timeout": 20},
+            DictSource({"port": 443, "userrole": "admin"}, "site.json"),
+            CLISource(["--port", "444", "--minutes", "2"]),
+        ],
+    )
+    assert (cfg.port, cfg.timeout, cfg.userrole, cfg.seconds) == (444, 20, "admin", 120)
+    assert calls == [444]
+    assert cfg.get_version() == 1
+    assert {name: cfg.get_source(name) for name in cfg._metadata} == {
+        "port": "cli --port",
+        "timeout": "dict",
+        "userrole": "site.json",
+        "minutes": "cli --minutes",
+    }
+
+
+def test_load_records_origin_of_values_equal_to_the_default(schema):
+    cfg = Config.load(schema, sources=[DictSource({"timeout": 10}, "base.json")])
+    assert cfg.get_source("timeout") == "base.json"
+    assert cfg.get_source("port") == "default"
+    cfg.timeout = 30
+    assert cfg.get_source("timeout") == "set"
+    with pytest.raises(ConfigInvalidFieldError):
+        cfg.get_source("colour")
+
+
+def test_load_errors_name_the_origin(schema):
+    with pytest.raises(ConfigRangeError, match=r"^site.json: RangeValidator"):
+        Config.load(schema, sources=[DictSource({"timeout": 99}, "site.json")])
+    with pytest.raises(ConfigValidationError, match=r"^cli --port: "):
+        Config.load(schema, sources=[CLISource(["--port", "80"])])
+    with pytest.raises(ConfigInvalidFieldError, match=r"^extra: Invalid config field"):
+        Config.load(schema, sources=[DictSource({"colour": "red"}, "extra")])
+
+
+def test_inspect_vars_shows_the_origin(schema):
+    class Fixed(Source):
+        name = "fixed"
+
+        def read(self, cfg):
+            return {"minutes": 3}
+
+        def origin(self, name):
+            return f"fixed:{name}"
+
+    cfg = Config.load(schema, sources=[Fixed()])
+    table = cfg.inspect_vars()
+    assert "| 'minutes'       | 3                      | 'fixed:minutes' |" in table
+    assert "| 'port'          | 8080                   | 'default' |" in table
+    assert "| 'seconds'       | 180                    | 'C'    |" in table
+    with pytest.raises(TypeError):
+        Source()  # read() is abstract
+
+
+def test_run_parser_commits_once(schema, calls):
+    cfg = Config.config_factory(schema)
+    calls.clear()
+    cli.run_parser(cfg, cli_args=["--port", "443", "-r", "admin", "-t", "5"])
+    assert (cfg.port, cfg.userrole, cfg.timeout) == (443, "admin", 5)
+    assert calls == [443]
+    assert cfg.get_version() == 1
+
+
+# --------------------------------------------------------------------
+# Environment variables
+# --------------------------------------------------------------------
+
+
+@pytest.fixture
+def schema_env():
+    return [
+        Schema("debug", field_type=bool),
+        Schema("port", default=8080, field_type=int),
+        Schema("ratio", default=0.5, field_type=(int, float)),
+        Schema("hosts", default=["localhost"], field_type=list),
+        Schema("tags", default=set(), field_type=set),
+        Schema("name", default="app", field_type=str),
+        Schema("level", default=1, field_type=(int, str)),
+    ]
+
+
+def test_from_env(schema_env, monkeypatch):
+    monkeypatch.setenv("APP_DEBUG", "yes")
+    monkeypatch.setenv("APP_PORT", "443")
+    monkeypatch.setenv("APP_RATIO", "0.25")
+    monkeypatch.setenv("APP_HOSTS", "a.example, b.example")
+    monkeypatch.setenv("APP_TAGS", "x,y,x")
+    monkeypatch.setenv("APP_LEVEL", "high")
+    monkeypatch.setenv("PORT", "1")  # no prefix
+    cfg = Config.from_env(schema_env, prefix="APP_")
+    assert cfg.to_dict() == {
+        "debug": True,
+        "port": 443,
+        "ratio": 0.25,
+        "hosts": ["a.example", "b.example"],
+        "tags": {"x", "y"},
+        "name": "app",
+        "level": "high",
+    }
+    assert cfg.no_debug is False
+    assert cfg.get_source("port") == "env APP_PORT"
+    assert cfg.get_source("name") == "default"
+
+
+def test_env_source_scans_the_environment_once(schema_env):
+    class Environ(dict):
+        scans = 0
+
+        def items(self):
+            Environ.scans += 1
+            return super().items()
+
+    environ = Environ(APP_PORT="1", APP_NAME="x", OTHER="y")
+    cfg = Config.load(schema_env, [EnvSource("APP_", environ)])
+    assert (cfg.port, cfg.name, Environ.scans) == (1, "x", 1)
+
+
+def test_env_conversion_errors(schema_env):
+    with pytest.raises(ConfigTypeError, match=r"^env APP_PORT: .*'eighty'"):
+        Config.load(schema_env, [EnvSource("APP_", {"APP_PORT": "eighty"})])
+    with pytest.raises(ConfigTypeError, match=r"^env APP_DEBUG: "):
+        Config.load(schema_env, [EnvSource("APP_", {"APP_DEBUG": "maybe"})])
+
+
+def test_string_converters_are_compiled_once():
+    assert string_converter(int) is string_converter(int)
+    assert string_converter((int, float)) is string_converter((int, float))
+    assert string_converter((int, float))("3") == 3
+    assert string_converter(tuple)("") == ()
+    assert string_converter(None)("x") == "x"
+
+
+# --------------------------------------------------------------------
+# TOML and INI files
+# --------------------------------------------------------------------
+
+
+TOML = """\
+title = "example"
+
+[service]
+port = 443
+timeout = 20
+"hosts" = ["a", "b"]
+
+[service.extra]
+port = 1
+"""
+
+INI = """\
+[DEFAULT]
+timeout = 20
+
+[service]
+port = 443
+debug = on
+hosts = a, b
+"""
+
+
+@pytest.fixture
+def schema_files():
+    return [
+        Schema("port", default=8080, field_type=int, r_min=80),
+        Schema("timeout", default=10, field_type=int),
+        Schema("debug", field_type=bool),
+        Schema("hosts", default=(), field_type=tuple),
+    ]
+
+
+def test_from_toml(schema_files, tmp_path):
+    path = tmp_path / "app.toml"
+    path.write_text(TOML)
+    cfg = Config.from_toml(schema_files, path, table="service")
+    assert (cfg.port, cfg.timeout, cfg.hosts) == (443, 20, ("a", "b"))
+    assert cfg.get_source("port") == f"{path}:4"
+    assert cfg.get_source("hosts") == f"{path}:6"
+    assert cfg.get_source("debug") == "default"
+
+
+def test_from_ini(schema_files, tmp_path):
+    path = tmp_path / "app.ini"
+    path.write_text(INI)
+    cfg = Config.from_ini(schema_files, path, section="service")
+    assert (cfg.port, cfg.timeout, cfg.debug, cfg.hosts) == (443, 20, True, ("a", "b"))
+    assert cfg.get_source("port") == f"{path}:5"
+    assert cfg.get_source("timeout") == f"{path}:2"
+    assert Config.from_ini(schema_files, path).to_dict()["timeout"] == 20
+
+
+def test_ini_values_are_not_interpolated(tmp_path):
+    path = tmp_path / "app.ini"
+    path.write_text("[DEFAULT]\nstatus = 100% done\nhome = %(HOME)s\n")
+    schema = [Schema("status", field_type=str), Schema("home", field_type=str)]
+    cfg = Config.from_ini(schema, path)
+    assert (cfg.status, cfg.home) == ("100% done", "%(HOME)s")
+
+    path.write_text("[DEFAULT]\nstatus = 50%%\n\n[job]\nhome = %(status)s/x\n")
+    values = IniSource(path, section="job").read(cfg)
+    assert values == {"home": "%(status)s/x", "status": "50%%"}
+
+
+def test_ini_keys_keep_their_case(tmp_path):
+    path = tmp_path / "app.ini"
+    path.write_text("[DEFAULT]\n# retries\nmaxRetries = 3\n")
+    cfg = Config.from_ini([Schema("maxRetries", default=1, field_type=int)], path)
+    assert cfg.maxRetries == 3
+    assert cfg.get_source("maxRetries") == f"{path}:3"
+
+
+def test_file_errors_name_file_and_line(schema_files, tmp_path):
+    path = tmp_path / "app.toml"
+    path.write_text(TOML)
+    with pytest.raises(ConfigRangeError, match=rf"^{path}:9: RangeValidator"):
+        Config.from_toml(schema_files, path, table="service.extra")
+    with pytest.raises(ConfigInvalidFieldError, match=rf"^{path}:1: Invalid"):
+        Config.from_toml(schema_files, path)
+
+    path = tmp_path / "app.ini"
+    path.write_text(INI.replace("443", "https"))
+    with pytest.raises(ConfigTypeError, match=rf"^{path}:5: .*'https'"):
+        Config.from_ini(schema_files, path, section="service")
+    with pytest.raises(ConfigError, match=r"no section \[other\]"):
+        Config.from_ini(schema_files, path, section="other")
+
+    path.write_text("port = [")
+    with pytest.raises(ConfigError, match=rf"^{path}: "):
+        Config.from_toml(schema_files, path)
+    with pytest.raises(ConfigError, match=r"^.*missing.toml: "):
+        Config.from_toml(schema_files, tmp_path / "missing.toml")
+
+
+# --------------------------------------------------------------------
+# Streaming JSON
+# --------------------------------------------------------------------
+
+
+class Reader(io.StringIO):
+    """A document that fails when read beyond `limit` characters."""
+
+    def __init__(self, text, limit=None):
+        super().__init__(text)
+        self.limit = len(text) if limit is None else limit
+
+    def read(self, size=-1):
+        if self.tell() >= self.limit:
+            raise AssertionError("read beyond the needed part")
+        return super().read(size)
+
+
+def bundle(tail=""):
+    return json.dumps(
+        {
+            "assets": {"blob": "x" * 1000, "list": [1, [2, {"a": "]}"}], "q\\\""]},
+            "services": {
+                "web": {"port": 8081},
+                "api": {
+                    "notes": {"nested": [True, None, 1.5e3]},
+                    "hosts": ["a", "b"],
+                    "port": 443,
+                    "timeout": 20,
+                    "debug": True,
+                    "port ": "not a field",
+                },
+            },
+        }
+    )[:-1] + tail
+
+
+def test_from_json(schema_files):
+    text = bundle(', "rest": [' + "0," * 1000 + "0]}")
+    for chunk_size in (7, 65536):
+        source = JsonSource(Reader(text), "/services/api", chunk_size=chunk_size)
+        cfg = Config.load(schema_files, [source])
+        assert (cfg.port, cfg.timeout, cfg.debug, cfg.hosts) == (443, 20, True, ("a", "b"))
+        assert cfg.get_source("port") == "json#/services/api/port"
+    cfg = Config.from_json(schema_files, io.BytesIO(text.encode()), "/services/web")
+    assert (cfg.port, cfg.timeout) == (8081, 10)
+
+
+def test_from_json_stops_reading_when_all_fields_are_found(schema_files):
+    text = bundle(', "rest": ' + "[" * 10000)  # never read
+    limit = text.index('"rest"')
+    source = JsonSource(Reader(text, limit), "/services/api", chunk_size=16)
+    cfg = Config.load(schema_files, [source])
+    assert cfg.port == 443
+    assert source.chars_read < limit
+
+
+def test_json_numbers_cut_by_chunk_boundaries():
+    schema = [
+        Schema("ratio", field_type=float),
+        Schema("scale", field_type=float),
+        Schema("big", field_type=float),
+        Schema("count", field_type=int),
+        Schema("flag", field_type=bool),
+    ]
+    text = (
+        '{"ratio": 1.5, "scale": -2.5e-3, "big": 1E+10, "count": 120,'
+        ' "flag": true, "rest": [0.25, 3e2]}'
+    )
+    expected = {"ratio": 1.5, "scale": -0.0025, "big": 1e10, "count": 120, "flag": True}
+    for chunk_size in range(1, len(text) + 1):
+        for fp in (io.StringIO(text), io.BytesIO(text.encode())):
+            cfg = Config.load(schema, [JsonSource(fp, chunk_size=chunk_size)])
+            assert cfg.to_dict() == expected, chunk_size
+
+
+def test_from_json_errors(schema_files):
+    text = bundle("}")
+    with pytest.raises(ConfigError, match=r"^json: no value at /services/db"):
+        Config.from_json(schema_files, io.StringIO(text), "/services/db")
+    with pytest.raises(ConfigTypeError, match=r"^json#/port: TypeValidator: .* str"):
+        Config.from_json(schema_files, io.StringIO('{"port": "443"}'))
+    with pytest.raises(ConfigRangeError, match=r"^json#/port: RangeValidator"):
+        Config.from_json(schema_files, io.StringIO('{"port": 1}'))
+    with pytest.raises(ConfigError, match=r"^json: Expecting"):
+        Config.from_json(schema_files, io.StringIO('{"timeout" 1}'))
+    cfg = Config.from_json(schema_files, io.StringIO('{"a": [{"port": 81}]}'), "/a/0")
+    assert cfg.port == 81
+
+
+def test_from_json_skips_the_checks_of_unvalidated_fields():
+    schema = [Schema("port", default=1, field_type=int, no_validate=True)]
+    cfg = Config.from_json(schema, io.StringIO('{"port": "abc"}'))
+    assert cfg.port == "abc"
+
+
+# --------------------------------------------------------------------
+# conf.d directories
+# --------------------------------------------------------------------
+
+
+def test_from_dir_merges_fragments_in_lexical_order(schema_files, tmp_path):
+    (tmp_path / "10-base.toml").write_text("port = 443\ntimeout = 20\n")
+    (tmp_path / "20-site.ini").write_text("[DEFAULT]\n\ntimeout = 30\n")
+    (tmp_path / "30-local.json").write_text('{"debug": true}')
+    (tmp_path / "README").write_text("not a fragment")
+    (tmp_path / "05-early.toml").write_text("port = 8443\n")
+    cfg = Config.from_dir(schema_files, tmp_path)
+    assert (cfg.port, cfg.timeout, cfg.debug) == (443, 30, True)
+    assert cfg.get_source("port") == f"{tmp_path / '10-base.toml'}:1"
+    assert cfg.get_source("timeout") == f"{tmp_path / '20-site.ini'}:3"
+    assert cfg.get_source("debug") == f"{tmp_path / '30-local.json'}#/debug"
+
+
+def test_dir_source_reparses_only_changed_fragments(schema_files, tmp_path):
+    base = tmp_path / "10-base.toml"
+    base.write_text("port = 443\n")
+    (tmp_path / "20-site.toml").write_text("timeout = 30\n")
+    source = DirectorySource(tmp_path)
+    assert Config.load(schema_files, [source]).port == 443
+    assert source.parsed == 2
+
+    assert Config.load(schema_files, [source]).port == 443
+    assert source.parsed == 0
+
+    base.write_text("port = 8443\n")
+    cfg = Config.load(schema_files, [source])
+    assert (cfg.port, cfg.timeout, source.parsed) == (8443, 30, 1)
+
+    base.unlink()
+    cfg = Config.load(schema_files, [source])
+    assert (cfg.port, cfg.timeout, source.parsed) == (8080, 30, 0)
+    assert list(source._cache) == [str(tmp_path / "20-site.toml")]
+
+
+def test_dir_source_errors(schema_files, tmp_path):
+    with pytest.raises(ConfigError, match=r"missing: "):
+        Config.from_dir(schema_files, tmp_path / "missing")
+    (tmp_path / "10-bad.toml").write_text("\nport = 1\n")
+    with pytest.raises(ConfigRangeError, match=r"10-bad.toml:2: RangeValidator"):
+        Config.from_dir(schema_files, tmp_path)
+
+
+@pytest.mark.parametrize(
+    "fragment, origin",
+    [
+        ("10-a.toml", "10-a.toml:2"),
+        ("10-a.ini", "10-a.ini:3"),
+        ("10-a.json", "10-a.json#/prot"),
+    ],
+)
+def test_dir_source_rejects_unknown_keys_in_every_format(
+    schema_files, tmp_path, fragment, origin
+):
+    text = {
+        ".toml": "port = 443\nprot = 2\n",
+        ".ini": "[DEFAULT]\nport = 443\nprot = 2\n",
+        ".json": '{"port": 443, "nested": {"x": 1}, "prot": 2, "debug": true}',
+    }
+    path = tmp_path / fragment
+    path.write_text(text[path.suffix])
+    with pytest.raises(ConfigInvalidFieldError, match=rf"{origin}: Invalid .*'prot'"):
+        Config.from_dir(schema_files, tmp_path)
+
+
+# --------------------------------------------------------------------
+# On-disk cache of loaded configurations
+# --------------------------------------------------------------------
+
+VALIDATED = []
+
+
+def check_timeout(value, cfg):
+    VALIDATED.append(value)
+
+
+@pytest.fixture
+def schema_cached(schema_files):
+    VALIDATED.clear()
+    return schema_files + [
+        Schema(
+            "minutes",
+            default=1,
+            field_type=int,
+            fn_validator=check_timeout,
+            fn_computed=with_field_name("seconds")(lambda v, cfg: v * 60),
+        )
+    ]
+
+
+def test_load_cache_restores_without_validating(schema_cached, tmp_path, monkeypatch):
+    init_validate = TypeValidator._init_validate
+    inits = []
+
+    def spy(self):
+        inits.append(self.option.name)
+        init_validate(self)
+
+    monkeypatch.setattr(TypeValidator, "_init_validate", spy)
+    path = tmp_path / "app.toml"
+    path.write_text("port = 443\nminutes = 2\n")
+    cache_dir = tmp_path / "cache"
+
+    def load():
+        environ = {"APP_TIMEOUT": "30"}
+        sources = [TomlSource(path), EnvSource("APP_", environ), {"debug": True}]
+        return Config.load(schema_cached, sources, cache_dir=cache_dir, slots=True)
+
+    cfg = load()  # a miss: loaded and cached
+    assert VALIDATED == [1, 2]
+    assert len(list(cache_dir.iterdir())) == 1
+
+    Config.clear_schema_cache()  # as in a new process
+    VALIDATED.clear()
+    inits.clear()
+    cached = load()
+    assert VALIDATED == [] and inits == []
+    assert cached.to_dict() == cfg.to_dict()
+    assert (cached.seconds, cached.no_debug) == (120, False)
+    assert cached.get_source("timeout") == "env APP_TIMEOUT"
+    assert cached.get_version() == cfg.get_version()
+
+    cached.minutes = 3  # validated as usual
+    assert (cached.seconds, VALIDATED, inits) == (180, [3], ["minutes"])
+    with pytest.raises(ConfigRangeError):
+        cached.port = 1
+    assert Config.config_factory(schema_cached, slots=True).seconds == 60
+
+    path.write_text("port = 443\nminutes = 4\n")  # other contents: a miss
+    assert load().seconds == 240
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_load_cache_misses(schema_cached, tmp_path):
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "app.toml"
+    path.write_text("port = 1\n")
+    for _ in range(2):  # invalid values are not cached
+        with pytest.raises(ConfigRangeError, match="app.toml:1: "):
+            Config.from_toml(schema_cached, path, cache_dir=cache_dir)
+    assert not cache_dir.exists()
+
+    fp = io.StringIO('{"port": 443}')  # a stream has no fingerprint
+    assert Config.from_json(schema_cached, fp, cache_dir=cache_dir).port == 443
+    assert not cache_dir.exists()
+
+    path.write_text("port = 443\n")
+    Config.from_toml(schema_cached, path, cache_dir=cache_dir)
+    (cache_file,) = cache_dir.iterdir()
+    cache_file.write_bytes(b"corrupt")
+    assert Config.from_toml(schema_cached, path, cache_dir=cache_dir).port == 443
+    assert [p.name for p in cache_dir.iterdir()] == [cache_file.name]  # rewritten
+    assert Config._restore(schema_cached, *pickle.loads(cache_file.read_bytes()))
+
+
+PORT_LIMIT = 9000
+
+
+def check_port_limit(value, cfg):
+    if value > PORT_LIMIT:
+        raise ValueError(f"{value} > {PORT_LIMIT}")
+
+
+def test_load_cache_key_covers_the_globals_of_functions(tmp_path, monkeypatch):
+    schema = [Schema("port", default=1, field_type=int, fn_validator=check_port_limit)]
+    path = tmp_path / "app.toml"
+    path.write_text("port = 8080\n")
+    cache_dir = tmp_path / "cache"
+    assert Config.from_toml(schema, path, cache_dir=cache_dir).port == 8080
+
+    monkeypatch.setattr(sys.modules[__name__], "PORT_LIMIT", 100)
+    Config.clear_schema_cache()  # as in a new process
+    with pytest.raises(ConfigValidationError, match="8080 > 100"):
+        Config.from_toml(schema, path, cache_dir=cache_dir)
+
+
+def test_load_cache_key_is_portable(schema_files, tmp_path):
+    def key(schema, values):
+        return load_cache_key(schema, [DictSource(values)])
+
+    def double(v, cfg):
+        return v * 2
+
+    computed = with_field_name("double")(double)
+    schema = [Schema("minutes", default=1, field_type=int, fn_computed=computed)]
+    assert key(schema, {"minutes": 2}) == key(list(schema), {"minutes": 2})
+    assert key(schema, {"minutes": 2}) != key(schema, {"minutes": 3})
+    assert key(schema, {}) != key(schema_files, {})
+    other = [Schema("minutes", default=1, field_type=int, fn_computed=str)]
+    assert key(schema, {}) != key(other, {})
+    assert load_cache_key(schema, [CLISource([])]) is None
+
+
+# === END ===
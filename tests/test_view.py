@@ -0,0 +1,110 @@
+# tests/test_view.py
+import pytest
+
+from konvigius import Config, Schema, with_field_name
+from konvigius.core.view import ConfigView
+
+# ----------------------------
+# ConfigView
+# ----------------------------
+
+
+def test_view_chains_pending_values_computed_values():
+    view = ConfigView({"a": 1, "b": 2}, {"b": 20}, {"c": 3})
+    assert view.a == 1
+    assert view.b == 20
+    assert view.c == 3
+    assert "c" in view
+    assert "d" not in view
+    assert view._values == {"a": 1, "b": 2}
+    assert view._computed_values == {"c": 3}
+
+
+def test_view_shares_stores_without_copy():
+    values = {"a": 1}
+    view = ConfigView(values, {}, {})
+    values["a"] = 99
+    assert view.a == 99
+
+
+def test_view_unknown_field_raises():
+    view = ConfigView({"a": 1}, {}, {})
+    with pytest.raises(AttributeError, match="config has no field 'zzz'"):
+        view.zzz
+
+
+def test_view_is_read_only():
+    view = ConfigView({"a": 1}, {}, {})
+    with pytest.raises(AttributeError, match="read-only"):
+        view.a = 2
+    with pytest.raises(AttributeError, match="read-only"):
+        del view.a
+    assert view.a == 1
+
+
+def test_view_repr_and_dir():
+    view = ConfigView({"b": 2, "a": 1}, {}, {"c": 3})
+    assert repr(view) == "ConfigView(a=1, b=2, c=3)"
+    assert dir(view) == ["a", "b", "c"]
+
+
+# ----------------------------
+# ConfigView passed to validators
+# ----------------------------
+
+
+def test_validators_receive_one_view_per_commit(monkeypatch):
+    seen = []
+
+    def fn_check(value, cfg):
+        seen.append(cfg)
+
+    @with_field_name("doubled")
+    def fn_doubled(value, cfg):
+        seen.append(cfg)
+        return cfg.port * 2
+
+    schema = [
+        Schema("port", default=80, field_type=int, fn_validator=fn_check),
+        Schema("host", default="localhost", fn_validator=fn_check,
+               fn_computed=fn_doubled),
+    ]
+    cfg = Config.config_factory(schema)
+
+    def fail(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("copy_config() must not be used by validators")
+
+    monkeypatch.setattr(Config, "copy_config", fail)
+    seen.clear()
+
+    cfg.start_transaction()
+    cfg.port = 8080
+    cfg.host = "example.com"
+    cfg.commit_transaction()
+
+    assert len(seen) == 3
+    assert all(isinstance(view, ConfigView) for view in seen)
+    assert all(view._chain is seen[0]._chain for view in seen)  # nothing copied
+    assert cfg.doubled == 16160
+
+
+def test_custom_validator_sees_pending_values_via_attributes():
+    seen = []
+
+    def fn_record(value, cfg):
+        seen.append((cfg.userrole, cfg._values["userrole"]))
+
+    schema = [
+        Schema("port", default=3274, field_type=int, fn_validator=fn_record),
+        Schema("userrole", default="guest", field_type=str),
+    ]
+    cfg = Config.config_factory(schema)
+    cfg.start_transaction()
+    cfg.port = 80
+    cfg.userrole = "admin"
+    cfg.commit_transaction()
+    assert seen == [("guest", "guest"), ("admin", "guest")]
+    assert cfg.userrole == "admin"
+
+
+# === END ===
@@ -0,0 +1,205 @@
+# tests/test_watch.py
+import sys
+import time
+
+import pytest
+
+from konvigius import Config, Schema, with_field_name
+from konvigius.sources import DirectorySource, EnvSource, Source, TomlSource
+from konvigius.watch import ConfigWatcher
+from konvigius.exceptions import ConfigError, ConfigRangeError
+
+
+@pytest.fixture
+def schema():
+    return [
+        Schema("port", default=8080, field_type=int, r_min=80),
+        Schema("timeout", default=10, field_type=int),
+        Schema(
+            "minutes",
+            default=1,
+            field_type=int,
+            fn_computed=with_field_name("seconds")(lambda v, cfg: v * 60),
+        ),
+    ]
+
+
+@pytest.fixture
+def app_toml(tmp_path):
+    path = tmp_path / "app.toml"
+    path.write_text("port = 443\ntimeout = 20\n")
+    return path
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_check_applies_only_the_diff(schema, app_toml):
+    sources = [TomlSource(app_toml), EnvSource("APP_", {"APP_MINUTES": "2"})]
+    cfg = Config.load(schema, sources)
+    watcher = ConfigWatcher(cfg, sources)
+    assert not watcher.check(initial=True)  # already loaded
+    version = cfg.get_version()
+    cfg.timeout = 25  # set in code
+
+    app_toml.write_text("port = 8443\ntimeout = 25\n")
+    changes = watcher.check()
+    assert changes.fields == {"port": (443, 8443)}
+    assert (cfg.port, cfg.timeout, cfg.seconds) == (8443, 25, 120)
+    assert cfg.get_version() == version + 2
+    assert cfg.get_source("port") == f"{app_toml}:1"
+    assert watcher.check() is None  # nothing changed
+
+
+def test_check_keeps_the_last_good_version(schema, app_toml):
+    errors = []
+    reloads = []
+    cfg = Config.from_toml(schema, app_toml)
+    watcher = ConfigWatcher(
+        cfg, [TomlSource(app_toml)], on_error=errors.append, on_reload=reloads.append
+    )
+    watcher.check(initial=True)
+
+    app_toml.write_text("port = 1\ntimeout = 30\n")
+    assert watcher.check() is None
+    assert isinstance(watcher.last_error, ConfigRangeError)
+    assert str(watcher.last_error).startswith(f"{app_toml}:1: ")
+    assert errors == [watcher.last_error]
+    assert (cfg.port, cfg.timeout, cfg._trx_) == (443, 20, False)
+
+    app_toml.write_text("port = 81\n")  # timeout removed: back to the default
+    changes = watcher.check()
+    assert changes.fields == {"port": (443, 81), "timeout": (20, 10)}
+    assert reloads == [changes]
+    assert watcher.last_error is None
+    assert cfg.get_source("timeout") == "default"
+
+
+def test_check_keeps_values_set_in_code(schema, app_toml):
+    cfg = Config.from_toml(schema, app_toml)
+    watcher = ConfigWatcher(cfg, [TomlSource(app_toml)])
+    watcher.check(initial=True)
+    cfg.port = 444  # set in code
+
+    app_toml.write_text("port = 443\ntimeout = 30\n")
+    assert watcher.check().fields == {"timeout": (20, 30)}
+    assert (cfg.port, cfg.get_source("port")) == (444, "set")
+
+    app_toml.write_text("port = 8443\ntimeout = 30\n")
+    assert watcher.check().fields == {"port": (444, 8443)}
+
+
+def test_check_reads_an_invalid_file_again_only_when_it_changes(schema, app_toml):
+    errors = []
+    cfg = Config.from_toml(schema, app_toml)
+    watcher = ConfigWatcher(cfg, [TomlSource(app_toml)], on_error=errors.append)
+    watcher.check(initial=True)
+
+    app_toml.write_text("port = 1\n")
+    assert watcher.check() is None
+    assert watcher.check() is None
+    assert len(errors) == 1
+    assert isinstance(watcher.last_error, ConfigRangeError)
+
+
+def test_start_raises_for_invalid_sources(schema, app_toml):
+    cfg = Config.config_factory(schema)
+    app_toml.write_text("port = 1\n")
+    with pytest.raises(ConfigRangeError):
+        cfg.watch([TomlSource(app_toml)])
+
+
+class PortFile(Source):
+    """A source whose read() fails with an error that is not a ConfigError."""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = str(path)
+
+    def read(self, cfg):
+        text = self.path.read_text()
+        if not text.isdigit():
+            raise OSError(f"cannot parse {text!r}")
+        return {"port": int(text)}
+
+    def watched_paths(self):
+        return (str(self.path),)
+
+
+def test_watcher_survives_any_error(schema, tmp_path):
+    path = tmp_path / "port"
+    path.write_text("443")
+    errors = []
+    cfg = Config.config_factory(schema)
+    source = PortFile(path)
+    with cfg.watch([source], interval=0.02, on_error=errors.append) as watcher:
+        path.write_text("garbage")
+        assert wait_for(lambda: errors)
+        assert isinstance(watcher.last_error, OSError)
+        assert cfg.port == 443
+        path.write_text("4430")
+        assert wait_for(lambda: cfg.port == 4430)
+        assert watcher._thread.is_alive() and watcher.last_error is None
+
+
+def test_check_retries_a_failed_read_of_an_unchanged_file(schema, tmp_path):
+    path = tmp_path / "port"
+    path.write_text("443")
+    cfg = Config.config_factory(schema)
+    source = PortFile(path)
+    watcher = ConfigWatcher(cfg, [source])
+    reads = []
+    read = source.read
+
+    def flaky_read(cfg):  # e.g. a permission race: fails once, file unchanged
+        reads.append(None)
+        if len(reads) == 1:
+            raise PermissionError("busy")
+        return read(cfg)
+
+    source.read = flaky_read
+    assert watcher.check() is None
+    assert isinstance(watcher.last_error, PermissionError)
+    assert watcher.check().fields == {"port": (8080, 443)}
+    assert watcher.last_error is None
+    assert watcher.check() is None and len(reads) == 2
+
+
+def test_check_refuses_to_commit_an_open_transaction(schema, app_toml):
+    cfg = Config.from_toml(schema, app_toml)
+    watcher = ConfigWatcher(cfg, [TomlSource(app_toml)])
+    watcher.check(initial=True)
+    app_toml.write_text("port = 8443\n")
+    with cfg.transaction():
+        cfg.timeout = 30
+        assert watcher.check() is None
+        assert isinstance(watcher.last_error, ConfigError)
+    assert (cfg.port, cfg.timeout) == (443, 30)
+
+
+@pytest.mark.parametrize("backend", ["poll", "inotify"])
+def test_watcher_thread_reloads(schema, tmp_path, backend):
+    if backend == "inotify" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux only")
+    (tmp_path / "10-base.toml").write_text("port = 443\n")
+    source = DirectorySource(tmp_path)
+    cfg = Config.load(schema, [source])
+    interval = 0.02 if backend == "poll" else 30  # inotify must wake up the thread
+    with ConfigWatcher(cfg, [source], interval=interval, backend=backend) as watcher:
+        (tmp_path / "20-site.toml").write_text("minutes = 3\n")
+        assert wait_for(lambda: cfg.seconds == 180)
+        (tmp_path / "10-base.toml").write_text("port = 4430\n")
+        assert wait_for(lambda: cfg.port == 4430)
+        assert watcher.backend == backend
+        watcher._stop.set()
+        (tmp_path / "10-base.toml").write_text("port = 80\n")  # wakes up the thread
+    assert watcher._thread is None
+
+
+# === END ===